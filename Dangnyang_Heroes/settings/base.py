@@ -52,6 +52,8 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
+    "common",
     "histories",
     "applications",
     "users",
@@ -72,8 +74,14 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "common.middleware.QueryBudgetMiddleware",
 ]
 
+# 뷰별 쿼리 예산(query_budget) 검사 / N+1 감지 (common.middleware.QueryBudgetMiddleware)
+QUERY_BUDGET_ENABLED = os.getenv("QUERY_BUDGET_ENABLED", "False") == "True"
+QUERY_BUDGET_STRICT = False  # True 면 예산 초과 시 예외 발생 (테스트용)
+QUERY_BUDGET_REPEAT_THRESHOLD = 3  # 같은 형태의 쿼리 반복 허용 횟수
+
 ROOT_URLCONF = "Dangnyang_Heroes.urls"
 
 TEMPLATES = [
@@ -111,6 +119,13 @@ DATABASES = {
 }
 
 
+# Cache
+# 기본은 프로세스 로컬 메모리, 여러 워커가 검색 캐시를 공유하려면 CACHE_URL 로 Redis 지정
+# (예: CACHE_URL=rediscache://redis:6379/1)
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+SEARCH_CACHE_TIMEOUT = 300  # 검색 결과 캐시 유지 시간(초)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -195,6 +210,30 @@ AWS_S3_ENDPOINT_URL = "https://kr.object.ncloudstorage.com"
 AWS_S3_DEFAULT_ACL = "public-read"
 MEDIA_URL = f"https://{AWS_STORAGE_BUCKET_NAME}.kr.object.ncloudstorage.com/"
 
+# Object Storage 클라이언트 연결 풀 / 재시도 / 타임아웃 (common.storage)
+AWS_S3_MAX_POOL_CONNECTIONS = int(os.getenv("AWS_S3_MAX_POOL_CONNECTIONS", "20"))
+AWS_S3_MAX_ATTEMPTS = int(os.getenv("AWS_S3_MAX_ATTEMPTS", "3"))  # 최초 요청 포함
+AWS_S3_CONNECT_TIMEOUT = 5  # 초
+AWS_S3_READ_TIMEOUT = 30  # 초
+
+# 멀티파트 업로드 조각 크기 / 동시 전송 조각 수 (S3 최소 조각 크기 5MB)
+STORAGE_MULTIPART_PART_SIZE = int(
+    os.getenv("STORAGE_MULTIPART_PART_SIZE", str(5 * 1024 * 1024))
+)
+STORAGE_MULTIPART_CONCURRENCY = int(os.getenv("STORAGE_MULTIPART_CONCURRENCY", "4"))
+
+# 고아 객체 정리 시 최근 업로드 보호 시간 (업로드 후 DB 반영 전 / 직접 업로드 확인 전 파일)
+STORAGE_GC_GRACE_HOURS = float(os.getenv("STORAGE_GC_GRACE_HOURS", "24"))
+
+# 파일 저장소 백엔드 (common.storage)
+# S3Backend: NCP Object Storage / LocalBackend: 로컬 디스크 / InMemoryBackend: 메모리 (테스트용)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "common.storage.S3Backend")
+STORAGE_LOCAL_ROOT = os.getenv("STORAGE_LOCAL_ROOT", str(BASE_DIR / "media"))
+STORAGE_LOCAL_URL = os.getenv("STORAGE_LOCAL_URL", "/media/")
+
+# 이미지 변환본(썸네일/중간 크기 WebP) 생성 프로세스 수 (0 이면 요청 안에서 바로 생성)
+IMAGE_VARIANT_WORKERS = int(os.getenv("IMAGE_VARIANT_WORKERS", "2"))
+
 # NCP Object Storage 설정
 
 STORAGES = {
@@ -2,6 +2,9 @@ from .base import *
 
 DEBUG = True
 
+# 개발 환경에서는 쿼리 예산 검사 활성화
+QUERY_BUDGET_ENABLED = True
+
 
 # drf_spectacular 추가
 INSTALLED_APPS += [
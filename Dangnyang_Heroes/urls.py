@@ -15,6 +15,8 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 from drf_spectacular.views import (
@@ -48,4 +50,11 @@ urlpatterns = [
         "api/recruitments/",
         include("recruitments.urls"),
     ),
+    path("api/uploads/", include("common.urls")),
 ]
+
+# 로컬 디스크 저장소 사용 시 업로드 파일 제공 (DEBUG 에서만 동작)
+if settings.STORAGE_BACKEND == "common.storage.LocalBackend":
+    urlpatterns += static(
+        settings.STORAGE_LOCAL_URL, document_root=settings.STORAGE_LOCAL_ROOT
+    )
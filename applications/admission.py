@@ -0,0 +1,112 @@
+from django.db import IntegrityError, connection, transaction
+from rest_framework import status
+
+from recruitments.models import Recruitment, RecruitmentStatus
+from recruitments.signals import schedule_card_refresh
+
+from .models import Application
+from .slots import get_slot_deltas, update_slot_counters
+
+# 🧀 봉사활동 날짜 + 시작/종료 시간 → 신청 시간 범위 (종료가 시작보다 이르면 다음 날 종료)
+TIME_RANGE_SQL = (
+    "tstzrange("
+    "recruitment.date + recruitment.start_time, "
+    "recruitment.date + recruitment.end_time"
+    " + CASE WHEN recruitment.end_time < recruitment.start_time"
+    " THEN interval '1 day' ELSE interval '0' END, "
+    "'[)')"
+)
+
+# 🧀 제약 조건 이름 → (응답 메시지, 상태 코드)
+CONSTRAINT_ERRORS = {
+    "applications_user_recruit_uniq": (
+        "이미 신청한 봉사활동 입니다.",
+        status.HTTP_409_CONFLICT,
+    ),
+    "applications_no_overlap": (
+        "중복된 시간에 신청한 봉사활동이 있습니다.",
+        status.HTTP_409_CONFLICT,
+    ),
+}
+
+
+class AdmissionError(Exception):
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+def get_constraint_name(error):
+    diag = getattr(error.__cause__, "diag", None)
+    return getattr(diag, "constraint_name", None)
+
+
+# 🧀 봉사 신청 (INSERT ... SELECT 한 번 + 인원 카운터 증가)
+# 봉사활동 조회 / 중복 신청 / 시간 중복 검사를 DB 제약 조건이 한 번에 처리
+# → 동시에 두 번 눌러도 하나만 저장
+# 모집 중이면 승인 대기, 정원이 차서 마감됐으면 대기자로 신청
+# 0행이면 마감(409) / 없음(404) 확인 후 AdmissionError
+def admit_application(user, recruitment_id):
+    try:
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    INSERT INTO {Application._meta.db_table}
+                        (created_at, updated_at, user_id, recruitment_id, shelter_id,
+                         status, time_range)
+                    SELECT now(), now(), %s, recruitment.id, recruitment.shelter_id,
+                           CASE WHEN recruitment.status = %s
+                                THEN 'pending' ELSE 'waitlisted' END,
+                           {TIME_RANGE_SQL}
+                    FROM {Recruitment._meta.db_table} AS recruitment
+                    WHERE recruitment.id = %s
+                      AND (recruitment.status = %s
+                           OR recruitment.approved_count >= recruitment.capacity)
+                    RETURNING id, status
+                    """,
+                    [
+                        user.id,
+                        RecruitmentStatus.OPEN,
+                        recruitment_id,
+                        RecruitmentStatus.OPEN,
+                    ],
+                )
+                row = cursor.fetchone()
+            if row is not None:
+                update_slot_counters(recruitment_id, get_slot_deltas(None, row[1]))
+    except IntegrityError as e:
+        constraint = get_constraint_name(e)
+        if constraint not in CONSTRAINT_ERRORS:
+            raise
+        raise AdmissionError(*CONSTRAINT_ERRORS[constraint])
+
+    if row is None:
+        if Recruitment.objects.filter(pk=recruitment_id).exists():
+            raise AdmissionError(
+                "모집이 마감된 봉사활동입니다.", status.HTTP_409_CONFLICT
+            )
+        raise AdmissionError(
+            "해당 봉사활동을 찾을 수 없습니다.", status.HTTP_404_NOT_FOUND
+        )
+    # raw INSERT 는 post_save 시그널이 없으므로 카드(신청자 수) 갱신을 직접 예약
+    schedule_card_refresh([recruitment_id])
+    return row[0]
+
+
+# 🧀 봉사활동 날짜/시간 변경 → 기존 신청의 시간 범위 갱신 (recruitment_ids=None 이면 전체)
+def sync_application_time_ranges(recruitment_ids=None):
+    sql = f"""
+        UPDATE {Application._meta.db_table} AS application
+        SET time_range = {TIME_RANGE_SQL}
+        FROM {Recruitment._meta.db_table} AS recruitment
+        WHERE application.recruitment_id = recruitment.id
+    """
+    params = []
+    if recruitment_ids is not None:
+        sql += " AND recruitment.id = ANY(%s)"
+        params.append(list(recruitment_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
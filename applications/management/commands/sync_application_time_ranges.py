@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from applications.admission import sync_application_time_ranges
+
+
+class Command(BaseCommand):
+    help = "봉사 신청의 시간 범위(time_range)를 봉사활동 날짜/시간으로 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        total = sync_application_time_ranges()
+        self.stdout.write(self.style.SUCCESS(f"신청 시간 범위 갱신 완료: {total}건"))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from applications.slots import sync_slot_counters
+
+
+class Command(BaseCommand):
+    help = "봉사활동 인원 카운터(approved_count / pending_count)를 신청 기준으로 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        total = sync_slot_counters()
+        self.stdout.write(
+            self.style.SUCCESS(f"봉사활동 인원 카운터 갱신 완료: {total}건")
+        )
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("applications", "0001_initial"),
+        ("recruitments", "0002_search_indexes"),
+        ("shelters", "0002_search_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["user", "created_at", "id"], name="applications_user_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["recruitment", "created_at", "id"],
+                name="applications_recruit_idx",
+            ),
+        ),
+    ]
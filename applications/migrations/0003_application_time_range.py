@@ -0,0 +1,116 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+from django.conf import settings
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+
+# 기존 신청의 시간 범위 채우기 (applications.admission.TIME_RANGE_SQL 과 같은 계산)
+FILL_TIME_RANGES_SQL = """
+    UPDATE applications_application AS application
+    SET time_range = tstzrange(
+        recruitment.date + recruitment.start_time,
+        recruitment.date + recruitment.end_time
+        + CASE WHEN recruitment.end_time < recruitment.start_time
+          THEN interval '1 day' ELSE interval '0' END,
+        '[)'
+    )
+    FROM recruitments AS recruitment
+    WHERE application.recruitment_id = recruitment.id
+"""
+
+# 같은 봉사활동에 중복 신청한 경우 1건만 남기기
+# (참석/불참 → 승인 → 대기 → 거절 순, 같으면 먼저 신청한 것 / 삭제되는 신청의 이력은 남기는 신청으로 이동)
+DEDUPE_APPLICATIONS_SQL = """
+    CREATE TEMPORARY TABLE duplicate_applications ON COMMIT DROP AS
+    SELECT id, keep_id
+    FROM (
+        SELECT id,
+               first_value(id) OVER (
+                   PARTITION BY user_id, recruitment_id
+                   ORDER BY CASE status
+                                WHEN 'attended' THEN 0
+                                WHEN 'absence' THEN 0
+                                WHEN 'approved' THEN 1
+                                WHEN 'pending' THEN 2
+                                ELSE 3
+                            END,
+                            id
+               ) AS keep_id
+        FROM applications_application
+    ) AS ranked
+    WHERE id <> keep_id;
+
+    UPDATE histories_history AS history
+    SET application_id = duplicate.keep_id
+    FROM duplicate_applications AS duplicate
+    WHERE history.application_id = duplicate.id;
+
+    DELETE FROM applications_application AS application
+    USING duplicate_applications AS duplicate
+    WHERE application.id = duplicate.id;
+
+    -- 지연된 외래 키 검사를 바로 실행 (검사가 남아 있으면 이후 ALTER TABLE 이 실패)
+    SET CONSTRAINTS ALL IMMEDIATE;
+"""
+
+# 시간이 겹치는 대기/승인 신청은 우선순위가 더 높은 신청(승인 → 대기, 먼저 신청한 것)만 남기고 거절 처리
+# 겹치는 신청이 연쇄된 경우 더 높은 신청과 겹치기만 해도 거절되므로 남은 신청끼리는 겹치지 않음
+REJECT_OVERLAPPING_APPLICATIONS_SQL = """
+    UPDATE applications_application AS application
+    SET status = 'rejected',
+        rejected_reason = '같은 시간대의 다른 봉사활동 신청과 겹쳐 자동으로 거절되었습니다.'
+    WHERE application.status IN ('pending', 'approved')
+      AND EXISTS (
+          SELECT 1
+          FROM applications_application AS other
+          WHERE other.user_id = application.user_id
+            AND other.id <> application.id
+            AND other.status IN ('pending', 'approved')
+            AND other.time_range && application.time_range
+            AND (other.status = 'approved', -other.id)
+                > (application.status = 'approved', -application.id)
+      )
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("applications", "0002_search_indexes"),
+        ("histories", "0002_search_indexes"),
+        ("recruitments", "0007_file_reference_indexes"),
+        ("shelters", "0005_file_reference_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # 시간 중복 제약에서 사용자 = 조건을 GiST 인덱스로 함께 검사
+        BtreeGistExtension(),
+        migrations.AddField(
+            model_name="application",
+            name="time_range",
+            field=django.contrib.postgres.fields.ranges.DateTimeRangeField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        migrations.RunSQL(FILL_TIME_RANGES_SQL, migrations.RunSQL.noop),
+        # 제약 추가 전에 기존 위반 데이터 정리
+        migrations.RunSQL(DEDUPE_APPLICATIONS_SQL, migrations.RunSQL.noop),
+        migrations.RunSQL(REJECT_OVERLAPPING_APPLICATIONS_SQL, migrations.RunSQL.noop),
+        migrations.AddConstraint(
+            model_name="application",
+            constraint=models.UniqueConstraint(
+                fields=("user", "recruitment"), name="applications_user_recruit_uniq"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="application",
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(
+                condition=models.Q(("status__in", ["pending", "approved"])),
+                expressions=[("user", "="), ("time_range", "&&")],
+                name="applications_no_overlap",
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+import django.contrib.postgres.constraints
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("applications", "0003_application_time_range"),
+        ("recruitments", "0008_recruitment_capacity"),
+        ("shelters", "0005_file_reference_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="application",
+            name="applications_no_overlap",
+        ),
+        migrations.AlterField(
+            model_name="application",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "승인 대기"),
+                    ("waitlisted", "대기자"),
+                    ("approved", "승인 완료"),
+                    ("rejected", "승인 거절"),
+                    ("attended", "참석"),
+                    ("absence", "불참"),
+                ],
+                default="pending",
+                max_length=20,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                condition=models.Q(("status", "waitlisted")),
+                fields=["recruitment", "created_at", "id"],
+                name="applications_waitlist_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="application",
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(
+                condition=models.Q(
+                    ("status__in", ["pending", "approved", "waitlisted"])
+                ),
+                expressions=[("user", "="), ("time_range", "&&")],
+                name="applications_no_overlap",
+            ),
+        ),
+    ]
@@ -1,3 +1,5 @@
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import DateTimeRangeField, RangeOperators
 from django.db import models
 
 from common.models import BaseModel
@@ -5,10 +7,17 @@ from recruitments.models import Recruitment
 from shelters.models import Shelter
 from users.models import User
 
+# 시간 중복 검사 대상 상태 (거절/참석/불참 신청은 다른 신청을 막지 않음)
+# 대기자도 자리가 나면 바로 승인되므로 포함
+ACTIVE_STATUSES = ["pending", "approved", "waitlisted"]
+# 봉사자가 직접 취소할 수 있는 상태 (봉사 전날까지)
+CANCELLABLE_STATUSES = ["pending", "approved", "waitlisted"]
+
 
 class Application(BaseModel):
     STATUS_CHOICES = [
         ("pending", "승인 대기"),
+        ("waitlisted", "대기자"),  # 정원이 찬 뒤 신청 → 자리가 나면 신청 순서대로 승인
         ("approved", "승인 완료"),
         ("rejected", "승인 거절"),
         ("attended", "참석"),
@@ -26,6 +35,42 @@ class Application(BaseModel):
     )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
     rejected_reason = models.TextField(null=True, blank=True)
+    # 봉사활동 날짜 + 시작/종료 시간 (시간 중복 제약용, applications.admission 에서 기록)
+    time_range = DateTimeRangeField(null=True, blank=True, editable=False)
 
     def __str__(self):
         return f"{self.user.name} - {self.recruitment.date} ({self.status})"
+
+    class Meta:
+        indexes = [
+            # 내 신청 목록 / 봉사활동별 신청자 목록 키셋 페이지네이션
+            models.Index(
+                fields=["user", "created_at", "id"],
+                name="applications_user_idx",
+            ),
+            models.Index(
+                fields=["recruitment", "created_at", "id"],
+                name="applications_recruit_idx",
+            ),
+            # 대기자 승격 순서 (applications.slots.promote_waitlisted)
+            models.Index(
+                fields=["recruitment", "created_at", "id"],
+                name="applications_waitlist_idx",
+                condition=models.Q(status="waitlisted"),
+            ),
+        ]
+        constraints = [
+            # 같은 봉사활동 중복 신청 방지
+            models.UniqueConstraint(
+                fields=["user", "recruitment"], name="applications_user_recruit_uniq"
+            ),
+            # 같은 사용자의 진행 중인 신청끼리 시간이 겹치지 않도록 (btree_gist 필요)
+            ExclusionConstraint(
+                name="applications_no_overlap",
+                expressions=[
+                    ("user", RangeOperators.EQUAL),
+                    ("time_range", RangeOperators.OVERLAPS),
+                ],
+                condition=models.Q(status__in=ACTIVE_STATUSES),
+            ),
+        ]
@@ -28,17 +28,34 @@ class ApplicationSerializer(serializers.ModelSerializer):
         fields = ["id", "user", "recruitment", "shelter", "status", "rejected_reason"]
 
 
-class ApplicationCreateSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = Application
-        fields = ["recruitment", "shelter"]
-
-    def create(self, validated_data):
-        request = self.context["request"]
-        user = request.user
-        application = Application.objects.create(user=user, **validated_data)
-        return application
+# 봉사활동 존재 여부 / 보호소는 신청 INSERT 에서 함께 확인 (applications.admission)
+class ApplicationCreateSerializer(serializers.Serializer):
+    recruitment = serializers.IntegerField()
+    # 이전 클라이언트 호환용 (보호소는 봉사활동에서 결정)
+    shelter = serializers.IntegerField(required=False)
 
 
 class ApplicationRejectSerializer(serializers.Serializer):
     rejected_reason = serializers.CharField(max_length=255, required=True)
+
+
+# 신청 상태 일괄 변경 (보호소 관리자)
+class ApplicationBulkTransitionSerializer(serializers.Serializer):
+    STATUS_CHOICES = ["approved", "rejected", "attended", "absence"]
+
+    application_ids = serializers.ListField(
+        child=serializers.IntegerField(), min_length=1, max_length=500
+    )
+    status = serializers.ChoiceField(choices=STATUS_CHOICES)
+    rejected_reason = serializers.CharField(
+        max_length=255, required=False, allow_blank=True
+    )
+
+    def validate(self, data):
+        reason = data.get("rejected_reason", "").strip()
+        if data["status"] == "rejected" and not reason:
+            raise serializers.ValidationError(
+                {"rejected_reason": "거절 사유를 입력해주세요."}
+            )
+        data["rejected_reason"] = reason if data["status"] == "rejected" else None
+        return data
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from recruitments.models import Recruitment
+
+from .admission import sync_application_time_ranges
+
+TIME_FIELDS = {"date", "start_time", "end_time"}
+
+
+# 🧀 봉사활동 날짜/시간 변경 → 신청 시간 범위 갱신 (새 봉사활동은 신청이 없으므로 건너뜀)
+@receiver(post_save, sender=Recruitment)
+def sync_time_ranges_on_recruitment_save(
+    sender, instance, created=False, update_fields=None, **kwargs
+):
+    if created or (update_fields and not TIME_FIELDS & set(update_fields)):
+        return
+    sync_application_time_ranges([instance.pk])
@@ -0,0 +1,171 @@
+from django.db import connection
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from recruitments.models import Recruitment, RecruitmentStatus
+
+from .models import Application
+
+# 🧀 신청 상태 → 봉사활동 인원 카운터 (참석/불참도 승인된 자리를 차지, 거절/대기자는 제외)
+SLOT_COUNTERS = {
+    "pending": "pending_count",
+    "approved": "approved_count",
+    "attended": "approved_count",
+    "absence": "approved_count",
+}
+
+
+# 🧀 상태 변경 → {카운터: 증감} (같은 카운터 안에서의 변경은 빈 dict)
+def get_slot_deltas(old_status, new_status, count=1):
+    old_counter = SLOT_COUNTERS.get(old_status)
+    new_counter = SLOT_COUNTERS.get(new_status)
+    deltas = {}
+    if old_counter != new_counter:
+        if old_counter:
+            deltas[old_counter] = -count
+        if new_counter:
+            deltas[new_counter] = count
+    return deltas
+
+
+# 🧀 봉사활동 인원 카운터 갱신 (F() 식 UPDATE 한 번, 행을 읽지 않음)
+# 승인 인원이 늘어나면 정원 조건을 WHERE 에 포함 → 자리가 없으면 0행 (False)
+# 정원이 차면 같은 UPDATE 에서 모집 상태를 마감(closed)으로 변경,
+# 정원이 차서 마감된 봉사활동에 자리가 나면 다시 모집 중(open)으로 변경
+def update_slot_counters(recruitment_id, deltas):
+    if not deltas:
+        return True
+
+    queryset = Recruitment.objects.filter(pk=recruitment_id)
+    values = {counter: F(counter) + delta for counter, delta in deltas.items()}
+    approved = deltas.get("approved_count", 0)
+    if approved > 0:
+        queryset = queryset.filter(
+            Q(capacity__isnull=True) | Q(capacity__gte=F("approved_count") + approved)
+        )
+        values["status"] = Case(
+            When(
+                capacity__lte=F("approved_count") + approved,
+                then=Value(RecruitmentStatus.CLOSED),
+            ),
+            default=F("status"),
+        )
+    elif approved < 0:
+        values["status"] = Case(
+            When(
+                status=RecruitmentStatus.CLOSED,
+                capacity__lte=F("approved_count"),
+                then=Value(RecruitmentStatus.OPEN),
+            ),
+            default=F("status"),
+        )
+    return queryset.update(**values, updated_at=timezone.now()) > 0
+
+
+# 🧀 대기자 승격 (신청 순서대로 최대 limit 명 → 승인)
+# FOR UPDATE SKIP LOCKED: 다른 취소 요청이 이미 잡은 대기자는 건너뛰고 다음 대기자를 선택
+# → 동시에 여러 자리가 나도 서로 기다리지 않고, 같은 대기자를 두 번 승격하지 않음
+# limit=None 이면 전체 (LIMIT NULL = 제한 없음)
+def promote_waitlisted(recruitment_id, limit):
+    if limit is not None and limit <= 0:
+        return []
+    table = Application._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH candidate AS (
+                SELECT id FROM {table}
+                WHERE recruitment_id = %s AND status = 'waitlisted'
+                ORDER BY created_at, id
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE {table} AS application
+            SET status = 'approved', updated_at = now()
+            FROM candidate
+            WHERE application.id = candidate.id
+            RETURNING application.id, application.user_id,
+                      application.shelter_id, application.recruitment_id
+            """,
+            [recruitment_id, limit],
+        )
+        return cursor.fetchall()
+
+
+# 🧀 인원 카운터 반영 + 승인 자리가 비면 그만큼 대기자 승격 → (성공 여부, 승격된 신청 행)
+# 승격 인원을 증감에 합쳐 봉사활동 행은 마지막에 한 번만 UPDATE (행 잠금 시간 최소화)
+def apply_slot_deltas(recruitment_id, deltas):
+    freed = -deltas.get("approved_count", 0)
+    promoted = promote_waitlisted(recruitment_id, freed)
+    if promoted:
+        deltas = {**deltas, "approved_count": len(promoted) - freed}
+        deltas = {counter: delta for counter, delta in deltas.items() if delta}
+    return update_slot_counters(recruitment_id, deltas), promoted
+
+
+# 🧀 정원 변경 → (성공 여부, 승격된 신청 행)
+# 승인 인원보다 작은 정원은 UPDATE 의 WHERE 에서 거름 → 동시에 승인이 반영돼도 정원 아래로 줄지 않음
+# 정원이 차면 마감, 정원이 차서 마감됐던 봉사활동에 자리가 생기면 모집 재개 + 빈 자리만큼 대기자 승격
+# (UPDATE 로 봉사활동 행을 잠근 뒤 승인 인원을 읽으므로 승격 인원이 다른 승인과 겹치지 않음)
+def update_capacity(recruitment_id, capacity):
+    queryset = Recruitment.objects.filter(pk=recruitment_id)
+    conditions = [
+        When(
+            status=RecruitmentStatus.CLOSED,
+            capacity__lte=F("approved_count"),  # 변경 전 정원 기준
+            then=Value(RecruitmentStatus.OPEN),
+        )
+    ]
+    if capacity is not None:
+        queryset = queryset.filter(approved_count__lte=capacity)
+        conditions.insert(
+            0,
+            When(approved_count__gte=capacity, then=Value(RecruitmentStatus.CLOSED)),
+        )
+    updated = queryset.update(
+        capacity=capacity,
+        status=Case(*conditions, default=F("status")),
+        updated_at=timezone.now(),
+    )
+    if not updated:
+        return False, []
+
+    approved_count = (
+        Recruitment.objects.filter(pk=recruitment_id)
+        .values_list("approved_count", flat=True)
+        .get()
+    )
+    limit = None if capacity is None else capacity - approved_count
+    promoted = promote_waitlisted(recruitment_id, limit)
+    if promoted:
+        update_slot_counters(recruitment_id, {"approved_count": len(promoted)})
+    return True, promoted
+
+
+def count_applications(statuses):
+    return Coalesce(
+        Subquery(
+            Application.objects.filter(recruitment=OuterRef("pk"), status__in=statuses)
+            .order_by()
+            .values("recruitment")
+            .annotate(count=Count("id"))
+            .values("count")
+        ),
+        0,
+    )
+
+
+# 🧀 신청 기준으로 인원 카운터 다시 계산 (recruitment_ids=None 이면 전체)
+def sync_slot_counters(recruitment_ids=None):
+    queryset = Recruitment.objects.all()
+    if recruitment_ids is not None:
+        queryset = queryset.filter(pk__in=recruitment_ids)
+    return queryset.update(
+        **{
+            counter: count_applications(
+                [status for status, name in SLOT_COUNTERS.items() if name == counter]
+            )
+            for counter in set(SLOT_COUNTERS.values())
+        }
+    )
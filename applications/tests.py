@@ -1,3 +1,473 @@
-from django.test import TestCase
+import threading
+from datetime import date, time, timedelta
 
-# Create your tests here.
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from common.querycount import assert_query_budget
+from recruitments.models import Recruitment, RecruitmentStatus
+from recruitments.serializers import RecruitmentSerializer
+from shelters.models import Shelter
+from users.models import User
+
+from .models import Application
+from .views import ApplicationBulkTransitionView
+
+
+class ApplicationTestMixin:
+    @classmethod
+    def setUpTestData(cls):
+        cls.shelter_user = User.objects.create_user(
+            email="shelter@example.com", name="보호소", is_shelter=True
+        )
+        cls.shelter = Shelter.objects.create(
+            user=cls.shelter_user, name="댕냥 보호소", region="서울"
+        )
+        cls.user = User.objects.create_user(email="user@example.com", name="봉사자")
+
+    def setUp(self):
+        self.client = self.client_for(self.user)
+        self.shelter_client = self.client_for(self.shelter_user)
+
+    def client_for(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    def create_recruitment(self, days=7, start=time(10), end=time(12), **kwargs):
+        return Recruitment.objects.create(
+            shelter=kwargs.pop("shelter", self.shelter),
+            date=date.today() + timedelta(days=days),
+            start_time=start,
+            end_time=end,
+            type=["walking"],
+            **kwargs,
+        )
+
+    def apply(self, recruitment_id, user=None):
+        client = self.client_for(user) if user else self.client
+        return client.post(
+            "/api/applications/", {"recruitment": recruitment_id}, format="json"
+        )
+
+
+class ApplicationAdmissionTest(ApplicationTestMixin, TestCase):
+    def test_apply(self):
+        recruitment = self.create_recruitment()
+        response = self.apply(recruitment.id)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["status"], "pending")
+        recruitment.refresh_from_db()
+        self.assertEqual(recruitment.pending_count, 1)
+
+    def test_duplicate_application(self):
+        recruitment = self.create_recruitment()
+        self.assertEqual(self.apply(recruitment.id).status_code, 201)
+
+        response = self.apply(recruitment.id)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["error"], "이미 신청한 봉사활동 입니다.")
+        self.assertEqual(Application.objects.count(), 1)
+
+    def test_overlapping_application(self):
+        self.apply(self.create_recruitment(start=time(10), end=time(12)).id)
+        other = self.create_recruitment(start=time(11), end=time(13))
+
+        response = self.apply(other.id)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(
+            response.data["error"], "중복된 시간에 신청한 봉사활동이 있습니다."
+        )
+
+    def test_overnight_application_overlaps_next_day(self):
+        # 22시 ~ 다음 날 2시 봉사는 다음 날 새벽 봉사와 겹침
+        self.apply(self.create_recruitment(days=7, start=time(22), end=time(2)).id)
+        other = self.create_recruitment(days=8, start=time(1), end=time(3))
+        self.assertEqual(self.apply(other.id).status_code, 409)
+
+    def test_adjacent_and_inactive_applications_do_not_overlap(self):
+        first = self.create_recruitment(start=time(10), end=time(12))
+        self.apply(first.id)
+        # 끝나는 시각에 시작하는 봉사는 겹치지 않음 ('[)' 범위)
+        adjacent = self.create_recruitment(start=time(12), end=time(14))
+        self.assertEqual(self.apply(adjacent.id).status_code, 201)
+
+        # 거절된 신청은 다른 신청을 막지 않음
+        Application.objects.filter(recruitment=first).update(status="rejected")
+        overlapping = self.create_recruitment(start=time(9), end=time(11))
+        self.assertEqual(self.apply(overlapping.id).status_code, 201)
+
+    def test_missing_recruitment(self):
+        response = self.apply(0)
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data["error"], "해당 봉사활동을 찾을 수 없습니다.")
+
+    def test_closed_recruitment(self):
+        recruitment = self.create_recruitment(status=RecruitmentStatus.CLOSED)
+        response = self.apply(recruitment.id)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["error"], "모집이 마감된 봉사활동입니다.")
+        self.assertFalse(Application.objects.exists())
+
+    def test_full_recruitment_waitlists(self):
+        recruitment = self.create_recruitment(
+            capacity=1, status=RecruitmentStatus.CLOSED
+        )
+        Recruitment.objects.filter(pk=recruitment.pk).update(approved_count=1)
+
+        response = self.apply(recruitment.id)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["status"], "waitlisted")
+
+
+class ApplicationTransitionTest(ApplicationTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.recruitment = self.create_recruitment(capacity=1)
+        self.application_id = self.apply(self.recruitment.id).data["id"]
+
+    def transition(self, new_status, application_id=None, **data):
+        return self.shelter_client.post(
+            f"/api/applications/{application_id or self.application_id}/{new_status}/",
+            data,
+            format="json",
+        )
+
+    def assert_counts(self, pending_count, approved_count):
+        self.recruitment.refresh_from_db()
+        self.assertEqual(
+            (self.recruitment.pending_count, self.recruitment.approved_count),
+            (pending_count, approved_count),
+        )
+
+    def test_counters_follow_the_previous_status(self):
+        self.assertEqual(self.transition("approved").status_code, 200)
+        self.assert_counts(0, 1)
+        self.assertEqual(self.transition("attended").status_code, 200)
+        self.assertEqual(self.transition("absence").status_code, 200)
+        self.assert_counts(0, 1)
+
+    def test_rejecting_approved_promotes_waitlisted(self):
+        self.transition("approved")
+        other = User.objects.create_user(email="other@example.com", name="대기자")
+        waitlisted = self.apply(self.recruitment.id, other).data["id"]
+
+        response = self.transition("rejected", rejected_reason="일정 변경")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Application.objects.get(pk=waitlisted).status, "approved")
+        self.assert_counts(0, 1)
+
+    def test_disallowed_transition(self):
+        response = self.transition("attended")
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(
+            response.data["error"],
+            "현재 상태(pending)에서는 attended 로 변경할 수 없습니다.",
+        )
+        self.assert_counts(1, 0)
+
+    def test_other_shelter_manager(self):
+        other = User.objects.create_user(
+            email="other@example.com", name="다른 보호소", is_shelter=True
+        )
+        Shelter.objects.create(user=other, name="다른 보호소")
+        response = self.client_for(other).post(
+            f"/api/applications/{self.application_id}/approved/"
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(
+            Application.objects.get(pk=self.application_id).status, "pending"
+        )
+
+
+class ApplicationBulkTransitionTest(ApplicationTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.recruitment = self.create_recruitment(capacity=3)
+        self.applicants = [
+            User.objects.create_user(email=f"applicant{i}@example.com", name="봉사자")
+            for i in range(3)
+        ]
+        self.applications = [
+            Application.objects.get(pk=self.apply(self.recruitment.id, user).data["id"])
+            for user in self.applicants
+        ]
+
+    def bulk(self, application_ids, new_status="approved", **data):
+        return self.shelter_client.post(
+            "/api/applications/bulk-status/",
+            {"application_ids": application_ids, "status": new_status, **data},
+            format="json",
+        )
+
+    def test_partial_success(self):
+        first, second, third = (application.id for application in self.applications)
+        self.bulk([third], "rejected", rejected_reason="마감")
+
+        with assert_query_budget(ApplicationBulkTransitionView, "post"):
+            response = self.bulk([first, 0, second, third])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["updated"], [first, second])
+        self.assertEqual(
+            response.data["failed"],
+            [
+                {"id": 0, "error": "해당 신청을 찾을 수 없습니다."},
+                {
+                    "id": third,
+                    "error": "현재 상태(rejected)에서는 approved 로 변경할 수 없습니다.",
+                },
+            ],
+        )
+        self.recruitment.refresh_from_db()
+        self.assertEqual(self.recruitment.approved_count, 2)
+        self.assertEqual(self.recruitment.pending_count, 0)
+
+    def test_mixed_source_statuses_adjust_each_counter(self):
+        first, second, third = (application.id for application in self.applications)
+        self.bulk([first])
+
+        response = self.bulk([first, second], "rejected", rejected_reason="마감")
+        self.assertEqual(response.data["updated"], [first, second])
+        self.recruitment.refresh_from_db()
+        self.assertEqual(self.recruitment.approved_count, 0)
+        self.assertEqual(self.recruitment.pending_count, 1)
+
+    def test_other_shelter_applications_are_not_found(self):
+        other_user = User.objects.create_user(
+            email="other@example.com", name="다른 보호소", is_shelter=True
+        )
+        other = self.create_recruitment(
+            shelter=Shelter.objects.create(user=other_user, name="다른 보호소"),
+            days=10,
+        )
+        foreign = self.apply(other.id).data["id"]
+        own = self.applications[0].id
+
+        response = self.bulk([own, foreign])
+        self.assertEqual(response.data["updated"], [own])
+        self.assertEqual(
+            response.data["failed"],
+            [{"id": foreign, "error": "해당 신청을 찾을 수 없습니다."}],
+        )
+        self.assertEqual(Application.objects.get(pk=foreign).status, "pending")
+
+    def test_capacity_overflow_rolls_back(self):
+        Recruitment.objects.filter(pk=self.recruitment.pk).update(capacity=2)
+        response = self.bulk([application.id for application in self.applications])
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(Application.objects.filter(status="approved").exists())
+
+    def test_id_limit(self):
+        response = self.bulk(list(range(1, 502)))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.bulk(list(range(1, 501))).status_code, 200)
+
+
+class RecruitmentCapacityTest(ApplicationTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.recruitment = self.create_recruitment(capacity=1)
+        self.volunteers = [
+            User.objects.create_user(email=f"volunteer{i}@example.com", name="봉사자")
+            for i in range(3)
+        ]
+        first = self.apply(self.recruitment.id, self.volunteers[0]).data["id"]
+        self.shelter_client.post(f"/api/applications/{first}/approved/")
+        # 정원이 차서 마감 → 이후 신청은 대기자
+        self.waitlisted = [
+            self.apply(self.recruitment.id, user).data["id"]
+            for user in self.volunteers[1:]
+        ]
+
+    def set_capacity(self, capacity):
+        return self.shelter_client.patch(
+            f"/api/recruitments/update/{self.recruitment.id}/",
+            {"capacity": capacity},
+            format="json",
+        )
+
+    def assert_recruitment(self, capacity, approved_count, recruitment_status):
+        self.recruitment.refresh_from_db()
+        self.assertEqual(
+            (
+                self.recruitment.capacity,
+                self.recruitment.approved_count,
+                self.recruitment.status,
+            ),
+            (capacity, approved_count, recruitment_status),
+        )
+
+    def test_waitlisted_while_full(self):
+        self.assert_recruitment(1, 1, RecruitmentStatus.CLOSED)
+        self.assertEqual(
+            set(
+                Application.objects.filter(pk__in=self.waitlisted).values_list(
+                    "status", flat=True
+                )
+            ),
+            {"waitlisted"},
+        )
+
+    def test_capacity_below_approved_count(self):
+        self.set_capacity(None)
+        self.assertEqual(self.set_capacity(2).status_code, 400)
+        self.assert_recruitment(None, 3, RecruitmentStatus.OPEN)
+
+    def test_zero_capacity_is_rejected(self):
+        self.assertEqual(self.set_capacity(0).status_code, 400)
+        self.assert_recruitment(1, 1, RecruitmentStatus.CLOSED)
+
+        response = self.shelter_client.post(
+            "/api/recruitments/create/",
+            {
+                "date": (date.today() + timedelta(days=3)).isoformat(),
+                "start_time": "10:00",
+                "end_time": "12:00",
+                "type": '["walking"]',
+                "capacity": 0,
+            },
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("capacity", response.data["message"])
+
+    def test_capacity_guard_uses_current_approved_count(self):
+        # 읽어 둔 승인 인원(1)이 아니라 UPDATE 시점의 승인 인원(2)과 비교
+        serializer = RecruitmentSerializer(
+            self.recruitment, data={"capacity": 1, "supplies": "목장갑"}, partial=True
+        )
+        self.assertTrue(serializer.is_valid())
+        Recruitment.objects.filter(pk=self.recruitment.pk).update(approved_count=2)
+        with self.assertRaises(ValidationError), transaction.atomic():
+            serializer.save()
+        self.recruitment.refresh_from_db()
+        self.assertIsNone(self.recruitment.supplies)
+
+    def test_capacity_increase_promotes_waitlist_in_order(self):
+        self.assertEqual(self.set_capacity(2).status_code, 200)
+        self.assert_recruitment(2, 2, RecruitmentStatus.CLOSED)
+        self.assertEqual(
+            list(
+                Application.objects.filter(pk__in=self.waitlisted)
+                .order_by("id")
+                .values_list("status", flat=True)
+            ),
+            ["approved", "waitlisted"],
+        )
+
+        self.assertEqual(self.set_capacity(5).status_code, 200)
+        self.assert_recruitment(5, 3, RecruitmentStatus.OPEN)
+        self.assertFalse(Application.objects.filter(status="waitlisted").exists())
+
+    def test_removing_capacity_promotes_everyone(self):
+        self.assertEqual(self.set_capacity(None).status_code, 200)
+        self.assert_recruitment(None, 3, RecruitmentStatus.OPEN)
+
+    def test_capacity_decrease_to_approved_count_closes(self):
+        self.set_capacity(None)
+        self.assertEqual(self.set_capacity(3).status_code, 200)
+        self.assert_recruitment(3, 3, RecruitmentStatus.CLOSED)
+
+
+class ApplicationCancelTest(ApplicationTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.recruitment = self.create_recruitment(capacity=1)
+        self.application_id = self.apply(self.recruitment.id).data["id"]
+
+    def cancel(self, application_id=None, client=None):
+        client = client or self.client
+        return client.delete(
+            f"/api/applications/{application_id or self.application_id}/"
+        )
+
+    def test_cancel_pending(self):
+        self.assertEqual(self.cancel().status_code, 204)
+        self.recruitment.refresh_from_db()
+        self.assertEqual(self.recruitment.pending_count, 0)
+
+    def test_cancel_approved_promotes_waitlisted(self):
+        self.shelter_client.post(f"/api/applications/{self.application_id}/approved/")
+        other = User.objects.create_user(email="other@example.com", name="대기자")
+        waitlisted = self.apply(self.recruitment.id, other).data["id"]
+
+        self.assertEqual(self.cancel().status_code, 204)
+        self.assertEqual(Application.objects.get(pk=waitlisted).status, "approved")
+        self.recruitment.refresh_from_db()
+        self.assertEqual(self.recruitment.approved_count, 1)
+
+    def test_completed_applications_cannot_be_cancelled(self):
+        self.shelter_client.post(f"/api/applications/{self.application_id}/approved/")
+        self.shelter_client.post(f"/api/applications/{self.application_id}/attended/")
+
+        response = self.cancel()
+        self.assertEqual(response.status_code, 409)
+        self.assertTrue(Application.objects.filter(pk=self.application_id).exists())
+        self.recruitment.refresh_from_db()
+        self.assertEqual(self.recruitment.approved_count, 1)
+
+    def test_cannot_cancel_on_or_after_event_date(self):
+        Recruitment.objects.filter(pk=self.recruitment.pk).update(date=date.today())
+        self.assertEqual(self.cancel().status_code, 409)
+
+    def test_other_users_application(self):
+        other = self.client_for(
+            User.objects.create_user(email="x@example.com", name="x")
+        )
+        self.assertEqual(self.cancel(client=other).status_code, 404)
+
+
+# 🧀 동시 취소 → 대기자 승격 (실제 트랜잭션 / 연결을 쓰레드마다 사용)
+class ApplicationConcurrentCancelTest(ApplicationTestMixin, TransactionTestCase):
+    def setUp(self):
+        self.setUpTestData()
+        super().setUp()
+        self.recruitment = self.create_recruitment(capacity=2)
+        users = [
+            User.objects.create_user(email=f"concurrent{i}@example.com", name="봉사자")
+            for i in range(5)
+        ]
+        self.approved = []
+        for user in users[:2]:
+            application_id = self.apply(self.recruitment.id, user).data["id"]
+            self.shelter_client.post(f"/api/applications/{application_id}/approved/")
+            self.approved.append((user, application_id))
+        self.waitlisted = [
+            self.apply(self.recruitment.id, user).data["id"] for user in users[2:]
+        ]
+
+    def test_concurrent_cancels_promote_distinct_waitlisted(self):
+        barrier = threading.Barrier(len(self.approved))
+        responses = []
+
+        def cancel(user, application_id):
+            client = self.client_for(user)
+            try:
+                barrier.wait()
+                responses.append(client.delete(f"/api/applications/{application_id}/"))
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=cancel, args=approved) for approved in self.approved
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([response.status_code for response in responses], [204, 204])
+        # 먼저 신청한 대기자 2명이 한 번씩만 승격
+        statuses = dict(
+            Application.objects.filter(pk__in=self.waitlisted).values_list(
+                "id", "status"
+            )
+        )
+        self.assertEqual(
+            [statuses[application_id] for application_id in self.waitlisted],
+            ["approved", "approved", "waitlisted"],
+        )
+        self.recruitment.refresh_from_db()
+        self.assertEqual(self.recruitment.approved_count, 2)
+        self.assertEqual(self.recruitment.status, RecruitmentStatus.CLOSED)
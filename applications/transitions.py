@@ -0,0 +1,226 @@
+from collections import Counter
+
+from django.db import connection, transaction
+from rest_framework import status
+
+from histories.models import History
+from recruitments.signals import sync_slot_changes
+from shelters.models import Shelter
+
+from .models import Application
+from .slots import apply_slot_deltas, get_slot_deltas
+
+# 🧀 허용되는 상태 변경 (변경할 상태 → 변경 전 상태 목록)
+# 참석/불참은 잘못 처리한 경우 서로 정정 가능, 대기자는 자리가 있으면 직접 승인 가능
+ALLOWED_TRANSITIONS = {
+    "approved": ["pending", "waitlisted"],
+    "rejected": ["pending", "waitlisted", "approved"],
+    "attended": ["approved", "absence"],
+    "absence": ["approved", "attended"],
+}
+
+# 🧀 완료 처리 시 봉사 이력(History)을 남기는 상태
+HISTORY_STATUSES = {"attended", "absence"}
+
+FORBIDDEN_MESSAGES = {"rejected": "거절 권한이 없습니다."}
+
+
+class TransitionError(Exception):
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+def get_transition_error_message(current_status, new_status):
+    return f"현재 상태({current_status})에서는 {new_status} 로 변경할 수 없습니다."
+
+
+def get_capacity_error(recruitment_id):
+    return TransitionError(
+        f"봉사활동({recruitment_id})의 정원이 가득 차 승인할 수 없습니다.",
+        status.HTTP_409_CONFLICT,
+    )
+
+
+# 🧀 상태 변경 후처리 (raw UPDATE 는 시그널이 없으므로 직접 수행)
+# 참석/불참 → 이력 생성 (신청당 1건, 이미 있으면 생략) / 검색 캐시 무효화 + 카드 갱신 예약
+def record_transitions(rows, new_status):
+    if new_status in HISTORY_STATUSES and rows:
+        History.objects.bulk_create(
+            [
+                History(
+                    user_id=user_id,
+                    shelter_id=shelter_id,
+                    application_id=application_id,
+                )
+                for application_id, user_id, shelter_id, _ in rows
+            ],
+            ignore_conflicts=True,
+        )
+
+    recruitment_ids = {recruitment_id for _, _, _, recruitment_id in rows}
+    if recruitment_ids:
+        sync_slot_changes(recruitment_ids)
+
+
+# 🧀 신청 상태 변경 (compare-and-swap, UPDATE 1회)
+# 권한(보호소 관리자) 확인 + 행 잠금 → 허용된 변경 전 상태일 때만 UPDATE 를 한 문장으로 실행
+# 잠금 CTE 가 변경 전 상태를 함께 돌려주므로 어느 인원 카운터를 줄일지 바로 결정
+# 동시에 승인/취소가 들어와도 먼저 반영된 쪽만 성공하고 나머지는 0행
+# 같은 트랜잭션에서 봉사활동 인원 카운터 갱신 (정원 초과면 롤백 → TransitionError(409))
+# 승인된 신청을 거절하면 빈 자리만큼 대기자 승격
+# 0행이면 실패 원인(없음 / 권한 / 상태)만 추가 조회해 TransitionError
+def transition_application(user, application_id, new_status, rejected_reason=None):
+    table = Application._meta.db_table
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH locked AS (
+                    SELECT application.id, application.status
+                    FROM {table} AS application
+                    JOIN {Shelter._meta.db_table} AS shelter
+                      ON shelter.id = application.shelter_id
+                    WHERE application.id = %s
+                      AND shelter.user_id = %s
+                    FOR UPDATE OF application
+                )
+                UPDATE {table} AS application
+                SET status = %s,
+                    rejected_reason = COALESCE(%s, application.rejected_reason),
+                    updated_at = now()
+                FROM locked
+                WHERE application.id = locked.id
+                  AND locked.status = ANY(%s)
+                RETURNING application.id, application.user_id,
+                          application.shelter_id, application.recruitment_id,
+                          locked.status
+                """,
+                [
+                    application_id,
+                    user.id,
+                    new_status,
+                    rejected_reason,
+                    ALLOWED_TRANSITIONS[new_status],
+                ],
+            )
+            changed = cursor.fetchone()
+        rows = [changed[:4]] if changed else []
+        if changed:
+            recruitment_id, old_status = changed[3], changed[4]
+            deltas = get_slot_deltas(old_status, new_status)
+            updated, _ = apply_slot_deltas(recruitment_id, deltas)
+            if not updated:
+                raise get_capacity_error(recruitment_id)
+        record_transitions(rows, new_status)
+
+    if rows:
+        return rows[0][0]
+
+    current = (
+        Application.objects.filter(pk=application_id)
+        .values_list("status", "shelter__user_id")
+        .first()
+    )
+    if current is None:
+        raise TransitionError(
+            "해당 신청을 찾을 수 없습니다.", status.HTTP_404_NOT_FOUND
+        )
+    current_status, shelter_user_id = current
+    if shelter_user_id != user.id:
+        raise TransitionError(
+            FORBIDDEN_MESSAGES.get(new_status, "승인 권한이 없습니다."),
+            status.HTTP_403_FORBIDDEN,
+        )
+    raise TransitionError(
+        get_transition_error_message(current_status, new_status),
+        status.HTTP_409_CONFLICT,
+    )
+
+
+# 🧀 여러 신청 상태 일괄 변경 (보호소 관리자)
+# 요청한 id 잠금(내 보호소 신청만) → 허용된 상태인 행만 UPDATE → 요청 id 기준 LEFT JOIN 을
+# 한 문장으로 실행해 변경 결과와 실패 사유(없음 / 현재 상태)를 같은 스냅샷에서 반환
+# 봉사활동별 인원 카운터를 한 번씩 갱신, 정원을 넘기면 전체 롤백 → TransitionError(409)
+# → (변경된 신청 id 목록, 실패 {id: 사유})
+def bulk_transition(shelter, application_ids, new_status, rejected_reason=None):
+    application_ids = list(dict.fromkeys(application_ids))
+    table = Application._meta.db_table
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                WITH requested AS (
+                    SELECT id, ordinality
+                    FROM unnest(%s::bigint[]) WITH ORDINALITY AS requested(id, ordinality)
+                ),
+                locked AS (
+                    SELECT application.id, application.status
+                    FROM {table} AS application
+                    JOIN requested ON requested.id = application.id
+                    WHERE application.shelter_id = %s
+                    ORDER BY application.id
+                    FOR UPDATE OF application
+                ),
+                changed AS (
+                    UPDATE {table} AS application
+                    SET status = %s,
+                        rejected_reason = COALESCE(%s, application.rejected_reason),
+                        updated_at = now()
+                    FROM locked
+                    WHERE application.id = locked.id
+                      AND locked.status = ANY(%s)
+                    RETURNING application.id, application.user_id,
+                              application.shelter_id, application.recruitment_id
+                )
+                SELECT requested.id, locked.status, changed.user_id,
+                       changed.shelter_id, changed.recruitment_id
+                FROM requested
+                LEFT JOIN locked ON locked.id = requested.id
+                LEFT JOIN changed ON changed.id = requested.id
+                ORDER BY requested.ordinality
+                """,
+                [
+                    application_ids,
+                    shelter.id,
+                    new_status,
+                    rejected_reason,
+                    ALLOWED_TRANSITIONS[new_status],
+                ],
+            )
+            results = cursor.fetchall()
+
+        rows = [
+            (application_id, user_id, shelter_id, recruitment_id)
+            for application_id, _, user_id, shelter_id, recruitment_id in results
+            if recruitment_id is not None
+        ]
+        # 봉사활동별 증감 합산 (변경 전 상태마다 줄어드는 카운터가 다름)
+        changes = Counter(
+            (recruitment_id, old_status)
+            for _, old_status, _, _, recruitment_id in results
+            if recruitment_id is not None
+        )
+        recruitment_deltas = {}
+        for (recruitment_id, old_status), count in changes.items():
+            deltas = recruitment_deltas.setdefault(recruitment_id, Counter())
+            deltas.update(get_slot_deltas(old_status, new_status, count))
+        for recruitment_id, deltas in sorted(recruitment_deltas.items()):
+            deltas = {counter: delta for counter, delta in deltas.items() if delta}
+            updated, _ = apply_slot_deltas(recruitment_id, deltas)
+            if not updated:
+                raise get_capacity_error(recruitment_id)
+        record_transitions(rows, new_status)
+
+    failed = {}
+    for application_id, current_status, _, _, recruitment_id in results:
+        if recruitment_id is not None:
+            continue
+        if current_status is None:
+            failed[application_id] = "해당 신청을 찾을 수 없습니다."
+        else:
+            failed[application_id] = get_transition_error_message(
+                current_status, new_status
+            )
+    return [row[0] for row in rows], failed
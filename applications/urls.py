@@ -4,6 +4,7 @@ from applications.views import (
     ApplicationAbsenceView,
     ApplicationApproveRejectView,
     ApplicationAttendView,
+    ApplicationBulkTransitionView,
     ApplicationDetailView,
     ApplicationListCreateView,
     ApplicationRejectView,
@@ -11,6 +12,11 @@ from applications.views import (
 
 urlpatterns = [
     path("", ApplicationListCreateView.as_view(), name="application-list-create"),
+    path(
+        "bulk-status/",
+        ApplicationBulkTransitionView.as_view(),
+        name="application-bulk-status",
+    ),
     path(
         "<int:application_id>/",
         ApplicationDetailView.as_view(),
@@ -1,23 +1,39 @@
+from datetime import date
+
+from django.db import transaction
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from applications.models import Application
+from applications.admission import AdmissionError, admit_application
+from applications.models import CANCELLABLE_STATUSES, Application
 from applications.serializers import (
+    ApplicationBulkTransitionSerializer,
     ApplicationCreateSerializer,
     ApplicationRejectSerializer,
     ApplicationSerializer,
 )
-from histories.models import History
-from recruitments.models import Recruitment
+from applications.slots import apply_slot_deltas, get_slot_deltas
+from applications.transitions import (
+    TransitionError,
+    bulk_transition,
+    transition_application,
+)
+from common.pagination import KEYSET_PAGINATION_PARAMETERS, KeysetPagination
+from recruitments.signals import sync_slot_changes
+from shelters.models import Shelter
 
 
 class ApplicationListCreateView(APIView):
+    query_budget = {"get": 2, "post": 6}
+
     # 신청한 봉사 목록 조회
     @extend_schema(
         summary="신청한 봉사 목록 조회",
-        description="현재 로그인한 사용자의 봉사 신청 목록을 조회합니다.",
+        description="현재 로그인한 사용자의 봉사 신청 목록을 조회합니다. "
+        "다음 페이지 커서는 X-Next-Cursor 헤더로 전달됩니다.",
+        parameters=KEYSET_PAGINATION_PARAMETERS,
         responses={
             200: ApplicationSerializer(many=True),
             404: {"example": {"detail": "봉사 신청 내역을 찾을 수 없습니다."}},
@@ -25,20 +41,26 @@ class ApplicationListCreateView(APIView):
     )
     def get(self, request):
         try:
-            applications = Application.objects.filter(user=request.user)
+            applications = Application.objects.filter(user=request.user).select_related(
+                "user", "recruitment", "shelter"
+            )
         except Application.DoesNotExist:
             return Response(
                 {"detail": "봉사 신청 내역을 찾을 수 없습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = ApplicationSerializer(applications, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(applications, request)
+        serializer = ApplicationSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
     # 봉사 신청
     @extend_schema(
         summary="봉사 신청 생성",
-        description="봉사 모집 공고에 대한 신청을 생성합니다.",
+        description="봉사 모집 공고에 대한 신청을 생성합니다. "
+        "정원이 차서 마감된 봉사활동은 대기자(waitlisted)로 신청되고, "
+        "자리가 나면 신청 순서대로 승인됩니다.",
         request=ApplicationCreateSerializer,
         responses={
             201: ApplicationSerializer,
@@ -81,44 +103,19 @@ class ApplicationListCreateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        recruitments_id = request.data.get("recruitment")  # 신청할 봉사활동 ID 가져오기
-
-        # 해당 봉사활동이 존재하는지 확인
+        # 봉사활동 존재 / 중복 신청 / 시간 중복은 INSERT 한 번에서 DB 제약 조건으로 확인
         try:
-            recruitment = Recruitment.objects.get(id=recruitments_id)
-        except Recruitment.DoesNotExist:
-            return Response(
-                {"error": "해당 봉사활동을 찾을 수 없습니다."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        # 이미 해당 봉사활동에 신청했는지 확인
-        if Application.objects.filter(
-            user=request.user, recruitment=recruitment
-        ).exists():
-            return Response(
-                {"error": "이미 신청한 봉사활동 입니다."},
-                status=status.HTTP_409_CONFLICT,
+            application_id = admit_application(
+                user, serializer.validated_data["recruitment"]
             )
-
-        # 기존 신청한 봉사활동과 시간이 겹치는지 확인
-        overlapping_applications = Application.objects.filter(
-            user=request.user,
-            recruitment__start_time__lt=recruitment.end_time,
-            recruitment__end_time__gt=recruitment.start_time,
-        ).exists()
-
-        if overlapping_applications:
-            return Response(
-                {"error": "중복된 시간에 신청한 봉사활동이 있습니다."},
-                status=status.HTTP_409_CONFLICT,
-            )
-
-        try:
-            application = serializer.save()
+            application = Application.objects.select_related(
+                "user", "recruitment", "shelter"
+            ).get(pk=application_id)
             return Response(
                 ApplicationSerializer(application).data, status=status.HTTP_201_CREATED
             )
+        except AdmissionError as e:
+            return Response({"error": e.message}, status=e.status_code)
         except Exception as e:
             return Response(
                 {
@@ -130,6 +127,8 @@ class ApplicationListCreateView(APIView):
 
 
 class ApplicationDetailView(APIView):
+    query_budget = {"get": 2}
+
     # 봉사 신청 내역 상세 조회
     @extend_schema(
         summary="봉사 신청 상세 조회",
@@ -141,7 +140,9 @@ class ApplicationDetailView(APIView):
     )
     def get(self, request, application_id):
         try:
-            application = Application.objects.get(pk=application_id, user=request.user)
+            application = Application.objects.select_related(
+                "user", "recruitment", "shelter"
+            ).get(pk=application_id, user=request.user)
         except Application.DoesNotExist:
             return Response(
                 {"error": "해당 신청을 찾을 수 없습니다."},
@@ -154,84 +155,109 @@ class ApplicationDetailView(APIView):
     # 봉사 신청 취소
     @extend_schema(
         summary="봉사 신청 취소",
-        description="특정 봉사 신청을 취소(삭제)합니다.",
+        description="특정 봉사 신청을 취소(삭제)합니다. "
+        "승인 대기 / 승인 완료 / 대기자 상태의 신청만 봉사 전날까지 취소할 수 있습니다. "
+        "승인된 신청을 취소하면 대기자(waitlisted) 중 먼저 신청한 사용자가 승인됩니다.",
         responses={
             200: {"example": {"error": "신청이 취소되었습니다."}},
             404: {"example": {"error": "해당 봉사 신청 내역을 찾을 수 없습니다."}},
+            409: {"example": {"error": "봉사 당일부터는 신청을 취소할 수 없습니다."}},
         },
     )
     def delete(self, request, application_id):
-        try:
-            application = Application.objects.get(pk=application_id, user=request.user)
-        except Application.DoesNotExist:
-            return Response(
-                {"error": "해당 신청을 찾을 수 없습니다."},
-                status=status.HTTP_404_NOT_FOUND,
+        # 본인 신청 행만 잠가 취소 중에 상태가 바뀌지 않도록 한 뒤 인원 카운터 감소
+        with transaction.atomic():
+            application = (
+                Application.objects.select_for_update(of=("self",))
+                .select_related("recruitment")
+                .filter(pk=application_id, user=request.user)
+                .first()
             )
-
-        application.delete()
+            if application is None:
+                return Response(
+                    {"error": "해당 신청을 찾을 수 없습니다."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            # 거절/참석/불참 처리된 신청, 봉사 당일 이후의 신청은 취소 불가
+            # (참석/불참은 승인 인원에 포함되므로 취소하면 실제로 비지 않은 자리에 대기자가 승격됨)
+            if application.status not in CANCELLABLE_STATUSES:
+                return Response(
+                    {
+                        "error": f"현재 상태({application.status})에서는 취소할 수 없습니다."
+                    },
+                    status=status.HTTP_409_CONFLICT,
+                )
+            if application.recruitment.date <= date.today():
+                return Response(
+                    {"error": "봉사 당일부터는 신청을 취소할 수 없습니다."},
+                    status=status.HTTP_409_CONFLICT,
+                )
+
+            application.delete()
+            # 승인된 자리가 비면 대기자를 신청 순서대로 승격 (SKIP LOCKED, 잠금 대기 없음)
+            deltas = get_slot_deltas(application.status, None)
+            if deltas:
+                apply_slot_deltas(application.recruitment_id, deltas)
+                sync_slot_changes([application.recruitment_id])
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+# 🧀 단건 상태 변경 공통 처리 → 변경된 신청 응답 (실패 시 404 / 403 / 409)
+def transition_response(request, application_id, new_status, rejected_reason=None):
+    try:
+        transition_application(
+            request.user, application_id, new_status, rejected_reason
+        )
+    except TransitionError as e:
+        return Response({"error": e.message}, status=e.status_code)
+
+    application = Application.objects.select_related(
+        "user", "recruitment", "shelter"
+    ).get(pk=application_id)
+    return Response(ApplicationSerializer(application).data, status=status.HTTP_200_OK)
+
+
+TRANSITION_CONFLICT_RESPONSE = {
+    "example": {"error": "현재 상태(attended)에서는 approved 로 변경할 수 없습니다."}
+}
+
+
 class ApplicationApproveRejectView(APIView):
+    query_budget = {"post": 7}
+
     # 봉사 신청 승인
     @extend_schema(
         summary="봉사 신청 승인",
-        description="보호소 관리자가 특정 봉사 신청을 승인합니다.",
+        description="보호소 관리자가 특정 봉사 신청을 승인합니다. (승인 대기 → 승인 완료)",
         responses={
             200: ApplicationSerializer,
             403: {"example": {"error": "승인 권한이 없습니다."}},
             404: {"example": {"error": "해당 신청을 찾을 수 없습니다."}},
+            409: TRANSITION_CONFLICT_RESPONSE,
         },
     )
     def post(self, request, application_id):
-        try:
-            application = Application.objects.get(pk=application_id)
-        except Application.DoesNotExist:
-            return Response(
-                {"error": "해당 신청을 찾을 수 없습니다."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        if application.shelter.user != request.user:
-            return Response(
-                {"error": "승인 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN
-            )
-
-        application.status = "approved"
-        application.save()
-        return Response(
-            ApplicationSerializer(application).data, status=status.HTTP_200_OK
-        )
+        return transition_response(request, application_id, "approved")
 
 
 class ApplicationRejectView(APIView):
+    query_budget = {"post": 7}
+
     # 봉사 신청 거절
     @extend_schema(
         summary="봉사 신청 거절",
-        description="보호소 관리자가 특정 봉사 신청을 거절합니다.",
+        description="보호소 관리자가 특정 봉사 신청을 거절합니다. "
+        "(승인 대기 / 승인 완료 → 승인 거절)",
         request=ApplicationRejectSerializer,
         responses={
             200: ApplicationSerializer,
             400: {"example": {"error": "거절 사유를 입력해주세요."}},
             403: {"example": {"error": "거절 권한이 없습니다."}},
             404: {"example": {"error": "해당 신청을 찾을 수 없습니다."}},
+            409: TRANSITION_CONFLICT_RESPONSE,
         },
     )
     def post(self, request, application_id):
-        try:
-            application = Application.objects.get(pk=application_id)
-        except Application.DoesNotExist:
-            return Response(
-                {"error": "해당 신청을 찾을 수 없습니다."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        if application.shelter.user != request.user:
-            return Response(
-                {"error": "거절 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN
-            )
-
         rejected_reason = request.data.get("rejected_reason", "").strip()
         if not rejected_reason:
             return Response(
@@ -239,90 +265,100 @@ class ApplicationRejectView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        application.status = "rejected"
-        application.rejected_reason = rejected_reason
-        application.save()
-
-        return Response(
-            ApplicationSerializer(application).data, status=status.HTTP_200_OK
-        )
+        return transition_response(request, application_id, "rejected", rejected_reason)
 
 
 class ApplicationAttendView(APIView):
+    query_budget = {"post": 7}
+
     # 봉사 활동 완료
     @extend_schema(
         summary="봉사 활동 완료 ",
-        description="보호소 관리자가 봉사 완료한 봉사자를 완료 처리합니다.",
+        description="보호소 관리자가 봉사 완료한 봉사자를 완료 처리합니다. "
+        "(승인 완료 / 불참 → 참석)",
         responses={
             200: ApplicationSerializer,
             403: {"example": {"error": "승인 권한이 없습니다."}},
             404: {"example": {"error": "해당 봉사 활동을 찾을 수 없습니다."}},
+            409: TRANSITION_CONFLICT_RESPONSE,
         },
     )
     def post(self, request, application_id):
-        try:
-            application = Application.objects.get(pk=application_id)
-        except Application.DoesNotExist:
-            return Response(
-                {"error": "해당 신청을 찾을 수 없습니다."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        if application.shelter.user != request.user:
-            return Response(
-                {"error": "승인 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN
-            )
-
-        application.status = "attended"
-        application.save()
-
-        # 완료 시 History 생성
-        History.objects.get_or_create(
-            user=application.user,
-            application=application,
-            shelter=application.recruitment.shelter,
-        )
-
-        return Response(
-            ApplicationSerializer(application).data, status=status.HTTP_200_OK
-        )
+        # 완료 시 History 생성 (applications.transitions)
+        return transition_response(request, application_id, "attended")
 
 
 class ApplicationAbsenceView(APIView):
+    query_budget = {"post": 7}
+
     # 봉사 활동 불참
     @extend_schema(
         summary="봉사 활동 불참",
-        description="보호소 관리자가 불참한 봉사자를 불참 처리합니다.",
+        description="보호소 관리자가 불참한 봉사자를 불참 처리합니다. "
+        "(승인 완료 / 참석 → 불참)",
         responses={
             200: ApplicationSerializer,
             403: {"example": {"error": "승인 권한이 없습니다."}},
             404: {"example": {"error": "해당 봉사 활동을 찾을 수 없습니다."}},
+            409: TRANSITION_CONFLICT_RESPONSE,
         },
     )
     def post(self, request, application_id):
-        try:
-            application = Application.objects.get(pk=application_id)
-        except Application.DoesNotExist:
-            return Response(
-                {"error": "해당 신청을 찾을 수 없습니다."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+        # 완료 시 History 생성 (applications.transitions)
+        return transition_response(request, application_id, "absence")
+
+
+class ApplicationBulkTransitionView(APIView):
+    query_budget = {"post": 8}
 
-        if application.shelter.user != request.user:
+    # 봉사 신청 상태 일괄 변경
+    @extend_schema(
+        summary="봉사 신청 상태 일괄 변경",
+        description="보호소 관리자가 여러 신청을 한 번에 승인/거절/완료/불참 처리합니다. "
+        "찾을 수 없거나 내 보호소 신청이 아닌 id, 현재 상태에서 변경할 수 없는 id 는 "
+        "failed 로 응답합니다. 승인 시 봉사활동 정원을 넘기면 전체가 반영되지 않습니다 (409).",
+        request=ApplicationBulkTransitionSerializer,
+        responses={
+            200: {
+                "example": {
+                    "status": "attended",
+                    "updated": [1, 2],
+                    "failed": [{"id": 3, "error": "해당 신청을 찾을 수 없습니다."}],
+                }
+            },
+            403: {"example": {"error": "승인 권한이 없습니다."}},
+            409: {
+                "example": {"error": "봉사활동(1)의 정원이 가득 차 승인할 수 없습니다."}
+            },
+        },
+    )
+    def post(self, request):
+        shelter = Shelter.objects.filter(user=request.user).first()
+        if not shelter:
             return Response(
                 {"error": "승인 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN
             )
 
-        application.status = "absence"
-        application.save()
+        serializer = ApplicationBulkTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        application_ids = list(dict.fromkeys(data["application_ids"]))
 
-        # 완료 시 History 생성
-        History.objects.get_or_create(
-            user=application.user,
-            application=application,
-            shelter=application.recruitment.shelter,
-        )
+        try:
+            updated, failed = bulk_transition(
+                shelter, application_ids, data["status"], data["rejected_reason"]
+            )
+        except TransitionError as e:
+            return Response({"error": e.message}, status=e.status_code)
 
         return Response(
-            ApplicationSerializer(application).data, status=status.HTTP_200_OK
+            {
+                "status": data["status"],
+                "updated": updated,
+                "failed": [
+                    {"id": application_id, "error": error}
+                    for application_id, error in failed.items()
+                ],
+            },
+            status=status.HTTP_200_OK,
         )
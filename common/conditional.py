@@ -0,0 +1,49 @@
+import hashlib
+
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+# 🌸 조건부 GET (If-None-Match / If-Modified-Since → 304)
+# 뷰는 직렬화 전에 검증값(ETag, Last-Modified)만 계산해서 먼저 비교
+# etag, last_modified = get_validators(request, instance.updated_at)
+# not_modified = get_not_modified_response(request, etag, last_modified)
+# if not_modified: return not_modified
+def get_etag(request, *parts):
+    # 같은 URL(쿼리 파라미터 포함) + 같은 검증값이면 같은 응답
+    payload = repr((request.get_full_path(), parts))
+    return quote_etag(hashlib.md5(payload.encode()).hexdigest())
+
+
+# 🌸 단건 응답용 검증값 (ETag + Last-Modified)
+# Last-Modified 는 초 단위라 같은 초 안의 변경을 구분할 수 없음
+# → 그 초가 지난 뒤에만 전달 (이후 변경은 항상 더 큰 초 값을 가짐)
+def get_validators(request, last_modified, *parts):
+    etag = get_etag(request, last_modified, *parts)
+    if last_modified is None:
+        return etag, None
+    timestamp = int(last_modified.timestamp())
+    if timestamp >= int(timezone.now().timestamp()):
+        return etag, None
+    return etag, timestamp
+
+
+# 🌸 목록 응답은 ETag 만 사용 (MAX(updated_at) 는 삭제를 반영하지 못하므로 Last-Modified 없음)
+# etag = get_collection_etag(request, max_updated_at, count)
+def get_collection_etag(request, last_modified, count):
+    return get_etag(request, last_modified, count)
+
+
+def set_validators(response, etag, last_modified=None):
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+def get_not_modified_response(request, etag, last_modified=None):
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        return None
+    return set_validators(response, etag, last_modified)
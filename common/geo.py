@@ -0,0 +1,59 @@
+import math
+
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.045
+
+
+# 🌸 반경(km) → 위도/경도 범위 (인덱스로 먼저 걸러낼 사각형)
+def bounding_box(lat, lng, radius_km):
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    # 극지방에서 cos → 0 이 되는 것 방지
+    dlng = radius_km / (KM_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 0.01))
+    return (lat - dlat, lat + dlat), (lng - dlng, lng + dlng)
+
+
+# 🌸 하버사인 거리(km) DB 표현식
+def haversine_distance(lat, lng, lat_field="latitude", lng_field="longitude"):
+    lat1 = Radians(Value(lat, output_field=FloatField()))
+    lng1 = Radians(Value(lng, output_field=FloatField()))
+    lat2 = Radians(F(lat_field))
+    lng2 = Radians(F(lng_field))
+
+    a = Power(Sin((lat2 - lat1) / 2), 2) + Cos(lat1) * Cos(lat2) * Power(
+        Sin((lng2 - lng1) / 2), 2
+    )
+    return Value(2 * EARTH_RADIUS_KM, output_field=FloatField()) * ASin(Sqrt(a))
+
+
+# 🌸 위치 검색 파라미터 검증 → (lat, lng, radius) 또는 오류 메시지
+def parse_location_params(params, default_radius_km=5.0, max_radius_km=50.0):
+    try:
+        lat = float(params["lat"])
+        lng = float(params["lng"])
+        radius = float(params.get("radius") or default_radius_km)
+    except (KeyError, TypeError, ValueError):
+        return None, "lat, lng 값을 숫자로 입력해주세요."
+
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        return None, "위도/경도 범위가 올바르지 않습니다."
+    if not 0 < radius <= max_radius_km:
+        return None, f"반경은 0 초과 {max_radius_km:g}km 이하로 입력해주세요."
+    return (lat, lng, radius), None
+
+
+# 🌸 반경 내 행만 남기고 거리(distance, km) 주석 추가
+# 1) 위도/경도 범위로 인덱스 탐색 → 2) 남은 행만 하버사인 거리 계산
+def filter_within_radius(
+    queryset, lat, lng, radius_km, lat_field="latitude", lng_field="longitude"
+):
+    lat_range, lng_range = bounding_box(lat, lng, radius_km)
+    return (
+        queryset.filter(
+            **{f"{lat_field}__range": lat_range, f"{lng_field}__range": lng_range}
+        )
+        .annotate(distance=haversine_distance(lat, lng, lat_field, lng_field))
+        .filter(distance__lte=radius_km)
+    )
@@ -0,0 +1,128 @@
+import io
+import logging
+import multiprocessing
+import os
+import posixpath
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.conf import settings
+from PIL import Image, ImageOps
+
+from common.storage import IMMUTABLE_CACHE_CONTROL, storage
+
+logger = logging.getLogger("common.images")
+
+# 🌸 이미지 변환본 (이름 → 최대 가로/세로 px)
+IMAGE_VARIANTS = {"thumbnail": 200, "medium": 800}
+VARIANT_FORMAT = "webp"
+VARIANT_QUALITY = 80
+
+# 🌸 변환본을 만드는 업로드 경로 (프로필 / 봉사활동 이미지)
+VARIANT_PREFIXES = ("users/", "recruitments/")
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+# 🌸 원본 키 → 변환본 키 (결정적: 원본 키만 알면 DB 조회 없이 URL 계산 가능)
+# recruitments/<sha256>.png → recruitments/variants/thumbnail/<sha256>.webp
+def get_variant_key(key, variant):
+    directory, filename = posixpath.split(key)
+    stem = posixpath.splitext(filename)[0]
+    return f"{directory}/variants/{variant}/{stem}.{VARIANT_FORMAT}"
+
+
+def get_variant_keys(key):
+    if not key.startswith(VARIANT_PREFIXES):
+        return []
+    return [get_variant_key(key, variant) for variant in IMAGE_VARIANTS]
+
+
+# 🌸 원본 URL → 변환본 URL (저장소 밖의 URL 이면 None, 예: 카카오 프로필 이미지)
+# 변환본이 실제로 생성됐는지는 확인하지 않음 (생성 전에는 404 → 클라이언트가 원본 URL 로 대체)
+def get_variant_url(url, variant):
+    if not url:
+        return None
+    key = storage.get_key(url)
+    if key == url or not key.startswith(VARIANT_PREFIXES):
+        return None
+    return storage.get_url(get_variant_key(key, variant))
+
+
+# 🌸 변환본 생성 (프로세스 풀 안에서 실행)
+def generate_variants(key, data=None):
+    if data is None:
+        data = storage.get_object(key)
+
+    with Image.open(io.BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+        for variant, size in IMAGE_VARIANTS.items():
+            resized = image.copy()
+            resized.thumbnail((size, size))
+            buffer = io.BytesIO()
+            resized.save(buffer, VARIANT_FORMAT, quality=VARIANT_QUALITY)
+            buffer.seek(0)
+            storage.upload_fileobj(
+                buffer,
+                get_variant_key(key, variant),
+                extra_args={
+                    "ACL": "public-read",
+                    "ContentType": "image/webp",
+                    "CacheControl": IMMUTABLE_CACHE_CONTROL,
+                },
+            )
+    return key
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                # spawn: 요청 처리 스레드/DB 연결을 복제하지 않도록 새 프로세스에서 Django 초기화
+                _executor = ProcessPoolExecutor(
+                    max_workers=settings.IMAGE_VARIANT_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=django.setup,
+                )
+    return _executor
+
+
+def _log_failure(future):
+    error = future.exception()
+    if error:
+        logger.error("이미지 변환본 생성 실패: %s", error)
+
+
+def _reset_executor():
+    # fork 된 자식 프로세스는 부모의 프로세스 풀을 사용할 수 없음
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_executor)
+
+
+# 🌸 변환본 생성 예약 (요청은 기다리지 않음)
+# data 를 넘기면 원본을 다시 내려받지 않음 (직접 업로드는 None → 저장소에서 조회)
+def schedule_variants(key, data=None):
+    if not key.startswith(VARIANT_PREFIXES):
+        return None
+
+    if settings.IMAGE_VARIANT_WORKERS <= 0:
+        try:
+            generate_variants(key, data)
+        except Exception as e:
+            logger.error("이미지 변환본 생성 실패: %s", e)
+        return None
+
+    future = get_executor().submit(generate_variants, key, data)
+    future.add_done_callback(_log_failure)
+    return future
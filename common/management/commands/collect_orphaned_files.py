@@ -0,0 +1,118 @@
+import posixpath
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from common.images import IMAGE_VARIANTS
+from common.storage import storage
+from common.utils import ALLOWED_IMAGE_EXTENSIONS, UPLOAD_PREFIXES, get_referenced_urls
+
+
+# 🌸 키를 살려 두는 URL 목록
+# 원본 → 자기 URL / 변환본 → 원본 후보 URL (변환본 키에는 원본 확장자가 남지 않음)
+def get_owner_urls(key):
+    parts = key.split("/")
+    if len(parts) < 4 or parts[-3] != "variants" or parts[-2] not in IMAGE_VARIANTS:
+        return [storage.get_url(key)]
+
+    directory = "/".join(parts[:-3])
+    stem = posixpath.splitext(parts[-1])[0]
+    extensions = {
+        ext for base in ALLOWED_IMAGE_EXTENSIONS for ext in (base, base.upper())
+    }
+    return [storage.get_url(f"{directory}/{stem}.{ext}") for ext in sorted(extensions)]
+
+
+class Command(BaseCommand):
+    help = "저장소에서 DB 가 참조하지 않는 파일(고아 객체)을 찾아 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run", action="store_true", help="삭제하지 않고 대상만 출력"
+        )
+        parser.add_argument(
+            "--grace-hours",
+            type=float,
+            default=settings.STORAGE_GC_GRACE_HOURS,
+            help="이 시간 안에 올라간 파일은 건너뜀",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="한 번에 확인/삭제할 키 수"
+        )
+        parser.add_argument(
+            "--prefix",
+            action="append",
+            dest="prefixes",
+            help="검사할 경로 (여러 번 지정 가능, 기본: 업로드 경로 전체)",
+        )
+
+    def handle(self, *args, **options):
+        self.dry_run = options["dry_run"]
+        self.verbosity = options["verbosity"]
+        # 저장소 수정 시각은 UTC aware datetime (USE_TZ=False 인 timezone.now() 와 비교 불가)
+        self.cutoff = datetime.now(timezone.utc) - timedelta(
+            hours=options["grace_hours"]
+        )
+        batch_size = options["batch_size"]
+        prefixes = options["prefixes"] or list(UPLOAD_PREFIXES.values())
+
+        scanned = orphaned = aborted = 0
+        for prefix in prefixes:
+            batch = []
+            for item in storage.list_objects(prefix):
+                scanned += 1
+                if item["last_modified"] >= self.cutoff:
+                    continue
+                batch.append(item["key"])
+                if len(batch) >= batch_size:
+                    orphaned += self.collect(batch)
+                    batch = []
+            if batch:
+                orphaned += self.collect(batch)
+
+            # 스트리밍 업로드 중 끊긴 멀티파트 업로드 (목록에는 보이지 않지만 용량 차지)
+            for upload in storage.list_multipart_uploads(prefix):
+                if upload["initiated"] >= self.cutoff:
+                    continue
+                aborted += 1
+                self.report(f"멀티파트 업로드 {upload['key']} ({upload['upload_id']})")
+                if not self.dry_run:
+                    storage.abort_multipart_upload(upload["key"], upload["upload_id"])
+
+        action = "삭제 대상" if self.dry_run else "삭제"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"검사 {scanned}건 / 고아 객체 {action} {orphaned}건 / "
+                f"멀티파트 업로드 {action} {aborted}건"
+            )
+        )
+
+    # ✅ 배치 단위 참조 확인 → 참조 없는 키 삭제 (delete_objects 한 번)
+    def collect(self, keys):
+        owners = {key: get_owner_urls(key) for key in keys}
+        referenced = get_referenced_urls(
+            [url for urls in owners.values() for url in urls]
+        )
+        orphans = [
+            key
+            for key, urls in owners.items()
+            if not referenced.intersection(urls) and not self.is_recent(key)
+        ]
+        for key in orphans:
+            self.report(key)
+        if orphans and not self.dry_run:
+            storage.delete_objects(orphans)
+        return len(orphans)
+
+    # ✅ 목록 조회 이후 다시 올라간 파일 (같은 내용의 재업로드) 은 건너뜀
+    # 참조 확인 전에 덮어쓴 업로드의 행이 아직 저장되지 않았을 수 있음
+    def is_recent(self, key):
+        head = storage.head_object(key)
+        return head is None or head["last_modified"] >= self.cutoff
+
+    def report(self, message):
+        # dry-run 은 항상, 실제 삭제는 -v 2 이상일 때 대상 출력
+        if self.dry_run or self.verbosity > 1:
+            prefix = "[dry-run] " if self.dry_run else ""
+            self.stdout.write(f"{prefix}{message}")
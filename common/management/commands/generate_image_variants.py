@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from common.images import generate_variants, get_variant_keys
+from common.storage import storage
+from recruitments.models import RecruitmentImage
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = "기존 프로필/봉사활동 이미지의 썸네일/중간 크기 WebP 변환본을 생성합니다."
+
+    def handle(self, *args, **options):
+        urls = set(RecruitmentImage.objects.values_list("image_url", flat=True))
+        urls |= set(
+            User.objects.exclude(profile_image=None).values_list(
+                "profile_image", flat=True
+            )
+        )
+
+        created = failed = 0
+        for url in sorted(filter(None, urls)):
+            key = storage.get_key(url)
+            if key == url or not get_variant_keys(key):
+                continue  # 외부 URL (카카오 프로필 등)
+            try:
+                generate_variants(key)
+                created += 1
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"{url}: {e}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"변환본 생성 완료: {created}건 (실패 {failed}건)")
+        )
@@ -0,0 +1,47 @@
+import logging
+
+from django.conf import settings
+
+from common.querycount import (
+    QueryBudgetExceeded,
+    QueryRecorder,
+    check_query_budget,
+    get_query_budget,
+)
+
+logger = logging.getLogger("common.querycount")
+
+
+# 🌸 요청별 SQL 기록 → 뷰에 선언된 쿼리 예산(query_budget) 초과 / N+1 감지
+# QUERY_BUDGET_ENABLED 가 꺼져 있으면 아무 것도 하지 않음
+# QUERY_BUDGET_STRICT 가 켜져 있으면 경고 대신 예외 발생 (테스트용)
+class QueryBudgetMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, "QUERY_BUDGET_ENABLED", False):
+            return self.get_response(request)
+
+        with QueryRecorder() as recorder:
+            response = self.get_response(request)
+
+        view_class = getattr(request, "_query_budget_view", None)
+        if view_class is None:
+            return response
+
+        label = f"{view_class.__name__}.{request.method.lower()}"
+        budget = get_query_budget(view_class, request.method)
+        problems = check_query_budget(recorder, budget, label)
+        response["X-Query-Count"] = str(recorder.count)
+
+        if problems:
+            if getattr(settings, "QUERY_BUDGET_STRICT", False):
+                raise QueryBudgetExceeded("\n".join(problems))
+            for problem in problems:
+                logger.warning(problem)
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._query_budget_view = getattr(view_func, "view_class", None)
@@ -0,0 +1,137 @@
+import base64
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+
+
+# 🌸 키셋(커서) 페이지네이션
+# OFFSET 대신 마지막 행의 정렬 키 값 이후를 조회 → 정렬 키 인덱스를 그대로 탐색
+class KeysetPagination(BasePagination):
+    ordering = ("created_at", "id")
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+
+    def __init__(self, ordering=None):
+        if ordering is not None:
+            self.ordering = tuple(ordering)
+        self.next_cursor = None
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def encode_cursor(self, values):
+        payload = json.dumps(values, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    # ✅ 커서 값 → 정렬 필드 타입으로 변환 (dict / list 등 형식이 맞지 않으면 NotFound)
+    def parse_cursor_values(self, model, values):
+        parsed = []
+        for field, value in zip(self.ordering, values):
+            if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+                raise NotFound(self.invalid_cursor_message)
+            try:
+                model_field = model._meta.get_field(field.lstrip("-"))
+            except FieldDoesNotExist:
+                # annotate 값 (거리, 검색 관련도) 은 숫자만 허용
+                if not isinstance(value, (int, float)):
+                    raise NotFound(self.invalid_cursor_message)
+                parsed.append(value)
+                continue
+            try:
+                parsed.append(model_field.to_python(value))
+            except ValidationError:
+                raise NotFound(self.invalid_cursor_message)
+        return parsed
+
+    def get_seek_filter(self, values):
+        # (a, b, c) > (x, y, z) 를 a >= x AND (a > x OR (a = x AND b > y) OR ...) 로 전개
+        # 맨 앞의 a >= x 조건 덕분에 복합 인덱스 범위 탐색이 가능
+        seek = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            seek |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+
+        first = self.ordering[0]
+        bound = "lte" if first.startswith("-") else "gte"
+        return Q(**{f"{first.lstrip('-')}__{bound}": values[0]}) & seek
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            values = self.parse_cursor_values(
+                queryset.model, self.decode_cursor(cursor)
+            )
+            queryset = queryset.filter(self.get_seek_filter(values))
+
+        # 한 건 더 조회해서 다음 페이지 존재 여부 판단
+        page = list(queryset[: page_size + 1])
+        self.next_cursor = None
+        if len(page) > page_size:
+            page = page[:page_size]
+            self.next_cursor = self.encode_cursor(
+                [self.get_cursor_value(page[-1], field) for field in self.ordering]
+            )
+        return page
+
+    def get_cursor_value(self, instance, field):
+        value = getattr(instance, field.lstrip("-"))
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        return value
+
+    def get_paginated_response(self, data, envelope=None):
+        # 기존 응답 형태 유지: {"recruitments": [...]} 에는 "next" 키만 추가하고,
+        # 리스트를 그대로 반환하던 API 는 헤더로 다음 커서를 전달
+        if envelope is None:
+            headers = {"X-Next-Cursor": self.next_cursor} if self.next_cursor else None
+            return Response(data, headers=headers)
+        return Response({envelope: data, "next": self.next_cursor})
+
+
+# 🌸 API 문서용 페이지네이션 쿼리 파라미터
+KEYSET_PAGINATION_PARAMETERS = [
+    OpenApiParameter(
+        name="cursor",
+        type=str,
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="이전 응답의 next 값 (다음 페이지 조회용)",
+    ),
+    OpenApiParameter(
+        name="page_size",
+        type=int,
+        location=OpenApiParameter.QUERY,
+        required=False,
+        description="페이지 크기 (기본 20, 최대 100)",
+    ),
+]
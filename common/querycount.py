@@ -0,0 +1,100 @@
+import re
+from collections import Counter
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# 🌸 같은 형태의 쿼리가 이 횟수 이상 반복되면 N+1 로 판단
+DEFAULT_REPEAT_THRESHOLD = 3
+
+_IN_CLAUSE = re.compile(r"IN \((?:%s|\?)(?:, (?:%s|\?))*\)")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+# 🌸 파라미터/리터럴을 제거해 쿼리 형태(shape)만 남김
+def normalize_sql(sql):
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    return _IN_CLAUSE.sub("IN (...)", sql)
+
+
+# 🌸 실행된 SQL 기록기 (with QueryRecorder() as recorder: ...)
+class QueryRecorder:
+    def __init__(self, using=DEFAULT_DB_ALIAS):
+        self.connection = connections[using]
+        self.queries = []
+        self._wrapper = None
+
+    def __enter__(self):
+        self.queries = []
+        self._wrapper = self.connection.execute_wrapper(self)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._wrapper.__exit__(exc_type, exc_value, traceback)
+        self._wrapper = None
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append(sql)
+        return execute(sql, params, many, context)
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    def repeated_shapes(self, threshold=DEFAULT_REPEAT_THRESHOLD):
+        shapes = Counter(normalize_sql(sql) for sql in self.queries)
+        return [(shape, n) for shape, n in shapes.most_common() if n >= threshold]
+
+
+# 🌸 APIView 에 선언된 메서드별 쿼리 예산 조회
+# class MyView(APIView):
+#     query_budget = {"get": 3}
+def get_query_budget(view_class, method):
+    budget = getattr(view_class, "query_budget", None)
+    if isinstance(budget, dict):
+        return budget.get(method.lower())
+    return budget
+
+
+# 🌸 예산 초과 / 반복 쿼리 검사 → 문제 목록 반환
+def check_query_budget(recorder, budget, label, threshold=None):
+    if threshold is None:
+        threshold = getattr(
+            settings, "QUERY_BUDGET_REPEAT_THRESHOLD", DEFAULT_REPEAT_THRESHOLD
+        )
+
+    problems = []
+    if budget is not None and recorder.count > budget:
+        problems.append(f"{label}: 쿼리 {recorder.count}개 실행 (예산 {budget}개 초과)")
+    for shape, n in recorder.repeated_shapes(threshold):
+        problems.append(f"{label}: 같은 형태의 쿼리 {n}회 반복 (N+1 의심) → {shape}")
+    return problems
+
+
+# 🌸 테스트용: 블록 안의 쿼리가 예산을 넘거나 N+1 이 보이면 실패
+# with assert_query_budget(RecruitmentListView, "get"):
+#     client.get("/api/recruitments/")
+@contextmanager
+def assert_query_budget(view_class_or_budget, method="get", threshold=None):
+    if isinstance(view_class_or_budget, int):
+        budget, label = view_class_or_budget, "query budget"
+    else:
+        budget = get_query_budget(view_class_or_budget, method)
+        label = f"{view_class_or_budget.__name__}.{method.lower()}"
+
+    with QueryRecorder() as recorder:
+        yield recorder
+
+    problems = check_query_budget(recorder, budget, label, threshold)
+    if problems:
+        raise QueryBudgetExceeded(
+            "\n".join(problems + ["실행된 쿼리:"] + recorder.queries)
+        )
@@ -0,0 +1,118 @@
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.dateparse import parse_date, parse_time
+from rest_framework.response import Response
+
+# 🌸 지역 필터 없이 검색한 결과는 모든 지역 변경에 영향을 받으므로 전역 세대 사용
+ALL_REGIONS = "*"
+GENERATION_KEY = "search:gen:{region}"
+
+
+# 🌸 지역별 세대(generation) 카운터
+# 캐시 키에 세대를 포함 → 쓰기 발생 시 세대만 올리면 이전 캐시는 자연히 버려짐
+def get_generations(regions):
+    keys = {region: GENERATION_KEY.format(region=region) for region in regions}
+    found = cache.get_many(keys.values())
+
+    generations = {}
+    for region, key in keys.items():
+        if key not in found:
+            # 세대 키가 유실돼도 이전 값과 겹치지 않도록 현재 시각(ms)으로 시작
+            cache.add(key, time.time_ns() // 1_000_000, timeout=None)
+            found[key] = cache.get(key)
+        generations[region] = found[key]
+    return generations
+
+
+def bump_generations(*regions):
+    for region in {ALL_REGIONS, *(r for r in regions if r)}:
+        key = GENERATION_KEY.format(region=region)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns() // 1_000_000, timeout=None)
+
+
+# 🌸 검색 결과 캐시
+# 쿼리 파라미터를 정규화(지역 정렬, 날짜/시간 표준화)해서 같은 조건이면 같은 키 사용
+class SearchCache:
+    def __init__(
+        self,
+        namespace,
+        region_param="region",
+        max_regions=None,
+        date_params=(),
+        time_params=(),
+        list_params=(),
+        other_params=(),
+    ):
+        self.namespace = namespace
+        self.region_param = region_param
+        self.max_regions = max_regions
+        self.date_params = date_params
+        self.time_params = time_params
+        self.list_params = list_params
+        self.other_params = other_params
+
+    @property
+    def timeout(self):
+        return getattr(settings, "SEARCH_CACHE_TIMEOUT", 300)
+
+    def get_regions(self, params):
+        value = params.get(self.region_param)
+        if not value:
+            return []
+        regions = value.split(",") if self.max_regions else [value]
+        if self.max_regions:
+            regions = regions[: self.max_regions]
+        return sorted({region.strip() for region in regions})
+
+    def normalize(self, params):
+        normalized = {"region": self.get_regions(params)}
+        for name in self.date_params:
+            value = params.get(name)
+            try:
+                parsed = parse_date(value) if value else None
+            except ValueError:
+                # 형식은 맞지만 존재하지 않는 날짜(2024-02-30) → 원래 값 그대로 사용
+                parsed = None
+            normalized[name] = parsed.isoformat() if parsed else value
+        for name in self.time_params:
+            value = params.get(name)
+            try:
+                parsed = parse_time(value) if value else None
+            except ValueError:
+                parsed = None
+            normalized[name] = parsed.isoformat() if parsed else value
+        for name in self.list_params:
+            value = params.get(name)
+            items = value.split(",") if value else []
+            normalized[name] = sorted({item.strip() for item in items} - {""})
+        for name in self.other_params:
+            normalized[name] = params.get(name)
+        return normalized
+
+    def get_key(self, params):
+        normalized = self.normalize(params)
+        generations = get_generations(normalized["region"] or [ALL_REGIONS])
+        payload = json.dumps([normalized, generations], sort_keys=True)
+        digest = hashlib.md5(payload.encode()).hexdigest()
+        return f"search:{self.namespace}:{digest}"
+
+    def get(self, key):
+        cached = cache.get(key)
+        if cached is None:
+            return None
+        return Response(cached["data"], status=cached["status"])
+
+    def set(self, key, response):
+        cache.set(
+            key,
+            {"data": response.data, "status": response.status_code},
+            timeout=self.timeout,
+        )
+        return response
@@ -0,0 +1,99 @@
+from drf_spectacular.utils import OpenApiExample, extend_schema_serializer
+from rest_framework import serializers
+
+from common.images import get_variant_url
+from common.utils import (
+    ALLOWED_IMAGE_EXTENSIONS,
+    LICENSE_ALLOWED_EXTENSIONS,
+    LICENSE_MAX_FILE_SIZE_BYTES,
+    MAX_FILE_SIZE_BYTES,
+)
+
+# 🌸 직접 업로드 대상별 설정 (저장 경로 종류, 허용 확장자, 최대 크기)
+UPLOAD_TARGETS = {
+    "profile_image": {
+        "instance_type": "users",
+        "extensions": ALLOWED_IMAGE_EXTENSIONS,
+        "max_size": MAX_FILE_SIZE_BYTES,
+    },
+    "business_license": {
+        "instance_type": "shelters",
+        "extensions": LICENSE_ALLOWED_EXTENSIONS,
+        "max_size": LICENSE_MAX_FILE_SIZE_BYTES,
+    },
+    "recruitment_image": {
+        "instance_type": "recruitments",
+        "extensions": ALLOWED_IMAGE_EXTENSIONS,
+        "max_size": MAX_FILE_SIZE_BYTES,
+    },
+}
+
+CONTENT_TYPES = {"jpg": "image/jpeg", "png": "image/png", "pdf": "application/pdf"}
+
+
+# ✅ 원본 이미지 URL → 변환본(thumbnail / medium) URL 필드
+# profile_thumbnail = ImageVariantField("thumbnail", source="profile_image")
+# 변환본은 업로드 후 비동기로 생성되므로 생성 여부와 관계없이 항상 변환본 URL 을 반환
+# → 클라이언트가 변환본 로드 실패(404) 시 원본 URL 로 대체해야 함
+class ImageVariantField(serializers.Field):
+    def __init__(self, variant, **kwargs):
+        kwargs["read_only"] = True
+        kwargs.setdefault(
+            "help_text",
+            f"{variant} WebP 변환본 URL. 업로드 직후에는 아직 생성되지 않아 404 일 수 있으므로 "
+            "로드에 실패하면 원본 이미지 URL 을 사용하세요.",
+        )
+        super().__init__(**kwargs)
+        self.variant = variant
+
+    def to_representation(self, value):
+        return get_variant_url(value, self.variant)
+
+
+# ✅ 업로드 요청 (presigned POST 발급)
+@extend_schema_serializer(
+    examples=[
+        OpenApiExample(
+            name="봉사활동 이미지 업로드 요청",
+            value={
+                "target": "recruitment_image",
+                "filename": "walking.png",
+                "size": 204800,
+                "recruitment_id": 1,
+            },
+            request_only=True,
+        )
+    ]
+)
+class UploadIntentSerializer(serializers.Serializer):
+    target = serializers.ChoiceField(choices=list(UPLOAD_TARGETS))
+    filename = serializers.CharField(max_length=200)
+    size = serializers.IntegerField(min_value=1)
+    recruitment_id = serializers.IntegerField(required=False)
+
+    def validate(self, data):
+        config = UPLOAD_TARGETS[data["target"]]
+        extension = data["filename"].rsplit(".", 1)[-1].lower()
+
+        if extension not in config["extensions"]:
+            allowed = ", ".join(sorted(config["extensions"])).upper()
+            raise serializers.ValidationError(
+                {"filename": f"{allowed} 형식만 가능합니다."}
+            )
+        if data["size"] > config["max_size"]:
+            max_size_mb = config["max_size"] // (1024 * 1024)
+            raise serializers.ValidationError(
+                {"size": f"파일 크기는 {max_size_mb}MB를 초과할 수 없습니다."}
+            )
+        if data["target"] == "recruitment_image" and not data.get("recruitment_id"):
+            raise serializers.ValidationError(
+                {"recruitment_id": "봉사활동 이미지는 recruitment_id 가 필요합니다."}
+            )
+
+        data["content_type"] = CONTENT_TYPES[extension]
+        return data
+
+
+# ✅ 업로드 완료 확인
+class UploadConfirmSerializer(serializers.Serializer):
+    upload_token = serializers.CharField()
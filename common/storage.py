@@ -0,0 +1,556 @@
+import io
+import mimetypes
+import os
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+# 🌸 내용 기반 키로 저장한 객체의 캐시 정책 (키가 같으면 내용도 같으므로 영구 캐시)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+# 🌸 저장소 백엔드 인터페이스
+# settings.STORAGE_BACKEND 로 선택 (S3 / 로컬 디스크 / 메모리)
+# 키(key)는 "recruitments/uuid_name.png" 같은 저장 경로, URL 은 응답/DB 에 저장되는 주소
+class StorageBackend:
+    def __init__(self):
+        self._uploads = {}
+
+    def get_url(self, key):
+        raise NotImplementedError
+
+    def get_key(self, url):
+        raise NotImplementedError
+
+    def upload_fileobj(self, file, key, extra_args=None):
+        raise NotImplementedError
+
+    def delete_object(self, key):
+        raise NotImplementedError
+
+    # 객체 내용(bytes) 조회
+    def get_object(self, key):
+        raise NotImplementedError
+
+    # 여러 객체 삭제 → 실패한 키 목록 [{"key", "error"}]
+    def delete_objects(self, keys):
+        errors = []
+        for key in keys:
+            try:
+                self.delete_object(key)
+            except Exception as e:
+                errors.append({"key": key, "error": str(e)})
+        return errors
+
+    def put_object_acl(self, key, acl):
+        pass
+
+    def put_bucket_cors(self, cors_configuration):
+        pass
+
+    def generate_presigned_url(self, method, params, expiration):
+        # 공개 URL 을 그대로 사용하는 백엔드는 서명 없이 반환
+        return self.get_url(params["Key"])
+
+    def generate_presigned_post(self, key, content_type, max_size, expiration):
+        raise NotImplementedError("직접 업로드를 지원하지 않는 저장소입니다.")
+
+    # 객체 정보 조회 → {"size", "content_type", "last_modified"}, 없으면 None
+    def head_object(self, key):
+        raise NotImplementedError
+
+    def copy_object(self, source_key, key, extra_args=None):
+        self.upload_fileobj(io.BytesIO(self.get_object(source_key)), key, extra_args)
+
+    # prefix 아래 객체 목록 → {"key", "last_modified"} 를 하나씩 (페이지 단위로 조회)
+    def list_objects(self, prefix):
+        raise NotImplementedError
+
+    # 완료/취소되지 않은 멀티파트 업로드 → {"key", "upload_id", "initiated"}
+    def list_multipart_uploads(self, prefix):
+        return iter(())
+
+    # 멀티파트 업로드 (기본 구현: 조각을 모아 두었다가 완료 시 한 번에 저장)
+    def create_multipart_upload(self, key, extra_args=None):
+        upload_id = uuid.uuid4().hex
+        self._uploads[upload_id] = {}
+        return upload_id
+
+    def upload_part(self, key, upload_id, part_number, data):
+        self._uploads[upload_id][part_number] = data
+        return str(part_number)
+
+    def complete_multipart_upload(self, key, upload_id, etags):
+        parts = self._uploads.pop(upload_id)
+        data = b"".join(parts[number] for number in sorted(parts))
+        self.upload_fileobj(io.BytesIO(data), key)
+
+    def abort_multipart_upload(self, key, upload_id):
+        self._uploads.pop(upload_id, None)
+
+    def reset(self):
+        pass
+
+
+# 🌸 NCP Object Storage (S3 호환) 백엔드 - 프로세스당 클라이언트 1개 재사용
+# 매 호출마다 boto3 클라이언트를 만들면 인증 정보 조회, 엔드포인트 설정, TLS 연결을 매번 반복
+# → 한 번 만든 클라이언트(연결 풀 포함)를 같은 gunicorn 워커 안의 모든 요청이 공유
+# boto3 클라이언트는 스레드 안전하지만 fork 이후에는 공유하면 안 되므로 자식 프로세스에서 새로 생성
+class S3Backend(StorageBackend):
+    def __init__(self):
+        super().__init__()
+        self._client = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def bucket(self):
+        return settings.AWS_STORAGE_BUCKET_NAME
+
+    def get_config(self):
+        return Config(
+            max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS,
+            retries={
+                "total_max_attempts": settings.AWS_S3_MAX_ATTEMPTS,
+                "mode": "standard",
+            },
+            connect_timeout=settings.AWS_S3_CONNECT_TIMEOUT,
+            read_timeout=settings.AWS_S3_READ_TIMEOUT,
+        )
+
+    def create_client(self):
+        return boto3.session.Session().client(
+            "s3",
+            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.AWS_S3_REGION_NAME,
+            config=self.get_config(),
+        )
+
+    @property
+    def client(self):
+        pid = os.getpid()
+        if self._client is None or self._pid != pid:
+            with self._lock:
+                if self._client is None or self._pid != pid:
+                    self._client = self.create_client()
+                    self._pid = pid
+        return self._client
+
+    def reset(self):
+        self._client = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def get_url(self, key):
+        return f"{settings.MEDIA_URL}{key}"
+
+    def get_key(self, url):
+        return url.replace(settings.MEDIA_URL, "")
+
+    def get_transfer_config(self):
+        part_size = settings.STORAGE_MULTIPART_PART_SIZE
+        return TransferConfig(
+            multipart_threshold=part_size,
+            multipart_chunksize=part_size,
+            max_concurrency=settings.STORAGE_MULTIPART_CONCURRENCY,
+        )
+
+    def upload_fileobj(self, file, key, extra_args=None):
+        self.client.upload_fileobj(
+            file,
+            self.bucket,
+            key,
+            ExtraArgs=extra_args,
+            Config=self.get_transfer_config(),
+        )
+
+    def delete_object(self, key):
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+    def get_object(self, key):
+        return self.client.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+
+    def delete_objects(self, keys):
+        # delete_objects 는 한 번에 최대 1000개, Quiet 모드는 실패한 키만 응답
+        errors = []
+        for start in range(0, len(keys), 1000):
+            response = self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={
+                    "Objects": [{"Key": key} for key in keys[start : start + 1000]],
+                    "Quiet": True,
+                },
+            )
+            errors += [
+                {"key": error["Key"], "error": error.get("Message", error["Code"])}
+                for error in response.get("Errors", [])
+            ]
+        return errors
+
+    def put_object_acl(self, key, acl):
+        self.client.put_object_acl(Bucket=self.bucket, Key=key, ACL=acl)
+
+    def put_bucket_cors(self, cors_configuration):
+        self.client.put_bucket_cors(
+            Bucket=self.bucket, CORSConfiguration=cors_configuration
+        )
+
+    def generate_presigned_url(self, method, params, expiration):
+        return self.client.generate_presigned_url(
+            method, Params={"Bucket": self.bucket, **params}, ExpiresIn=expiration
+        )
+
+    def generate_presigned_post(self, key, content_type, max_size, expiration):
+        # 파일 크기 / Content-Type / ACL 을 정책 조건으로 고정 → 다른 파일은 저장소가 거부
+        fields = {
+            "acl": "public-read",
+            "Content-Type": content_type,
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        }
+        return self.client.generate_presigned_post(
+            Bucket=self.bucket,
+            Key=key,
+            Fields=fields,
+            Conditions=[
+                {"acl": "public-read"},
+                {"Content-Type": content_type},
+                {"Cache-Control": IMMUTABLE_CACHE_CONTROL},
+                ["content-length-range", 1, max_size],
+            ],
+            ExpiresIn=expiration,
+        )
+
+    def head_object(self, key):
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise
+        return {
+            "size": response["ContentLength"],
+            "content_type": response.get("ContentType"),
+            "last_modified": response["LastModified"],
+        }
+
+    def copy_object(self, source_key, key, extra_args=None):
+        # 저장소 안에서 복사 (내려받지 않음), 메타데이터는 extra_args 로 교체
+        self.client.copy_object(
+            Bucket=self.bucket,
+            Key=key,
+            CopySource={"Bucket": self.bucket, "Key": source_key},
+            MetadataDirective="REPLACE",
+            **(extra_args or {}),
+        )
+
+    def list_objects(self, prefix):
+        paginator = self.client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=self.bucket, Prefix=prefix, PaginationConfig={"PageSize": 1000}
+        )
+        for page in pages:
+            for item in page.get("Contents", []):
+                yield {"key": item["Key"], "last_modified": item["LastModified"]}
+
+    def list_multipart_uploads(self, prefix):
+        paginator = self.client.get_paginator("list_multipart_uploads")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            for item in page.get("Uploads", []):
+                yield {
+                    "key": item["Key"],
+                    "upload_id": item["UploadId"],
+                    "initiated": item["Initiated"],
+                }
+
+    def create_multipart_upload(self, key, extra_args=None):
+        response = self.client.create_multipart_upload(
+            Bucket=self.bucket, Key=key, **(extra_args or {})
+        )
+        return response["UploadId"]
+
+    def upload_part(self, key, upload_id, part_number, data):
+        response = self.client.upload_part(
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return response["ETag"]
+
+    def complete_multipart_upload(self, key, upload_id, etags):
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": number, "ETag": etag}
+                    for number, etag in enumerate(etags, start=1)
+                ]
+            },
+        )
+
+    def abort_multipart_upload(self, key, upload_id):
+        self.client.abort_multipart_upload(
+            Bucket=self.bucket, Key=key, UploadId=upload_id
+        )
+
+
+# 🌸 로컬 디스크 백엔드 (네트워크 없이 부하 테스트 / 개발용)
+# STORAGE_LOCAL_ROOT 아래에 키 경로 그대로 저장하고 STORAGE_LOCAL_URL 로 주소 생성
+class LocalBackend(StorageBackend):
+    @property
+    def root(self):
+        return Path(settings.STORAGE_LOCAL_ROOT)
+
+    def get_path(self, key):
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError(f"Invalid storage key: {key}")
+        return path
+
+    def get_url(self, key):
+        return f"{settings.STORAGE_LOCAL_URL}{key}"
+
+    def get_key(self, url):
+        return url.replace(settings.STORAGE_LOCAL_URL, "")
+
+    def upload_fileobj(self, file, key, extra_args=None):
+        path = self.get_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as destination:
+            shutil.copyfileobj(file, destination)
+
+    def delete_object(self, key):
+        self.get_path(key).unlink(missing_ok=True)
+
+    def get_object(self, key):
+        return self.get_path(key).read_bytes()
+
+    def head_object(self, key):
+        path = self.get_path(key)
+        if not path.is_file():
+            return None
+        stat = path.stat()
+        return {
+            "size": stat.st_size,
+            "content_type": mimetypes.guess_type(path.name)[0],
+            "last_modified": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+        }
+
+    def list_objects(self, prefix):
+        root = self.root.resolve()
+        directory = self.get_path(prefix)
+        if not directory.is_dir():
+            return
+        for path in sorted(directory.rglob("*")):
+            if path.is_file():
+                yield {
+                    "key": path.relative_to(root).as_posix(),
+                    "last_modified": datetime.fromtimestamp(
+                        path.stat().st_mtime, tz=timezone.utc
+                    ),
+                }
+
+
+# 🌸 메모리 백엔드 (테스트용, 프로세스가 끝나면 사라짐)
+class InMemoryBackend(StorageBackend):
+    url_prefix = "memory://"
+
+    def __init__(self):
+        super().__init__()
+        self.objects = {}
+        self.modified = {}
+        self._lock = threading.Lock()
+
+    def get_url(self, key):
+        return f"{self.url_prefix}{key}"
+
+    def get_key(self, url):
+        return url.replace(self.url_prefix, "")
+
+    def upload_fileobj(self, file, key, extra_args=None):
+        data = file.read()
+        with self._lock:
+            self.objects[key] = data
+            self.modified[key] = datetime.now(timezone.utc)
+
+    def delete_object(self, key):
+        with self._lock:
+            self.objects.pop(key, None)
+            self.modified.pop(key, None)
+
+    def get_object(self, key):
+        return self.objects[key]
+
+    def head_object(self, key):
+        with self._lock:
+            data = self.objects.get(key)
+            if data is None:
+                return None
+            return {
+                "size": len(data),
+                "content_type": mimetypes.guess_type(key)[0],
+                "last_modified": self.modified[key],
+            }
+
+    def list_objects(self, prefix):
+        with self._lock:
+            keys = sorted(key for key in self.objects if key.startswith(prefix))
+            items = [{"key": key, "last_modified": self.modified[key]} for key in keys]
+        yield from items
+
+    def reset(self):
+        self._lock = threading.Lock()
+
+
+# 🌸 저장소 게이트웨이 (프로세스 공용)
+# 설정된 백엔드로 위임하면서 작업별 지연 시간을 기록
+class StorageGateway:
+    def __init__(self, backend=None):
+        self._backend = backend
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = import_string(settings.STORAGE_BACKEND)()
+        return self._backend
+
+    @property
+    def client(self):
+        # S3 백엔드 전용 (boto3 클라이언트를 직접 써야 하는 경우)
+        return self.backend.client
+
+    def reset(self):
+        # fork 직후 자식 프로세스에서 호출 (부모의 연결/락/통계를 물려받지 않도록)
+        self._lock = threading.Lock()
+        self._stats = {}
+        if self._backend is not None:
+            self._backend.reset()
+
+    def get_url(self, key):
+        return self.backend.get_url(key)
+
+    def get_key(self, url):
+        return self.backend.get_key(url)
+
+    # ✅ 작업별 지연 시간 통계 (횟수, 실패, 누적/최대 ms)
+    @contextmanager
+    def timed(self, operation):
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                stat = self._stats.setdefault(
+                    operation,
+                    {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0},
+                )
+                stat["count"] += 1
+                stat["errors"] += int(failed)
+                stat["total_ms"] += elapsed_ms
+                stat["max_ms"] = max(stat["max_ms"], elapsed_ms)
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                operation: {
+                    **stat,
+                    "avg_ms": stat["total_ms"] / stat["count"] if stat["count"] else 0,
+                }
+                for operation, stat in self._stats.items()
+            }
+
+    def upload_fileobj(self, file, key, extra_args=None):
+        with self.timed("upload"):
+            self.backend.upload_fileobj(file, key, extra_args)
+
+    def delete_object(self, key):
+        with self.timed("delete"):
+            self.backend.delete_object(key)
+
+    def get_object(self, key):
+        with self.timed("download"):
+            return self.backend.get_object(key)
+
+    def delete_objects(self, keys):
+        with self.timed("delete_many"):
+            return self.backend.delete_objects(keys)
+
+    def put_object_acl(self, key, acl):
+        with self.timed("put_acl"):
+            self.backend.put_object_acl(key, acl)
+
+    def put_bucket_cors(self, cors_configuration):
+        with self.timed("put_cors"):
+            self.backend.put_bucket_cors(cors_configuration)
+
+    def generate_presigned_url(self, method, params, expiration):
+        with self.timed("presign"):
+            return self.backend.generate_presigned_url(method, params, expiration)
+
+    def generate_presigned_post(self, key, content_type, max_size, expiration):
+        with self.timed("presign_post"):
+            return self.backend.generate_presigned_post(
+                key, content_type, max_size, expiration
+            )
+
+    def head_object(self, key):
+        with self.timed("head"):
+            return self.backend.head_object(key)
+
+    def copy_object(self, source_key, key, extra_args=None):
+        with self.timed("copy"):
+            self.backend.copy_object(source_key, key, extra_args)
+
+    # 목록 조회는 제너레이터라 지연 시간을 기록하지 않음
+    def list_objects(self, prefix):
+        return self.backend.list_objects(prefix)
+
+    def list_multipart_uploads(self, prefix):
+        return self.backend.list_multipart_uploads(prefix)
+
+    def create_multipart_upload(self, key, extra_args=None):
+        with self.timed("multipart_create"):
+            return self.backend.create_multipart_upload(key, extra_args)
+
+    def upload_part(self, key, upload_id, part_number, data):
+        with self.timed("multipart_part"):
+            return self.backend.upload_part(key, upload_id, part_number, data)
+
+    def complete_multipart_upload(self, key, upload_id, etags):
+        with self.timed("multipart_complete"):
+            self.backend.complete_multipart_upload(key, upload_id, etags)
+
+    def abort_multipart_upload(self, key, upload_id):
+        with self.timed("multipart_abort"):
+            self.backend.abort_multipart_upload(key, upload_id)
+
+
+storage = StorageGateway()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=storage.reset)
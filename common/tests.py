@@ -1,3 +1,384 @@
-from django.test import TestCase
+import io
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core import signing
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from PIL import Image
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from recruitments.models import Recruitment, RecruitmentImage
+from shelters.models import Shelter
+from users.models import User
+
+from .conditional import get_collection_etag, get_validators
+from .pagination import KeysetPagination
+from .storage import InMemoryBackend, storage
+from .uploads import StreamingStorageUploadHandler
+from .utils import (
+    delete_file_from_s3,
+    get_content_key,
+    get_upload_key,
+    upload_file_to_s3,
+)
+from .views import UPLOAD_TOKEN_SALT
+
+
+class KeysetPaginationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # 정렬 키(name)가 같은 사용자 → id 로 순서 결정
+        cls.users = [
+            User.objects.create_user(
+                email=f"user{i}@example.com", name="봉사자" if i < 4 else f"회원{i}"
+            )
+            for i in range(6)
+        ]
+
+    def paginate(self, cursor=None, page_size=2, ordering=("name", "id")):
+        params = {"page_size": page_size}
+        if cursor:
+            params["cursor"] = cursor
+        request = Request(APIRequestFactory().get("/", params))
+        paginator = KeysetPagination(ordering=ordering)
+        page = paginator.paginate_queryset(User.objects.all(), request)
+        return [user.id for user in page], paginator.next_cursor
+
+    def test_cursor_round_trip(self):
+        expected = [user.id for user in User.objects.order_by("created_at", "id")]
+        ids, cursor = self.paginate(ordering=("created_at", "id"))
+        while cursor:
+            page, cursor = self.paginate(cursor, ordering=("created_at", "id"))
+            ids += page
+        self.assertEqual(ids, expected)
+
+    def test_ties_on_sort_key_are_broken_by_id(self):
+        expected = [user.id for user in User.objects.order_by("name", "id")]
+        ids, cursor = self.paginate(page_size=3)
+        page, cursor = self.paginate(cursor, page_size=3)
+        self.assertEqual(ids + page, expected)
+        self.assertIsNone(cursor)
+
+    def test_invalid_cursor_values(self):
+        paginator = KeysetPagination(ordering=("name", "id"))
+        for values in (
+            [{"name": "x"}, 1],
+            ["봉사자", [1]],
+            ["봉사자", None],
+            ["봉사자", True],
+            ["봉사자", "abc"],
+        ):
+            with self.subTest(values=values), self.assertRaises(NotFound):
+                self.paginate(paginator.encode_cursor(values))
+
+    def test_annotation_cursor_values_must_be_numbers(self):
+        paginator = KeysetPagination(ordering=("distance", "id"))
+        self.assertEqual(paginator.parse_cursor_values(User, [1.5, "3"]), [1.5, 3])
+        with self.assertRaises(NotFound):
+            paginator.parse_cursor_values(User, ["1.5", 3])
+
+
+class ConditionalTest(SimpleTestCase):
+    def setUp(self):
+        self.request = RequestFactory().get("/api/shelters/1/")
+
+    def test_last_modified_is_withheld_within_the_same_second(self):
+        # 같은 초 안에 다시 수정되면 초 단위 Last-Modified 로는 구분할 수 없음
+        etag, last_modified = get_validators(self.request, timezone.now())
+        self.assertIsNotNone(etag)
+        self.assertIsNone(last_modified)
+
+    def test_last_modified_after_the_second_has_passed(self):
+        updated_at = timezone.now() - timedelta(seconds=2)
+        _, last_modified = get_validators(self.request, updated_at)
+        self.assertEqual(last_modified, int(updated_at.timestamp()))
+
+    def test_validators_distinguish_sub_second_changes(self):
+        updated_at = timezone.now() - timedelta(seconds=2)
+        first, _ = get_validators(self.request, updated_at)
+        second, _ = get_validators(self.request, updated_at + timedelta(microseconds=1))
+        self.assertNotEqual(first, second)
+
+    def test_collection_etag_changes_with_count(self):
+        updated_at = timezone.now()
+        self.assertNotEqual(
+            get_collection_etag(self.request, updated_at, 3),
+            get_collection_etag(self.request, updated_at, 2),
+        )
+
+
+# 🌸 테스트마다 비어 있는 메모리 저장소 사용
+class InMemoryStorageMixin:
+    def setUp(self):
+        super().setUp()
+        self.backend = InMemoryBackend()
+        patcher = mock.patch.object(storage, "_backend", self.backend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def license_file(self, content=b"%PDF-1.4 license"):
+        return SimpleUploadedFile("license.pdf", content, "application/pdf")
+
+    def png_bytes(self, color="white"):
+        buffer = io.BytesIO()
+        Image.new("RGB", (4, 4), color).save(buffer, "PNG")
+        return buffer.getvalue()
+
+
+class FileStorageTest(InMemoryStorageMixin, TestCase):
+    def test_duplicate_upload_refreshes_modified_time(self):
+        url = upload_file_to_s3(self.license_file(), "shelters")
+        key = storage.get_key(url)
+        stale = self.backend.modified[key] - timedelta(days=2)
+        self.backend.modified[key] = stale
+
+        self.assertEqual(upload_file_to_s3(self.license_file(), "shelters"), url)
+        self.assertGreater(self.backend.modified[key], stale)
+
+    def test_content_key_is_left_to_orphan_collection(self):
+        # 같은 내용을 올리는 다른 요청이 있을 수 있으므로 바로 삭제하지 않음
+        url = upload_file_to_s3(self.license_file(), "shelters")
+        self.assertFalse(delete_file_from_s3(url))
+        self.assertIsNotNone(storage.head_object(storage.get_key(url)))
+
+    def test_unique_key_is_deleted_when_unreferenced(self):
+        key = get_upload_key("license.pdf", "shelters")
+        storage.upload_fileobj(self.license_file(), key)
+        self.assertTrue(delete_file_from_s3(storage.get_url(key)))
+        self.assertIsNone(storage.head_object(key))
+
+
+# 🌸 스트리밍 업로드: 조각 크기 16 바이트로 멀티파트 전송까지 확인
+@override_settings(STORAGE_MULTIPART_PART_SIZE=16, STORAGE_MULTIPART_CONCURRENCY=2)
+class StreamingUploadTest(InMemoryStorageMixin, SimpleTestCase):
+    def upload(self, content, filename="license.pdf", max_size=None):
+        request = RequestFactory().post(
+            "/", {"business_license_file": SimpleUploadedFile(filename, content)}
+        )
+        handler = StreamingStorageUploadHandler(
+            request, "business_license_file", "shelters"
+        )
+        handler.chunk_size = 16  # 파서가 작은 조각으로 전달하도록
+        if max_size:
+            handler.max_size = max_size
+        request.upload_handlers = [handler]
+        return handler, request.FILES.get("business_license_file")
+
+    def content_key(self, content):
+        return get_content_key(SimpleUploadedFile("license.pdf", content), "shelters")
+
+    def test_small_file_is_stored_without_multipart(self):
+        content = b"%PDF-1.4"
+        with mock.patch.object(self.backend, "create_multipart_upload") as create:
+            handler, file = self.upload(content)
+
+        create.assert_not_called()
+        self.assertIsNone(handler.error)
+        self.assertEqual(file.url, storage.get_url(self.content_key(content)))
+        self.assertEqual(self.backend.objects, {self.content_key(content): content})
+
+    def test_parts_are_copied_from_temp_key_to_content_key(self):
+        # 헤더와 함께 읽힌 첫 1KB 이후부터 16 바이트 단위로 전달됨
+        content = b"%PDF-1.4 " + bytes(range(256)) * 8
+        with mock.patch.object(
+            self.backend, "upload_part", wraps=self.backend.upload_part
+        ) as upload_part:
+            handler, file = self.upload(content)
+
+        self.assertIsNone(handler.error)
+        calls = [call.args for call in upload_part.call_args_list]
+        self.assertGreater(len(calls), 1)
+        self.assertEqual([args[2] for args in calls], list(range(1, len(calls) + 1)))
+        self.assertEqual(b"".join(args[3] for args in calls), content)
+        self.assertRegex(calls[0][0], r"^licenses/[0-9a-f]{32}\.pdf$")
+        # 임시 키는 복사 후 삭제, 내용 기반 키에 전체 내용
+        self.assertEqual(self.backend.objects, {self.content_key(content): content})
+        self.assertEqual(file.url, storage.get_url(self.content_key(content)))
+        self.assertEqual(self.backend._uploads, {})
+
+    def test_signature_mismatch_is_rejected(self):
+        handler, file = self.upload(b"\x89PNG\r\n\x1a\n not a pdf")
+        self.assertIsNone(file)
+        self.assertEqual(handler.error, "파일 내용이 확장자와 일치하지 않습니다.")
+        self.assertEqual(self.backend.objects, {})
+
+    def test_extension_is_rejected(self):
+        handler, file = self.upload(b"MZ binary", filename="license.exe")
+        self.assertIsNone(file)
+        self.assertEqual(handler.error, "JPG, PDF, PNG 형식만 가능합니다.")
+
+    def test_size_limit_aborts_multipart_upload(self):
+        content = b"%PDF-1.4 " + b"x" * 3000
+        with mock.patch.object(
+            self.backend,
+            "abort_multipart_upload",
+            wraps=self.backend.abort_multipart_upload,
+        ) as abort:
+            handler, file = self.upload(content, max_size=2000)
+
+        self.assertIsNone(file)
+        self.assertTrue(handler.error.startswith("파일 크기는"))
+        abort.assert_called_once()
+        self.assertEqual(self.backend._uploads, {})
+        self.assertEqual(self.backend.objects, {})
+
+    def test_failed_part_aborts_upload(self):
+        content = b"%PDF-1.4 " + b"x" * 3000
+        with mock.patch.object(
+            self.backend, "upload_part", side_effect=RuntimeError("timeout")
+        ), mock.patch.object(
+            self.backend,
+            "abort_multipart_upload",
+            wraps=self.backend.abort_multipart_upload,
+        ) as abort:
+            handler, file = self.upload(content)
+
+        self.assertIsNone(file)
+        self.assertEqual(handler.error, "파일 업로드에 실패하였습니다. (timeout)")
+        abort.assert_called_once()
+        self.assertEqual(self.backend.objects, {})
+
+
+class CollectOrphanedFilesTest(InMemoryStorageMixin, TestCase):
+    def upload(self, content, age):
+        key = storage.get_key(upload_file_to_s3(self.license_file(content), "shelters"))
+        self.backend.modified[key] -= age
+        return key
+
+    def test_collects_only_old_unreferenced_files(self):
+        old_orphan = self.upload(b"%PDF- orphan", timedelta(days=2))
+        recent_orphan = self.upload(b"%PDF- recent", timedelta(minutes=5))
+        referenced = self.upload(b"%PDF- license", timedelta(days=2))
+        user = User.objects.create_user(email="shelter@example.com", name="보호소")
+        Shelter.objects.create(
+            user=user, business_license_file=storage.get_url(referenced)
+        )
+
+        call_command("collect_orphaned_files", grace_hours=24, stdout=io.StringIO())
+
+        self.assertEqual(
+            sorted(self.backend.objects), sorted([recent_orphan, referenced])
+        )
+        self.assertNotIn(old_orphan, self.backend.objects)
+
+
+# 🌸 직접 업로드 요청 / 완료 (presigned POST 는 메모리 저장소가 지원하지 않으므로 대체)
+@override_settings(IMAGE_VARIANT_WORKERS=0)
+class DirectUploadTest(InMemoryStorageMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="user@example.com", name="봉사자")
+        shelter_user = User.objects.create_user(
+            email="shelter@example.com", name="보호소", is_shelter=True
+        )
+        cls.shelter = Shelter.objects.create(user=shelter_user, name="댕냥 보호소")
+        cls.recruitment = Recruitment.objects.create(
+            shelter=cls.shelter,
+            date=timezone.now().date() + timedelta(days=7),
+            start_time="10:00",
+            end_time="12:00",
+            type=["walking"],
+        )
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(
+            self.backend,
+            "generate_presigned_post",
+            side_effect=lambda key, *args: {"url": "https://upload", "fields": {}},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = self.client_for(self.user)
+
+    def client_for(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    def intent(self, client=None, **data):
+        data = {"target": "profile_image", "filename": "me.png", "size": 100, **data}
+        return (client or self.client).post("/api/uploads/intent/", data, format="json")
+
+    def confirm(self, upload_token, client=None):
+        return (client or self.client).post(
+            "/api/uploads/confirm/", {"upload_token": upload_token}, format="json"
+        )
+
+    def test_profile_image_upload(self):
+        intent = self.intent().data
+        storage.upload_fileobj(io.BytesIO(self.png_bytes()), intent["key"])
+
+        response = self.confirm(intent["upload_token"])
+        self.assertEqual(response.status_code, 201)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.profile_image, storage.get_url(intent["key"]))
+
+    def test_key_ignores_client_filename(self):
+        for filename in ("../../licenses/evil.png", "a/b/../c.PNG", "이미지.png"):
+            with self.subTest(filename=filename):
+                key = self.intent(filename=filename).data["key"]
+                self.assertRegex(key, r"^users/[0-9a-f]{32}\.png$")
+
+    def test_recruitment_image_upload(self):
+        client = self.client_for(self.shelter.user)
+        intent = self.intent(
+            client,
+            target="recruitment_image",
+            filename="walking.jpg",
+            recruitment_id=self.recruitment.id,
+        ).data
+        storage.upload_fileobj(io.BytesIO(self.png_bytes()), intent["key"])
+
+        response = self.confirm(intent["upload_token"], client)
+        self.assertEqual(response.status_code, 201)
+        # 같은 토큰으로 다시 확인해도 이미지는 1개
+        self.assertEqual(self.confirm(intent["upload_token"], client).status_code, 201)
+        self.assertEqual(
+            list(RecruitmentImage.objects.values_list("id", flat=True)),
+            [response.data["image_id"]],
+        )
+
+    def test_recruitment_image_requires_own_recruitment(self):
+        response = self.intent(
+            target="recruitment_image", recruitment_id=self.recruitment.id
+        )
+        self.assertEqual(response.status_code, 403)
+
+    def test_tampered_token(self):
+        intent = self.intent().data
+        storage.upload_fileobj(io.BytesIO(self.png_bytes()), intent["key"])
+        payload, signature = intent["upload_token"].rsplit(":", 1)
+
+        # 서명이 맞지 않으면 (키를 바꾸거나 서명을 고친 경우) 거부
+        forged = signing.dumps(
+            {
+                **signing.loads(intent["upload_token"], salt=UPLOAD_TOKEN_SALT),
+                "key": "licenses/other.pdf",
+            },
+            salt="other",
+        )
+        for token in (f"{payload}:{signature[::-1]}", forged):
+            with self.subTest(token=token):
+                response = self.confirm(token)
+                self.assertEqual(response.status_code, 400)
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.profile_image)
+
+    def test_token_of_another_user(self):
+        intent = self.intent().data
+        storage.upload_fileobj(io.BytesIO(self.png_bytes()), intent["key"])
+        response = self.confirm(
+            intent["upload_token"], self.client_for(self.shelter.user)
+        )
+        self.assertEqual(response.status_code, 403)
+
+    def test_confirm_without_uploaded_object(self):
+        response = self.confirm(self.intent().data["upload_token"])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["error"], "업로드된 파일을 찾을 수 없습니다.")
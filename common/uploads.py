@@ -0,0 +1,203 @@
+import hashlib
+import io
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, SkipFile
+
+from common.images import schedule_variants
+from common.storage import storage
+from common.utils import (
+    ALLOWED_IMAGE_EXTENSIONS,
+    LICENSE_ALLOWED_EXTENSIONS,
+    LICENSE_MAX_FILE_SIZE_BYTES,
+    MAX_FILE_SIZE_BYTES,
+    get_content_key,
+    get_upload_args,
+    get_upload_key,
+    upload_file_to_s3,
+)
+
+# 🌸 instance_type 별 스트리밍 업로드 제한 (허용 확장자, 최대 크기)
+STREAMING_UPLOAD_LIMITS = {
+    "users": (ALLOWED_IMAGE_EXTENSIONS, MAX_FILE_SIZE_BYTES),
+    "shelters": (LICENSE_ALLOWED_EXTENSIONS, LICENSE_MAX_FILE_SIZE_BYTES),
+    "recruitments": (ALLOWED_IMAGE_EXTENSIONS, MAX_FILE_SIZE_BYTES),
+}
+
+# 🌸 확장자별 파일 시작 바이트 (확장자만 바꾼 파일 차단)
+FILE_SIGNATURES = {
+    "pdf": b"%PDF-",
+    "png": b"\x89PNG\r\n\x1a\n",
+    "jpg": b"\xff\xd8\xff",
+}
+SIGNATURE_LENGTH = max(len(signature) for signature in FILE_SIGNATURES.values())
+
+
+# 🌸 요청 중에 이미 저장소로 올라간 파일 (내용 없이 이름/크기/URL 만 보관)
+class StoredUploadedFile(UploadedFile):
+    def __init__(self, name, size, content_type, url=None):
+        super().__init__(file=None, name=name, content_type=content_type, size=size)
+        self.url = url
+
+
+# 🌸 저장소 스트리밍 업로드 핸들러
+# 기본 핸들러는 파일 전체를 메모리/임시 파일에 모은 뒤 다시 읽어 업로드
+# → 들어오는 조각을 바로 멀티파트 업로드로 전송 (메모리 = 조각 크기 × (동시 전송 수 + 1))
+# 크기 / 시작 바이트 / 내용 해시는 조각을 받는 동안 계산하고,
+# 해시를 알게 되는 마지막에 임시 키 → 내용 기반 키로 저장소 안에서 복사
+# 검증 실패 시 업로드를 취소하고 error 에 메시지를 남긴 뒤 파일을 건너뜀 (request.FILES 에 없음)
+class StreamingStorageUploadHandler(FileUploadHandler):
+    def __init__(self, request, target_field, instance_type):
+        super().__init__(request)
+        self.target_field = target_field
+        self.instance_type = instance_type
+        self.extensions, self.max_size = STREAMING_UPLOAD_LIMITS[instance_type]
+        self.part_size = settings.STORAGE_MULTIPART_PART_SIZE
+        self.concurrency = settings.STORAGE_MULTIPART_CONCURRENCY
+        self.error = None
+        self.executor = None
+
+    def new_file(self, field_name, file_name, *args, **kwargs):
+        super().new_file(field_name, file_name, *args, **kwargs)
+        # 이 핸들러만 설치하므로 대상이 아닌 파일 필드는 받지 않음
+        if field_name != self.target_field:
+            raise SkipFile()
+
+        self.extension = file_name.rsplit(".", 1)[-1].lower()
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.buffer = bytearray()
+        self.checked = False
+        self.temp_key = None
+        self.upload_id = None
+        self.futures = []
+
+        if self.extension not in self.extensions:
+            allowed = ", ".join(sorted(self.extensions)).upper()
+            self.fail(f"{allowed} 형식만 가능합니다.")
+
+    def receive_data_chunk(self, raw_data, start):
+        self.size += len(raw_data)
+        if self.size > self.max_size:
+            max_size_mb = self.max_size // (1024 * 1024)
+            self.fail(f"파일 크기는 {max_size_mb}MB를 초과할 수 없습니다.")
+
+        self.digest.update(raw_data)
+        self.buffer += raw_data
+        if not self.checked and len(self.buffer) >= SIGNATURE_LENGTH:
+            self.check_signature()
+        if len(self.buffer) >= self.part_size:
+            self.send_part()
+        return None
+
+    def file_complete(self, file_size):
+        # 여기서 SkipFile 을 던지면 파서 밖으로 전파되므로 None 반환 (파일 없음)
+        try:
+            if not self.checked:
+                self.check_signature()
+            file = StoredUploadedFile(self.file_name, self.size, self.content_type)
+            key = get_content_key(file, self.instance_type, self.digest.hexdigest())
+            self.store(key)
+        except SkipFile:
+            return None
+        except Exception as e:
+            self.abort()
+            self.error = f"파일 업로드에 실패하였습니다. ({e})"
+            return None
+
+        schedule_variants(key)
+        file.url = storage.get_url(key)
+        return file
+
+    def upload_interrupted(self):
+        self.abort()
+
+    def upload_complete(self):
+        self.shutdown()
+
+    # ✅ 내용 기반 키로 저장 (같은 내용이 이미 있어도 덮어써서 수정 시각 갱신, upload_file_to_s3 참고)
+    def store(self, key):
+        if self.upload_id is None:
+            # 조각 크기보다 작은 파일은 멀티파트 없이 바로 내용 기반 키로 저장
+            storage.upload_fileobj(
+                io.BytesIO(self.buffer), key, extra_args=get_upload_args(key)
+            )
+            return
+
+        if self.buffer:
+            self.send_part()
+        etags = [future.result() for future in self.futures]
+        storage.complete_multipart_upload(self.temp_key, self.upload_id, etags)
+        self.upload_id = None
+        try:
+            storage.copy_object(self.temp_key, key, get_upload_args(key))
+        finally:
+            storage.delete_object(self.temp_key)
+            self.shutdown()
+
+    def send_part(self):
+        if self.upload_id is None:
+            self.temp_key = get_upload_key(self.file_name, self.instance_type)
+            self.upload_id = storage.create_multipart_upload(self.temp_key)
+            self.executor = ThreadPoolExecutor(max_workers=self.concurrency)
+
+        # 동시에 전송 중인 조각 수 제한 (받는 속도가 더 빨라도 메모리가 늘지 않도록)
+        pending = [future for future in self.futures if not future.done()]
+        if len(pending) >= self.concurrency:
+            wait(pending, return_when=FIRST_COMPLETED)
+        for future in self.futures:
+            if future.done() and future.exception():
+                self.fail(f"파일 업로드에 실패하였습니다. ({future.exception()})")
+
+        self.futures.append(
+            self.executor.submit(
+                storage.upload_part,
+                self.temp_key,
+                self.upload_id,
+                len(self.futures) + 1,
+                bytes(self.buffer),
+            )
+        )
+        self.buffer = bytearray()
+
+    def check_signature(self):
+        self.checked = True
+        signature = FILE_SIGNATURES.get(self.extension)
+        if signature and bytes(self.buffer[: len(signature)]) != signature:
+            self.fail("파일 내용이 확장자와 일치하지 않습니다.")
+
+    def fail(self, message):
+        self.error = message
+        self.abort()
+        raise SkipFile(message)
+
+    def abort(self):
+        self.buffer = bytearray()
+        if self.upload_id is not None:
+            upload_id, self.upload_id = self.upload_id, None
+            self.shutdown()
+            try:
+                storage.abort_multipart_upload(self.temp_key, upload_id)
+            except Exception:
+                pass  # 남은 조각은 저장소 수명 주기 규칙 / 정리 명령으로 제거
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+
+# 🌸 요청에 스트리밍 업로드 핸들러 설치 (request.data / request.FILES 를 읽기 전에 호출)
+def use_streaming_upload(request, field_name, instance_type):
+    handler = StreamingStorageUploadHandler(request._request, field_name, instance_type)
+    request._request.upload_handlers = [handler]
+    return handler
+
+
+# 🌸 업로드 파일 → URL (스트리밍으로 이미 저장된 파일이면 다시 올리지 않음)
+def store_uploaded_file(file, instance_type):
+    if isinstance(file, StoredUploadedFile):
+        return file.url
+    return upload_file_to_s3(file, instance_type)
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from .views import UploadConfirmView, UploadIntentView
+
+urlpatterns = [
+    path("intent/", UploadIntentView.as_view(), name="upload-intent"),
+    path("confirm/", UploadConfirmView.as_view(), name="upload-confirm"),
+]
@@ -1,27 +1,49 @@
+import hashlib
+import mimetypes
 import os
+import re
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
-import boto3
+from django.apps import apps
 from django.core.exceptions import ValidationError
 
-from Dangnyang_Heroes.settings import base
+from common.images import get_variant_keys, schedule_variants
+from common.storage import IMMUTABLE_CACHE_CONTROL, storage
 
 # 🌸 허용 확장자 및 파일 크기 제한
 ALLOWED_IMAGE_EXTENSIONS = {"jpg", "png"}
 LICENSE_ALLOWED_EXTENSIONS = {"pdf", "png", "jpg"}
 MAX_FILE_SIZE_MB = 5
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+LICENSE_MAX_FILE_SIZE_MB = 20  # 스캔한 사업자등록증 PDF 는 이미지보다 큼
+LICENSE_MAX_FILE_SIZE_BYTES = LICENSE_MAX_FILE_SIZE_MB * 1024 * 1024
 
+# 🌸 여러 파일 동시 업로드 시 최대 스레드 수
+MAX_UPLOAD_WORKERS = 4
 
-# 🌸 s3_client 생성 함수
+# 🌸 instance_type 별 저장 경로
+UPLOAD_PREFIXES = {
+    "users": "users/",
+    "shelters": "licenses/",
+    "recruitments": "recruitments/",
+}
+
+# 🌸 내용 해시 계산 시 한 번에 읽는 크기
+HASH_CHUNK_SIZE = 64 * 1024
+
+# 🌸 저장소 URL 을 참조하는 필드 (모델 라벨, 필드명)
+# 같은 내용의 파일은 같은 키를 공유하므로, 삭제 전에 이 필드들에서 남은 참조를 확인
+FILE_REFERENCES = [
+    ("recruitments.RecruitmentImage", "image_url"),
+    ("users.User", "profile_image"),
+    ("shelters.Shelter", "business_license_file"),
+]
+
+
+# 🌸 s3_client 조회 함수 (프로세스 공용 클라이언트, common.storage 참고)
 def get_s3_client():
-    return boto3.client(
-        "s3",
-        endpoint_url=base.AWS_S3_ENDPOINT_URL,
-        aws_access_key_id=base.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=base.AWS_SECRET_ACCESS_KEY,
-        region_name=base.AWS_S3_REGION_NAME,
-    )
+    return storage.client
 
 
 # 🌸 파일 확장자 및 크기 검사
@@ -41,64 +63,174 @@ def validate_file_extension(file, instance_type):
         if file_extension not in LICENSE_ALLOWED_EXTENSIONS:
             raise ValidationError("사업자등록증은 PDF, PNG, JPG 형식만 가능합니다.")
 
+        if file.size > LICENSE_MAX_FILE_SIZE_BYTES:
+            raise ValidationError(
+                f"파일 크기는 {LICENSE_MAX_FILE_SIZE_MB}MB를 초과할 수 없습니다."
+            )
+
     elif instance_type == "recruitments":
         if file_extension not in ALLOWED_IMAGE_EXTENSIONS:
             raise ValidationError("이미지는 JPG, PNG 형식만 가능합니다.")
 
 
-# 🌸 UUID + 원본 파일명 + 확장자로 파일명 생성하는 함수"
-def generate_unique_filename(filename):
-    name, ext = os.path.splitext(filename)  # 파일명과 확장자 분리
-    return f"{uuid.uuid4()}_{name}{ext}"
-
+# 🌸 저장 경로(키) 생성: instance_type 별 경로 + UUID + 확장자
+# 클라이언트가 보낸 파일명은 키에 넣지 않음 (파일명의 '/', '..' 로 다른 경로의 키를 만들 수 없도록)
+def get_upload_key(filename, instance_type):
+    if instance_type not in UPLOAD_PREFIXES:
+        raise ValueError(f"Invalid instance type: {instance_type}")
+    extension = os.path.splitext(filename)[1].lower()
+    if not re.fullmatch(r"\.[a-z0-9]+", extension):
+        extension = ""
+    return f"{UPLOAD_PREFIXES[instance_type]}{uuid.uuid4().hex}{extension}"
 
-# 🌸 파일 업로드 (S3에 저장 후 URL 반환)
-def upload_file_to_s3(file, instance_type):
-    s3_client = get_s3_client()
-    validate_file_extension(file, instance_type)
-    unique_filename = generate_unique_filename(file.name)
 
-    # S3 저장 경로 설정
-    if instance_type == "users":
-        s3_path = f"users/{unique_filename}"
-    elif instance_type == "shelters":
-        s3_path = f"licenses/{unique_filename}"
-    elif instance_type == "recruitments":
-        s3_path = f"recruitments/{unique_filename}"
+# 🌸 파일 내용 SHA-256 (청크 단위로 읽어 파일 전체를 메모리에 올리지 않음)
+def get_content_hash(file):
+    digest = hashlib.sha256()
+    file.seek(0)
+    if hasattr(file, "chunks"):
+        chunks = file.chunks(HASH_CHUNK_SIZE)
     else:
+        chunks = iter(lambda: file.read(HASH_CHUNK_SIZE), b"")
+    for chunk in chunks:
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+# 🌸 내용 기반 저장 경로(키): instance_type 별 경로 + 내용 해시 + 확장자
+# 같은 파일은 항상 같은 키 → 중복 업로드 생략, 키가 바뀌지 않으므로 영구 캐시 가능
+def get_content_key(file, instance_type, content_hash=None):
+    if instance_type not in UPLOAD_PREFIXES:
         raise ValueError(f"Invalid instance type: {instance_type}")
+    extension = os.path.splitext(file.name)[1].lower()
+    content_hash = content_hash or get_content_hash(file)
+    return f"{UPLOAD_PREFIXES[instance_type]}{content_hash}{extension}"
+
+
+# 🌸 내용 기반 키 (get_content_key 형식) → 여러 행이 같은 객체를 공유할 수 있음
+CONTENT_KEY_PATTERN = re.compile(
+    "^(?:%s)[0-9a-f]{64}(?:\\.[a-z0-9]+)?$"
+    % "|".join(re.escape(prefix) for prefix in UPLOAD_PREFIXES.values())
+)
+
+
+def is_content_key(key):
+    return bool(CONTENT_KEY_PATTERN.match(key))
+
+
+# 🌸 업로드 시 객체 메타데이터 (공개 읽기 + 영구 캐시)
+def get_upload_args(key):
+    extra_args = {"ACL": "public-read", "CacheControl": IMMUTABLE_CACHE_CONTROL}
+    content_type = mimetypes.guess_type(key)[0]
+    if content_type:
+        extra_args["ContentType"] = content_type
+    return extra_args
+
+
+# 🌸 파일 업로드 (S3에 저장 후 URL 반환)
+# 같은 내용의 객체가 이미 있어도 다시 올림 → 수정 시각이 갱신되어
+# 고아 파일 정리(collect_orphaned_files)의 유예 시간 동안 삭제되지 않음
+# (head_object 로 확인 후 건너뛰면, 확인 직후 정리 명령이 지운 객체를 참조하게 됨)
+def upload_file_to_s3(file, instance_type, content_hash=None):
+    validate_file_extension(file, instance_type)
+    s3_path = get_content_key(file, instance_type, content_hash)
 
     try:
-        s3_client.upload_fileobj(
-            file,
-            base.AWS_STORAGE_BUCKET_NAME,
-            s3_path,
-            ExtraArgs={"ACL": "public-read"},
-        )
-        return f"{base.MEDIA_URL}{s3_path}"
+        storage.upload_fileobj(file, s3_path, extra_args=get_upload_args(s3_path))
     except Exception as e:
         raise RuntimeError(f"S3 Upload Error: {e}")
 
+    # 프로필/봉사활동 이미지는 썸네일/중간 크기 WebP 를 백그라운드에서 생성
+    if get_variant_keys(s3_path):
+        file.seek(0)
+        schedule_variants(s3_path, file.read())
+    return storage.get_url(s3_path)
+
+
+# 🌸 여러 파일 동시 업로드 (공용 클라이언트를 스레드끼리 공유)
+# 하나라도 실패하면 예외 발생 (이미 올라간 파일은 내용 기반 키라 바로 삭제하지 않고
+# 참조되지 않은 채 유예 시간이 지나면 고아 파일 정리 명령(collect_orphaned_files)이 삭제)
+def upload_files_to_s3(files, instance_type):
+    if not files:
+        return []
+
+    workers = min(MAX_UPLOAD_WORKERS, len(files))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(upload_file_to_s3, file, instance_type) for file in files
+        ]
+
+    errors = [future.exception() for future in futures if future.exception()]
+    if errors:
+        raise errors[0]
+    return [future.result() for future in futures]
+
+
+# 🌸 URL 중 아직 DB 에서 참조 중인 것 (FILE_REFERENCES 의 필드 기준)
+def get_referenced_urls(urls):
+    urls = set(urls)
+    referenced = set()
+    if not urls:
+        return referenced
+    for model_label, field in FILE_REFERENCES:
+        model = apps.get_model(model_label)
+        referenced.update(
+            model.objects.filter(**{f"{field}__in": urls}).values_list(field, flat=True)
+        )
+    return referenced
+
 
-# 🌸 파일 삭제
+# 🌸 파일 삭제 (삭제하지 않으면 False 반환)
+# 내용 기반 키는 다른 요청이 같은 파일을 올리는 중일 수 있으므로 바로 삭제하지 않고
+# 유예 시간이 지난 뒤 고아 파일 정리 명령(collect_orphaned_files)에 맡김
+# 업로드마다 고유한 키(UUID)는 참조하는 행이 남아 있지 않을 때만 삭제
+# 호출 전에 DB 의 참조(행 삭제 / 필드 변경)를 먼저 정리해야 함
 def delete_file_from_s3(image_url):
-    s3_client = get_s3_client()
+    if is_content_key(storage.get_key(image_url)):
+        return False
+    if get_referenced_urls([image_url]):
+        return False
 
     try:
-        s3_path = image_url.replace(base.MEDIA_URL, "")
-        s3_client.delete_object(Bucket=base.AWS_STORAGE_BUCKET_NAME, Key=s3_path)
+        s3_path = storage.get_key(image_url)
+        variant_keys = get_variant_keys(s3_path)
+        if variant_keys:
+            storage.delete_objects([s3_path, *variant_keys])
+        else:
+            storage.delete_object(s3_path)
         return True
     except Exception as e:
         raise RuntimeError(f"S3 Delete Error: {e}")
 
 
+# 🌸 여러 파일 삭제 (delete_objects 한 번에 최대 1000개)
+# 내용 기반 키 / 참조 중인 파일은 제외 (delete_file_from_s3 와 같은 기준)
+# 삭제에 실패한 파일 → {URL: 에러 메시지} (변환본 실패도 원본 URL 로 표시)
+def delete_files_from_s3(image_urls):
+    keys = {url: storage.get_key(url) for url in dict.fromkeys(image_urls)}
+    keys = {url: key for url, key in keys.items() if not is_content_key(key)}
+    referenced = get_referenced_urls(keys)
+    key_urls = {}
+    for url, key in keys.items():
+        if url in referenced:
+            continue
+        for object_key in [key, *get_variant_keys(key)]:
+            key_urls[object_key] = url
+
+    if not key_urls:
+        return {}
+    try:
+        errors = storage.delete_objects(list(key_urls))
+    except Exception as e:
+        raise RuntimeError(f"S3 Delete Error: {e}")
+    return {key_urls[error["key"]]: error["error"] for error in errors}
+
+
 # 🌸 ACL 권한 부여 (필요시 공개 권한 부여 등)
 def set_s3_object_acl(file_path, acl="public-read-write"):
-    s3_client = get_s3_client()
     try:
-        s3_client.put_object_acl(
-            Bucket=base.AWS_STORAGE_BUCKET_NAME, Key=file_path, ACL=acl
-        )
+        storage.put_object_acl(file_path, acl)
         return True
     except Exception as e:
         raise RuntimeError(f"S3 ACL 설정 오류: {e}")
@@ -106,7 +238,6 @@ def set_s3_object_acl(file_path, acl="public-read-write"):
 
 # 🌸 CORS 설정
 def configure_s3_cors():
-    s3_client = get_s3_client()
     cors_configuration = {
         "CORSRules": [
             {
@@ -119,9 +250,7 @@ def configure_s3_cors():
         ]
     }
     try:
-        s3_client.put_bucket_cors(
-            Bucket=base.AWS_STORAGE_BUCKET_NAME, CORSConfiguration=cors_configuration
-        )
+        storage.put_bucket_cors(cors_configuration)
         return True
     except Exception as e:
         raise RuntimeError(f"S3 CORS 설정 오류: {e}")
@@ -130,15 +259,11 @@ def configure_s3_cors():
 # 🌸 객체 접근용 Signed URL 생성 (다운로드 등)
 def generate_signed_url(object_url, expiration=300):
     if not object_url:
-        s3_client = get_s3_client()
-        if not object_url:
-            return None
-        try:
-            object_key = object_url.replace(base.MEDIA_URL, "")
-            return s3_client.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": base.AWS_STORAGE_BUCKET_NAME, "Key": object_key},
-                ExpiresIn=expiration,
-            )
-        except Exception as e:
-            raise RuntimeError(f"Signed URL 생성 실패: {e}")
+        return None
+    try:
+        object_key = storage.get_key(object_url)
+        return storage.generate_presigned_url(
+            "get_object", {"Key": object_key}, expiration
+        )
+    except Exception as e:
+        raise RuntimeError(f"Signed URL 생성 실패: {e}")
@@ -1,3 +1,166 @@
-from django.shortcuts import render
+from django.core import signing
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from common.images import schedule_variants
+from common.serializers import (
+    UPLOAD_TARGETS,
+    UploadConfirmSerializer,
+    UploadIntentSerializer,
+)
+from common.storage import storage
+from common.utils import delete_file_from_s3, get_upload_key
+from recruitments.models import Recruitment, RecruitmentImage
+from shelters.models import Shelter
+
+# 🌸 presigned POST 유효 시간(초) / 업로드 토큰 유효 시간(초)
+UPLOAD_EXPIRATION = 600
+UPLOAD_TOKEN_MAX_AGE = 60 * 60
+UPLOAD_TOKEN_SALT = "common.uploads"
+
+
+# 🌸 업로드 대상에 대한 권한 확인 → (보호소, 봉사활동, 에러 메시지)
+def get_upload_owner(user, target, recruitment_id=None):
+    if target == "profile_image":
+        return None, None, None
+
+    shelter = Shelter.objects.filter(user=user).first()
+    if not shelter:
+        return None, None, "보호소 관리자만 업로드할 수 있습니다."
+
+    if target == "recruitment_image":
+        recruitment = Recruitment.objects.filter(
+            id=recruitment_id, shelter=shelter
+        ).first()
+        if not recruitment:
+            return None, None, "해당 봉사활동을 찾을 수 없습니다."
+        return shelter, recruitment, None
+
+    return shelter, None, None
+
+
+# 🌸 직접 업로드 요청 (POST /api/uploads/intent/)
+# 파일은 클라이언트가 저장소로 바로 올리고, 서버는 작은 JSON 요청만 처리
+class UploadIntentView(APIView):
+    permission_classes = [IsAuthenticated]
+    query_budget = {"post": 3}
+
+    @extend_schema(
+        summary="파일 직접 업로드 요청",
+        description="저장소로 바로 업로드할 수 있는 presigned POST 를 발급합니다. "
+        "업로드가 끝나면 upload_token 으로 /api/uploads/confirm/ 을 호출해야 반영됩니다.",
+        request=UploadIntentSerializer,
+        responses={201: dict},
+    )
+    def post(self, request):
+        serializer = UploadIntentSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        config = UPLOAD_TARGETS[data["target"]]
+
+        _, recruitment, error = get_upload_owner(
+            request.user, data["target"], data.get("recruitment_id")
+        )
+        if error:
+            return Response({"error": error}, status=status.HTTP_403_FORBIDDEN)
+
+        key = get_upload_key(data["filename"], config["instance_type"])
+        try:
+            upload = storage.generate_presigned_post(
+                key, data["content_type"], config["max_size"], UPLOAD_EXPIRATION
+            )
+        except NotImplementedError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        upload_token = signing.dumps(
+            {
+                "user": request.user.id,
+                "target": data["target"],
+                "key": key,
+                "recruitment": recruitment.id if recruitment else None,
+            },
+            salt=UPLOAD_TOKEN_SALT,
+        )
+        return Response(
+            {
+                "upload": upload,  # {"url": ..., "fields": {...}} → multipart POST
+                "key": key,
+                "upload_token": upload_token,
+                "expires_in": UPLOAD_EXPIRATION,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+# 🌸 직접 업로드 완료 확인 (POST /api/uploads/confirm/)
+# 저장소에 파일이 실제로 올라갔는지 확인한 뒤 대상 필드/행에 URL 기록
+class UploadConfirmView(APIView):
+    permission_classes = [IsAuthenticated]
+    query_budget = {"post": 8}
+
+    @extend_schema(
+        summary="파일 직접 업로드 완료",
+        request=UploadConfirmSerializer,
+        responses={201: dict},
+    )
+    def post(self, request):
+        serializer = UploadConfirmSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            token = signing.loads(
+                serializer.validated_data["upload_token"],
+                salt=UPLOAD_TOKEN_SALT,
+                max_age=UPLOAD_TOKEN_MAX_AGE,
+            )
+        except signing.BadSignature:
+            return Response(
+                {"error": "유효하지 않거나 만료된 업로드 토큰입니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if token["user"] != request.user.id:
+            return Response(
+                {"error": "업로드 권한이 없습니다."}, status=status.HTTP_403_FORBIDDEN
+            )
+
+        target, key = token["target"], token["key"]
+        shelter, recruitment, error = get_upload_owner(
+            request.user, target, token["recruitment"]
+        )
+        if error:
+            return Response({"error": error}, status=status.HTTP_403_FORBIDDEN)
+
+        if storage.head_object(key) is None:
+            return Response(
+                {"error": "업로드된 파일을 찾을 수 없습니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        url = storage.get_url(key)
+        result = {"target": target, "url": url}
+        schedule_variants(key)
+
+        if target == "recruitment_image":
+            # 같은 토큰으로 다시 호출해도 이미지가 중복 생성되지 않도록 get_or_create
+            image, _ = RecruitmentImage.objects.get_or_create(
+                recruitment=recruitment, image_url=url
+            )
+            result["image_id"] = image.id
+            return Response(result, status=status.HTTP_201_CREATED)
+
+        # 프로필 이미지 / 사업자등록증은 기존 파일을 교체
+        instance = request.user if target == "profile_image" else shelter
+        field = (
+            "profile_image" if target == "profile_image" else "business_license_file"
+        )
+        previous = getattr(instance, field)
+        if previous != url:
+            setattr(instance, field, url)
+            instance.save()
+            if previous:
+                delete_file_from_s3(previous)
+
+        return Response(result, status=status.HTTP_201_CREATED)
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("applications", "0002_search_indexes"),
+        ("histories", "0001_initial"),
+        ("shelters", "0002_search_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="history",
+            index=models.Index(
+                fields=["user", "created_at", "id"], name="histories_user_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+# 신청 1건에 이력이 여러 건이면 먼저 생성된 이력만 남김
+DEDUPE_HISTORIES_SQL = """
+    DELETE FROM histories_history AS history
+    USING histories_history AS other
+    WHERE other.application_id = history.application_id
+      AND other.id < history.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("applications", "0003_application_time_range"),
+        ("histories", "0002_search_indexes"),
+        ("shelters", "0005_file_reference_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunSQL(DEDUPE_HISTORIES_SQL, migrations.RunSQL.noop),
+        migrations.AddConstraint(
+            model_name="history",
+            constraint=models.UniqueConstraint(
+                fields=("application",), name="histories_application_uniq"
+            ),
+        ),
+    ]
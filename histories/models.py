@@ -20,3 +20,17 @@ class History(BaseModel):
 
     def __str__(self):
         return f"{self.user.name} - {self.application.recruitment.date} (완료됨)"
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "created_at", "id"],
+                name="histories_user_idx",
+            ),
+        ]
+        constraints = [
+            # 신청 1건당 이력 1건 (일괄 처리 시 bulk_create(ignore_conflicts=True) 로 중복 생략)
+            models.UniqueConstraint(
+                fields=["application"], name="histories_application_uniq"
+            ),
+        ]
@@ -4,15 +4,20 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from common.pagination import KEYSET_PAGINATION_PARAMETERS, KeysetPagination
 from histories.models import History
 from histories.serializers import HistoryRatingSerializer, HistorySerializer
 
 
 class HistoryAPIView(APIView):
+    query_budget = {"get": 2}
+
     # 봉사자가 완료한 봉사 이력 조회
     @extend_schema(
         summary="완료한 봉사활동 이력 조회",
-        description="봉사자가 완료한 봉사활동 이력을 조회합니다.",
+        description="봉사자가 완료한 봉사활동 이력을 조회합니다. "
+        "다음 페이지 커서는 X-Next-Cursor 헤더로 전달됩니다.",
+        parameters=KEYSET_PAGINATION_PARAMETERS,
         responses={
             200: HistorySerializer(many=True),
             404: {"example": {"error": "완료한 봉사활동 기록이 없습니다."}},
@@ -21,16 +26,19 @@ class HistoryAPIView(APIView):
     def get(self, request):
         histories = History.objects.filter(
             user=request.user, application__status="attended"
-        )
+        ).select_related("shelter", "application__recruitment")
+
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(histories, request)
 
-        if not histories.exists():
+        if not page and not request.query_params.get("cursor"):
             return Response(
                 {"error": "완료한 봉사활동 기록이 없습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = HistorySerializer(histories, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = HistorySerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class HistoryRatingAPIView(APIView):
@@ -0,0 +1,113 @@
+from django.db import connection
+from django.db.models import Count, DateTimeField, Func, Prefetch
+
+from common.images import get_variant_url
+
+from .models import Recruitment, RecruitmentCard, RecruitmentImage
+
+CARD_UPDATE_FIELDS = [
+    "shelter",
+    "shelter_name",
+    "shelter_region",
+    "date",
+    "start_time",
+    "end_time",
+    "type",
+    "supplies",
+    "status",
+    "capacity",
+    "images",
+    "first_image_url",
+    "image_count",
+    "applicant_count",
+    "approved_count",
+    "snapshot_at",
+    "updated_at",
+]
+
+
+# 🧀 봉사활동 1건 → 카드 1행
+def build_recruitment_card(recruitment):
+    # RecruitmentImageSerializer 와 같은 형태
+    images = [
+        {
+            "id": image.id,
+            "image_url": image.image_url,
+            "thumbnail_url": get_variant_url(image.image_url, "thumbnail"),
+            "medium_url": get_variant_url(image.image_url, "medium"),
+        }
+        for image in recruitment.images.all()
+    ]
+    return RecruitmentCard(
+        recruitment_id=recruitment.id,
+        shelter_id=recruitment.shelter_id,
+        shelter_name=recruitment.shelter.name,
+        shelter_region=recruitment.shelter.region,
+        date=recruitment.date,
+        start_time=recruitment.start_time,
+        end_time=recruitment.end_time,
+        type=recruitment.type,
+        supplies=recruitment.supplies,
+        status=recruitment.status,
+        capacity=recruitment.capacity,
+        images=images,
+        first_image_url=images[0]["image_url"] if images else None,
+        image_count=len(images),
+        applicant_count=recruitment.applicant_count,
+        approved_count=recruitment.approved_count,
+        snapshot_at=recruitment.snapshot_at,
+    )
+
+
+# 🧀 카드 upsert: 이미 저장된 카드보다 먼저 읽은 스냅샷이면 덮어쓰지 않음
+# 커밋 후 갱신(on_commit)이 동시에 실행되면 먼저 읽은 쪽이 나중에 쓸 수 있으므로
+# ON CONFLICT ... DO UPDATE 의 WHERE 로 스냅샷 시각을 비교 (bulk_create 는 조건을 지원하지 않음)
+def upsert_recruitment_cards(cards):
+    table = RecruitmentCard._meta.db_table
+    fields = RecruitmentCard._meta.concrete_fields
+    columns = ", ".join(field.column for field in fields)
+    updates = ", ".join(
+        f"{RecruitmentCard._meta.get_field(name).column} = "
+        f"EXCLUDED.{RecruitmentCard._meta.get_field(name).column}"
+        for name in CARD_UPDATE_FIELDS
+    )
+    row = "(" + ", ".join(["%s"] * len(fields)) + ")"
+    params = [
+        field.get_db_prep_save(field.pre_save(card, True), connection)
+        for card in cards
+        for field in fields
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table} ({columns})
+            VALUES {", ".join([row] * len(cards))}
+            ON CONFLICT (recruitment_id) DO UPDATE SET {updates}
+            WHERE {table}.snapshot_at IS NULL
+               OR {table}.snapshot_at <= EXCLUDED.snapshot_at
+            """,
+            params,
+        )
+
+
+# 🧀 봉사활동 카드 다시 계산 (없으면 생성, 있으면 더 최신 스냅샷일 때만 덮어쓰기)
+# 삭제된 봉사활동은 조회되지 않으므로 건너뜀 (카드는 CASCADE 로 함께 삭제)
+def refresh_recruitment_cards(recruitment_ids):
+    recruitments = (
+        Recruitment.objects.filter(id__in=set(recruitment_ids))
+        .select_related("shelter")
+        .prefetch_related(
+            Prefetch("images", queryset=RecruitmentImage.objects.order_by("id"))
+        )
+        .annotate(
+            applicant_count=Count("applications"),
+            # 조회 시작 시각 = 카드가 반영한 원본 상태의 시점
+            snapshot_at=Func(
+                function="statement_timestamp", output_field=DateTimeField()
+            ),
+        )
+    )
+    cards = [build_recruitment_card(recruitment) for recruitment in recruitments]
+    if cards:
+        upsert_recruitment_cards(cards)
+    return len(cards)
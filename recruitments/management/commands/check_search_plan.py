@@ -0,0 +1,83 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from recruitments.models import RecruitmentCard
+from recruitments.search import CARD_ORDERING, search_recruitment_cards
+from shelters.models import RegionChoices
+
+# 이 행 수보다 작은 테이블은 플래너가 정상적으로 Seq Scan 을 고르므로
+# enable_seqscan 을 끄고 "인덱스로 처리 가능한지" 만 확인
+SMALL_TABLE_ROWS = 10000
+
+
+class Command(BaseCommand):
+    help = "봉사활동 검색 쿼리의 EXPLAIN 결과를 확인해 recruitment_cards 테이블 Seq Scan 을 검출합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--region", default=",".join(RegionChoices.values[:3]))
+        parser.add_argument("--days", type=int, default=30)
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument(
+            "--analyze", action="store_true", help="EXPLAIN ANALYZE 로 실제 실행"
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("PostgreSQL 에서만 실행할 수 있습니다.")
+
+        today = datetime.date.today()
+        end = today + datetime.timedelta(days=options["days"])
+        cases = {
+            "region": {"region": options["region"]},
+            "date_range": {"start_date": str(today), "end_date": str(end)},
+            "region_date_time": {
+                "region": options["region"],
+                "start_date": str(today),
+                "end_date": str(end),
+                "start_time": "09:00",
+                "end_time": "12:00",
+            },
+            "type_any": {"type": "walking,cleaning"},
+            "type_all": {"type": "walking,cleaning", "type_match": "all"},
+            "open_date_range": {
+                "start_date": str(today),
+                "end_date": str(end),
+                "status": "open",
+            },
+        }
+
+        failures = []
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [RecruitmentCard._meta.db_table],
+                )
+                row = cursor.fetchone()
+                rows = row[0] if row else 0
+                if rows < SMALL_TABLE_ROWS:
+                    self.stdout.write(
+                        f"recruitment_cards 추정 행 수 {rows} < {SMALL_TABLE_ROWS}: "
+                        "enable_seqscan=off 로 인덱스 경로만 확인합니다."
+                    )
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+
+            for name, params in cases.items():
+                queryset = search_recruitment_cards(params).order_by(*CARD_ORDERING)
+                plan = queryset[: options["page_size"] + 1].explain(
+                    analyze=options["analyze"]
+                )
+                seq_scan = f"Seq Scan on {RecruitmentCard._meta.db_table}"
+                ok = seq_scan not in plan
+                style = self.style.SUCCESS if ok else self.style.ERROR
+                self.stdout.write(style(f"[{'OK' if ok else 'SEQ SCAN'}] {name}"))
+                self.stdout.write(plan)
+                if not ok:
+                    failures.append(name)
+
+        if failures:
+            raise CommandError(
+                f"인덱스를 사용하지 않는 검색 조건: {', '.join(failures)}"
+            )
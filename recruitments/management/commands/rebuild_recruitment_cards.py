@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from recruitments.cards import refresh_recruitment_cards
+from recruitments.models import Recruitment
+
+
+class Command(BaseCommand):
+    help = "봉사활동 카드(recruitment_cards) 읽기 모델을 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        ids = Recruitment.objects.order_by("id").values_list("id", flat=True)
+
+        total = 0
+        last_id = 0
+        while True:
+            batch = list(ids.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            total += refresh_recruitment_cards(batch)
+            last_id = batch[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"봉사활동 카드 갱신 완료: {total}건"))
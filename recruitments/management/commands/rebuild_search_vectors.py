@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from recruitments.models import Recruitment, recruitment_search_vector
+from shelters.models import Shelter, shelter_search_vector
+
+
+class Command(BaseCommand):
+    help = "보호소/봉사활동 키워드 검색 벡터(search_vector)를 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        shelters = Shelter.objects.update(search_vector=shelter_search_vector())
+        recruitments = Recruitment.objects.update(
+            search_vector=recruitment_search_vector()
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"검색 벡터 갱신 완료: 보호소 {shelters}건, 봉사활동 {recruitments}건"
+            )
+        )
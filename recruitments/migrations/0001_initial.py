@@ -0,0 +1,68 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("shelters", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Recruitment",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("date", models.DateField()),
+                ("start_time", models.TimeField()),
+                ("end_time", models.TimeField()),
+                ("type", models.JSONField(default=list)),
+                ("supplies", models.CharField(blank=True, max_length=200, null=True)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("open", "Open"), ("closed", "Closed")],
+                        default="open",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "shelter",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="recruitments",
+                        to="shelters.shelter",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "recruitments",
+            },
+        ),
+        migrations.CreateModel(
+            name="RecruitmentImage",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("image_url", models.URLField()),
+                (
+                    "recruitment",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="images",
+                        to="recruitments.recruitment",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "recruitment_images",
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recruitments", "0001_initial"),
+        ("shelters", "0002_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="recruitment",
+            index=models.Index(
+                fields=["date", "start_time", "id"], name="recruitments_date_start_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="recruitment",
+            index=models.Index(
+                fields=["shelter", "date", "start_time"],
+                name="recruitments_shelter_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="recruitment",
+            index=models.Index(
+                condition=models.Q(("status", "open")),
+                fields=["date", "start_time", "end_time"],
+                name="recruitments_open_date_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+# 검색 벡터 채우기 (이후 변경은 recruitments/signals.py 에서 갱신)
+def fill_search_vectors(apps, schema_editor):
+    Recruitment = apps.get_model("recruitments", "Recruitment")
+    Recruitment.objects.update(
+        search_vector=SearchVector("supplies", weight="B", config="simple")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recruitments", "0002_search_indexes"),
+        ("shelters", "0003_search_vector"),
+    ]
+
+    operations = [
+        # 키워드 부분 일치용 trigram 인덱스 (gin_trgm_ops)
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="recruitment",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(fill_search_vectors, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="recruitment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="recruitments_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="recruitment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["supplies"],
+                name="recruitments_supplies_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recruitments", "0003_search_vector"),
+        ("shelters", "0003_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="recruitment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["type"], name="recruitments_type_gin_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,141 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Prefetch, Q
+
+BACKFILL_BATCH_SIZE = 500
+
+
+# 기존 봉사활동 카드 채우기 (이후 변경은 recruitments/signals.py 에서 갱신)
+def fill_recruitment_cards(apps, schema_editor):
+    Recruitment = apps.get_model("recruitments", "Recruitment")
+    RecruitmentCard = apps.get_model("recruitments", "RecruitmentCard")
+    RecruitmentImage = apps.get_model("recruitments", "RecruitmentImage")
+
+    recruitments = (
+        Recruitment.objects.select_related("shelter")
+        .prefetch_related(
+            Prefetch("images", queryset=RecruitmentImage.objects.order_by("id"))
+        )
+        .annotate(
+            applicant_count=Count("applications"),
+            approved_count=Count(
+                "applications", filter=Q(applications__status="approved")
+            ),
+        )
+        .order_by("id")
+    )
+    cards = []
+    for recruitment in recruitments.iterator(chunk_size=BACKFILL_BATCH_SIZE):
+        images = [
+            {"id": image.id, "image_url": image.image_url}
+            for image in recruitment.images.all()
+        ]
+        cards.append(
+            RecruitmentCard(
+                recruitment_id=recruitment.id,
+                shelter_id=recruitment.shelter_id,
+                shelter_name=recruitment.shelter.name,
+                shelter_region=recruitment.shelter.region,
+                date=recruitment.date,
+                start_time=recruitment.start_time,
+                end_time=recruitment.end_time,
+                type=recruitment.type,
+                supplies=recruitment.supplies,
+                status=recruitment.status,
+                images=images,
+                first_image_url=images[0]["image_url"] if images else None,
+                image_count=len(images),
+                applicant_count=recruitment.applicant_count,
+                approved_count=recruitment.approved_count,
+            )
+        )
+        if len(cards) >= BACKFILL_BATCH_SIZE:
+            RecruitmentCard.objects.bulk_create(cards)
+            cards = []
+    RecruitmentCard.objects.bulk_create(cards)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("applications", "0002_search_indexes"),
+        ("recruitments", "0004_type_index"),
+        ("shelters", "0004_location"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RecruitmentCard",
+            fields=[
+                (
+                    "recruitment",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="card",
+                        serialize=False,
+                        to="recruitments.recruitment",
+                    ),
+                ),
+                (
+                    "shelter_name",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "shelter_region",
+                    models.CharField(blank=True, max_length=20, null=True),
+                ),
+                ("date", models.DateField()),
+                ("start_time", models.TimeField()),
+                ("end_time", models.TimeField()),
+                ("type", models.JSONField(default=list)),
+                ("supplies", models.CharField(blank=True, max_length=200, null=True)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("open", "Open"), ("closed", "Closed")], max_length=20
+                    ),
+                ),
+                ("images", models.JSONField(default=list)),
+                ("first_image_url", models.URLField(blank=True, null=True)),
+                ("image_count", models.PositiveIntegerField(default=0)),
+                ("applicant_count", models.PositiveIntegerField(default=0)),
+                ("approved_count", models.PositiveIntegerField(default=0)),
+                ("snapshot_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "shelter",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="shelters.shelter",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "recruitment_cards",
+                "indexes": [
+                    models.Index(
+                        fields=["date", "start_time", "recruitment"],
+                        name="recruitment_cards_date_idx",
+                    ),
+                    models.Index(
+                        fields=["shelter_region", "date", "start_time"],
+                        name="recruitment_cards_region_idx",
+                    ),
+                    models.Index(
+                        condition=models.Q(("status", "open")),
+                        fields=["date", "start_time", "end_time"],
+                        name="recruitment_cards_open_idx",
+                    ),
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["type"], name="recruitment_cards_type_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.RunPython(fill_recruitment_cards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recruitments", "0005_recruitment_card"),
+        ("shelters", "0004_location"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="recruitmentcard",
+            index=models.Index(fields=["updated_at"], name="recruitment_cards_mod_idx"),
+        ),
+    ]
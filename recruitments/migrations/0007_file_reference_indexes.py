@@ -0,0 +1,17 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recruitments", "0006_card_updated_at_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="recruitmentimage",
+            index=models.Index(fields=["image_url"], name="recruitment_images_url_idx"),
+        ),
+    ]
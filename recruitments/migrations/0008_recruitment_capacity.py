@@ -0,0 +1,55 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+from django.db import migrations, models
+
+# 기존 신청으로 인원 카운터 채우기 (applications.slots.SLOT_COUNTERS 와 같은 기준)
+# 카드의 승인 인원도 참석/불참을 포함하는 카운터 값으로 맞춤
+FILL_SLOT_COUNTERS_SQL = """
+    UPDATE recruitments AS recruitment
+    SET approved_count = (
+            SELECT count(*) FROM applications_application AS application
+            WHERE application.recruitment_id = recruitment.id
+              AND application.status IN ('approved', 'attended', 'absence')
+        ),
+        pending_count = (
+            SELECT count(*) FROM applications_application AS application
+            WHERE application.recruitment_id = recruitment.id
+              AND application.status = 'pending'
+        );
+    UPDATE recruitment_cards AS card
+    SET approved_count = recruitment.approved_count
+    FROM recruitments AS recruitment
+    WHERE card.recruitment_id = recruitment.id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("applications", "0003_application_time_range"),
+        ("recruitments", "0007_file_reference_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="recruitment",
+            name="approved_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="recruitment",
+            name="capacity",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="recruitment",
+            name="pending_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="recruitmentcard",
+            name="capacity",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.RunSQL(FILL_SLOT_COUNTERS_SQL, migrations.RunSQL.noop),
+    ]
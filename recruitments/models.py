@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 
 from common.models import BaseModel
@@ -16,6 +18,13 @@ class RecruitmentStatus(models.TextChoices):
     CLOSED = "closed", "Closed"
 
 
+# 🧀 남은 자리 (정원이 없으면 None)
+def get_remaining_slots(capacity, approved_count):
+    if capacity is None:
+        return None
+    return max(capacity - approved_count, 0)
+
+
 # ✅ description 필드를 선택형 필드로 수정
 class DescriptionChoices(models.TextChoices):
     CLEANING = "cleaning", "시설 청소"
@@ -38,12 +47,54 @@ class Recruitment(BaseModel):
     status = models.CharField(
         max_length=20, choices=RecruitmentStatus.choices, default=RecruitmentStatus.OPEN
     )  # 모집 상태 (진행 중 / 마감)
+    capacity = models.PositiveIntegerField(
+        null=True, blank=True
+    )  # 정원 (없으면 제한 없음)
+    # 신청 인원 카운터 (applications.slots 에서 F() 식으로만 갱신)
+    approved_count = models.PositiveIntegerField(default=0, editable=False)
+    pending_count = models.PositiveIntegerField(default=0, editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)  # 키워드 검색용
 
     def __str__(self):
         return f"{self.shelter.name} - {self.date} ({self.get_status_display()})"
 
+    @property
+    def remaining_slots(self):
+        return get_remaining_slots(self.capacity, self.approved_count)
+
     class Meta:
         db_table = "recruitments"
+        indexes = [
+            # 목록/검색 정렬 및 키셋 페이지네이션 (date, start_time, id)
+            models.Index(
+                fields=["date", "start_time", "id"],
+                name="recruitments_date_start_idx",
+            ),
+            # 지역 검색: shelters.region 으로 찾은 보호소별 날짜 범위 탐색
+            models.Index(
+                fields=["shelter", "date", "start_time"],
+                name="recruitments_shelter_date_idx",
+            ),
+            # 모집 중인 봉사활동만 날짜/시간으로 조회 (부분 인덱스)
+            models.Index(
+                fields=["date", "start_time", "end_time"],
+                name="recruitments_open_date_idx",
+                condition=models.Q(status="open"),
+            ),
+            GinIndex(fields=["search_vector"], name="recruitments_search_vector_idx"),
+            # 활동 유형 필터 (jsonb ?| / @> 연산자)
+            GinIndex(fields=["type"], name="recruitments_type_gin_idx"),
+            GinIndex(
+                fields=["supplies"],
+                name="recruitments_supplies_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
+
+
+# 🧀 봉사활동 검색 벡터 (준비물)
+def recruitment_search_vector():
+    return SearchVector("supplies", weight="B", config="simple")
 
 
 class RecruitmentImage(BaseModel):
@@ -58,3 +109,66 @@ class RecruitmentImage(BaseModel):
 
     class Meta:
         db_table = "recruitment_images"
+        indexes = [
+            # 파일 삭제 전 참조 확인 (common.utils.get_referenced_urls)
+            models.Index(fields=["image_url"], name="recruitment_images_url_idx"),
+        ]
+
+
+# 🧀 봉사활동 목록/검색용 읽기 모델 (봉사활동 1건당 1행)
+# 보호소 이름/지역, 이미지, 신청자 수를 미리 펼쳐 두어 목록 조회 시 조인 없이 단일 테이블만 조회
+# recruitments/signals.py 에서 봉사활동/이미지/보호소/신청 변경 시 갱신 (cards.py 참고)
+class RecruitmentCard(models.Model):
+    recruitment = models.OneToOneField(
+        Recruitment, on_delete=models.CASCADE, primary_key=True, related_name="card"
+    )
+    shelter = models.ForeignKey(Shelter, on_delete=models.CASCADE, related_name="+")
+    shelter_name = models.CharField(max_length=255, null=True, blank=True)
+    shelter_region = models.CharField(max_length=20, null=True, blank=True)
+    date = models.DateField()
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+    type = models.JSONField(default=list)
+    supplies = models.CharField(max_length=200, null=True, blank=True)
+    status = models.CharField(max_length=20, choices=RecruitmentStatus.choices)
+    capacity = models.PositiveIntegerField(null=True, blank=True)
+    images = models.JSONField(default=list)  # RecruitmentImageSerializer 형태의 목록
+    first_image_url = models.URLField(null=True, blank=True)
+    image_count = models.PositiveIntegerField(default=0)
+    applicant_count = models.PositiveIntegerField(default=0)  # 전체 신청 수
+    approved_count = models.PositiveIntegerField(
+        default=0
+    )  # 승인된 신청 수 (참석/불참 포함)
+    # 카드를 만들 때 원본을 읽은 시각 (늦게 도착한 이전 스냅샷의 덮어쓰기 방지)
+    snapshot_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Card {self.recruitment_id} - {self.shelter_name} ({self.date})"
+
+    @property
+    def remaining_slots(self):
+        return get_remaining_slots(self.capacity, self.approved_count)
+
+    class Meta:
+        db_table = "recruitment_cards"
+        indexes = [
+            # 목록 정렬 및 키셋 페이지네이션 (date, start_time, recruitment_id)
+            models.Index(
+                fields=["date", "start_time", "recruitment"],
+                name="recruitment_cards_date_idx",
+            ),
+            # 지역 + 날짜 범위 검색
+            models.Index(
+                fields=["shelter_region", "date", "start_time"],
+                name="recruitment_cards_region_idx",
+            ),
+            models.Index(
+                fields=["date", "start_time", "end_time"],
+                name="recruitment_cards_open_idx",
+                condition=models.Q(status="open"),
+            ),
+            GinIndex(fields=["type"], name="recruitment_cards_type_idx"),
+            # 목록 조건부 GET 검증값 (MAX(updated_at))
+            models.Index(fields=["updated_at"], name="recruitment_cards_mod_idx"),
+        ]
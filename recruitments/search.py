@@ -0,0 +1,215 @@
+import calendar
+import datetime
+
+from django.contrib.postgres.search import SearchRank, TrigramWordSimilarity
+from django.db.models import Count, F, FloatField, Q, Value
+from django.db.models.functions import Cast, Coalesce
+from django.utils.dateparse import parse_date, parse_time
+
+from common.geo import filter_within_radius
+from common.searchcache import SearchCache
+from shelters.models import Shelter
+from shelters.search import get_search_query, shelter_keyword_q, shelter_keyword_rank
+
+from .models import Recruitment, RecruitmentCard, RecruitmentStatus
+from .serializers import recruitment_types
+
+MAX_SEARCH_REGIONS = 3
+
+# 봉사활동 목록 정렬 키 (봉사 날짜 → 시작 시간 → id)
+RECRUITMENT_ORDERING = ("date", "start_time", "id")
+# 봉사활동 카드 정렬 키 (카드의 기본 키는 recruitment_id)
+CARD_ORDERING = ("date", "start_time", "recruitment_id")
+# 키워드 검색 시 정렬 키 (관련도 → id)
+KEYWORD_ORDERING = ("-search_rank", "id")
+# 주변 검색 시 정렬 키 (거리 → id)
+DISTANCE_ORDERING = ("distance", "id")
+
+
+# 🧀 검색 결과 캐시 (페이지네이션 파라미터까지 키에 포함)
+recruitment_search_cache = SearchCache(
+    "recruitments",
+    max_regions=MAX_SEARCH_REGIONS,
+    date_params=("start_date", "end_date"),
+    time_params=("start_time", "end_time"),
+    list_params=("type",),
+    other_params=("type_match", "q", "status", "cursor", "page_size"),
+)
+
+# 🧀 월별 달력 집계 캐시 (월 + 지역 단위)
+recruitment_calendar_cache = SearchCache(
+    "recruitment-calendar",
+    max_regions=MAX_SEARCH_REGIONS,
+    other_params=("month",),
+)
+
+
+# 🧀 존재하지 않는 날짜/시간(2024-02-30, 25:00)은 조건이 없는 것으로 처리
+def parse_param(parser, value):
+    try:
+        return parser(value) if value else None
+    except ValueError:
+        return None
+
+
+# 🧀 검색 조건(지역, 날짜, 시간, 상태, 유형) → 봉사활동 / 봉사활동 카드 queryset
+# RecruitmentSearchView 와 check_search_plan 커맨드가 같은 조건을 사용
+def filter_recruitments(queryset, params, region_field="shelter__region"):
+    # ✅ 지역 필터링
+    region_param = params.get("region")
+    regions = region_param.split(",") if region_param else []
+
+    if regions:
+        # 최대 3개까지 처리, OR 대신 IN 으로 묶어 shelters.region 인덱스 사용
+        regions = [region.strip() for region in regions[:MAX_SEARCH_REGIONS]]
+        queryset = queryset.filter(**{f"{region_field}__in": regions})
+
+    # ✅ 날짜 범위 필터링
+    start_date = parse_param(parse_date, params.get("start_date"))
+    end_date = parse_param(parse_date, params.get("end_date"))
+    if start_date and end_date:
+        queryset = queryset.filter(date__range=[start_date, end_date])
+
+    # ✅ 시간 필터링
+    start_time = parse_param(parse_time, params.get("start_time"))
+    end_time = parse_param(parse_time, params.get("end_time"))
+
+    if start_time and end_time:
+        queryset = queryset.filter(
+            start_time__lt=end_time,
+            end_time__gt=start_time,
+        )
+
+    # ✅ 모집 상태 필터링 (open / closed)
+    recruitment_status = params.get("status")
+    if recruitment_status:
+        queryset = queryset.filter(status=recruitment_status)
+
+    # ✅ 활동 유형 필터링 (any: 하나라도 포함 / all: 모두 포함)
+    type_param = params.get("type")
+    types = (
+        [t.strip() for t in type_param.split(",") if t.strip()] if type_param else []
+    )
+    if types:
+        if params.get("type_match") == "all":
+            queryset = queryset.filter(type__contains=types)
+        else:
+            queryset = queryset.filter(type__has_any_keys=types)
+
+    return queryset
+
+
+def get_search_keyword(params):
+    return (params.get("q") or "").strip()
+
+
+# 🧀 키워드 조건: 준비물 tsvector/trigram 일치 또는 보호소 이름/주소 일치
+# 보호소 조건은 서브쿼리로 분리해 각 테이블의 GIN 인덱스를 따로 사용
+# 점수는 커서로 그대로 왕복할 수 있도록 double precision 으로 변환 (real 은 오차 발생)
+def filter_recruitments_by_keyword(queryset, keyword):
+    matching_shelters = Shelter.objects.filter(shelter_keyword_q(keyword)).values("id")
+    rank = (
+        Coalesce(
+            SearchRank(F("search_vector"), get_search_query(keyword)),
+            Value(0.0),
+            output_field=FloatField(),
+        )
+        + Coalesce(
+            TrigramWordSimilarity(keyword, "supplies"),
+            Value(0.0),
+            output_field=FloatField(),
+        )
+        + shelter_keyword_rank(keyword, prefix="shelter__")
+    )
+    return queryset.filter(
+        Q(search_vector=get_search_query(keyword))
+        | Q(supplies__trigram_word_similar=keyword)
+        | Q(shelter__in=matching_shelters)
+    ).annotate(search_rank=Cast(rank, FloatField()))
+
+
+def get_search_ordering(params):
+    if get_search_keyword(params):
+        return KEYWORD_ORDERING
+    return CARD_ORDERING
+
+
+# 🧀 주변 봉사활동: 보호소 위치 기준 반경 내, 오늘 이후 모집 중인 봉사활동
+def nearby_recruitments(lat, lng, radius_km, params):
+    queryset = search_recruitments(params).filter(
+        status=RecruitmentStatus.OPEN, date__gte=datetime.date.today()
+    )
+    return filter_within_radius(
+        queryset,
+        lat,
+        lng,
+        radius_km,
+        lat_field="shelter__latitude",
+        lng_field="shelter__longitude",
+    )
+
+
+def search_recruitments(params):
+    queryset = Recruitment.objects.select_related("shelter").prefetch_related("images")
+    queryset = filter_recruitments(queryset, params)
+
+    # ✅ 키워드 검색 (보호소 이름/주소, 준비물)
+    keyword = get_search_keyword(params)
+    if keyword:
+        queryset = filter_recruitments_by_keyword(queryset, keyword)
+    return queryset
+
+
+# 🧀 키워드 없는 검색은 카드 테이블만 조회 (보호소/이미지 조인 없음)
+# 키워드 검색은 검색 벡터와 보호소 이름/주소 점수가 필요하므로 search_recruitments 사용
+def search_recruitment_cards(params):
+    return filter_recruitments(
+        RecruitmentCard.objects.all(), params, region_field="shelter_region"
+    )
+
+
+# 🧀 "YYYY-MM" → 해당 월의 첫날 / 마지막 날 (형식이 틀리면 None)
+def parse_month(value):
+    try:
+        first = datetime.datetime.strptime(value, "%Y-%m").date()
+    except (TypeError, ValueError):
+        return None
+    last = first.replace(day=calendar.monthrange(first.year, first.month)[1])
+    return first, last
+
+
+# 🧀 월별 달력: 날짜 × 지역별 모집 중인 봉사활동 수 (활동 유형별 수 포함)
+# 카드 테이블에서 GROUP BY 한 번으로 집계 (recruitment_cards_open_idx 부분 인덱스 사용)
+def recruitment_calendar(first, last, params):
+    queryset = filter_recruitments(
+        RecruitmentCard.objects.filter(
+            status=RecruitmentStatus.OPEN, date__range=[first, last]
+        ),
+        {"region": params.get("region")},
+        region_field="shelter_region",
+    )
+    rows = (
+        queryset.values("date", "shelter_region")
+        .annotate(
+            total=Count("pk"),
+            **{
+                name: Count("pk", filter=Q(type__contains=[name]))
+                for name in recruitment_types
+            },
+        )
+        .order_by("date", "shelter_region")
+    )
+
+    days = {}
+    for row in rows:
+        day = days.setdefault(
+            row["date"].isoformat(),
+            {"date": row["date"].isoformat(), "total": 0, "regions": {}},
+        )
+        day["total"] += row["total"]
+        day["regions"][row["shelter_region"] or ""] = {
+            "total": row["total"],
+            # 0 건인 유형은 생략해 응답 크기를 줄임
+            "types": {name: row[name] for name in recruitment_types if row[name]},
+        }
+    return list(days.values())
@@ -1,17 +1,48 @@
+import datetime
+
+from django.db import transaction
 from drf_spectacular.utils import OpenApiExample, extend_schema_serializer
 from rest_framework import serializers
 
 from applications.models import Application
+from applications.slots import update_capacity
+from common.serializers import ImageVariantField
 from users.models import User
 
-from .models import Recruitment, RecruitmentImage
+from .models import (
+    Recruitment,
+    RecruitmentCard,
+    RecruitmentImage,
+)
+from .signals import sync_slot_changes
 
 
 # 이미지 조회 serializer
 class RecruitmentImageSerializer(serializers.ModelSerializer):
+    # 목록에서는 원본 대신 WebP 변환본 사용
+    # 업로드 직후 변환본 생성 전에는 404 → 클라이언트가 image_url 로 대체
+    thumbnail_url = ImageVariantField("thumbnail", source="image_url")
+    medium_url = ImageVariantField("medium", source="image_url")
+
     class Meta:
         model = RecruitmentImage
-        fields = ["id", "image_url"]
+        fields = ["id", "image_url", "thumbnail_url", "medium_url"]
+
+
+# 이미지 일괄 삭제 serializer (delete_objects 한 번에 처리할 수 있는 최대 1000개)
+@extend_schema_serializer(
+    examples=[
+        OpenApiExample(
+            name="이미지 일괄 삭제",
+            value={"image_ids": [1, 2, 3]},
+            request_only=True,
+        )
+    ]
+)
+class RecruitmentImageBulkDeleteSerializer(serializers.Serializer):
+    image_ids = serializers.ListField(
+        child=serializers.IntegerField(), min_length=1, max_length=1000
+    )
 
 
 # ✅ 봉사활동 시리얼라이저
@@ -19,6 +50,8 @@ class RecruitmentSerializer(serializers.ModelSerializer):
     shelter_name = serializers.CharField(source="shelter.name", read_only=True)
     shelter_region = serializers.CharField(source="shelter.region", read_only=True)
     images = RecruitmentImageSerializer(many=True, read_only=True)
+    # 정원 - 승인 인원 (카운터 컬럼으로 계산, 행마다 COUNT 하지 않음)
+    remaining_slots = serializers.IntegerField(read_only=True, allow_null=True)
 
     class Meta:
         model = Recruitment
@@ -33,12 +66,60 @@ class RecruitmentSerializer(serializers.ModelSerializer):
             "supplies",
             "shelter_region",
             "status",
+            "capacity",
+            "remaining_slots",
             "images",
         ]
+        # 정원 0 은 모집 중인데 아무도 승인할 수 없는 상태 → 제한 없음은 null 로 지정
+        extra_kwargs = {"capacity": {"min_value": 1}}
+
+    def update(self, instance, validated_data):
+        # 인원 카운터는 F() 식으로만 갱신하므로 수정한 필드만 저장 (동시 승인 덮어쓰기 방지)
+        capacity_changed = "capacity" in validated_data
+        capacity = validated_data.pop("capacity", None)
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, "updated_at"])
+
+        # 정원은 승인 인원과 같은 UPDATE 에서 비교 (읽어 둔 승인 인원은 그 사이 바뀔 수 있음)
+        # 호출하는 쪽에서 트랜잭션으로 감싸므로 실패하면 다른 필드 변경도 함께 롤백
+        if capacity_changed:
+            updated, _ = update_capacity(instance.pk, capacity)
+            if not updated:
+                raise serializers.ValidationError(
+                    {"capacity": "정원은 승인된 인원보다 적을 수 없습니다."}
+                )
+            instance.refresh_from_db(
+                fields=["capacity", "status", "approved_count", "updated_at"]
+            )
+            sync_slot_changes([instance.pk])
+        return instance
+
+
+# ✅ 주변 봉사활동 시리얼라이저 (거리 포함)
+class RecruitmentNearbySerializer(RecruitmentSerializer):
+    distance = serializers.FloatField(read_only=True)  # km
+
+    class Meta(RecruitmentSerializer.Meta):
+        fields = RecruitmentSerializer.Meta.fields + ["distance"]
+
+
+# ✅ 봉사활동 카드 시리얼라이저 (RecruitmentSerializer 와 같은 응답 형태)
+class RecruitmentCardSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(source="recruitment_id", read_only=True)
+    shelter = serializers.IntegerField(source="shelter_id", read_only=True)
+
+    class Meta:
+        model = RecruitmentCard
+        fields = RecruitmentSerializer.Meta.fields
 
 
 recruitment_types = ["cleaning", "walking", "feeding", "bathing", "playing"]
 
+# 반복 등록 주기 (일 단위 간격) 및 한 번에 만들 수 있는 최대 일정 수
+RECURRENCE_INTERVALS = {"weekly": 7, "biweekly": 14}
+MAX_RECURRENCE_COUNT = 100
+
 
 # ✅ 봉사활동 등록/수정 시리얼라이저
 @extend_schema_serializer(
@@ -54,11 +135,42 @@ recruitment_types = ["cleaning", "walking", "feeding", "bathing", "playing"]
                 "images": ["이미지1", "이미지2"],
             },
             request_only=True,
-        )
+        ),
+        OpenApiExample(
+            name="봉사활동 반복 등록 (매주)",
+            value={
+                "date": "2025-04-01",
+                "start_time": "10:00",
+                "end_time": "13:00",
+                "type": "walking",
+                "recurrence": "weekly",
+                "until": "2025-06-30",
+                "images": ["이미지1"],
+            },
+            request_only=True,
+        ),
+        OpenApiExample(
+            name="봉사활동 반복 등록 (날짜 지정)",
+            value={
+                "start_time": "10:00",
+                "end_time": "13:00",
+                "type": "cleaning",
+                "dates": ["2025-04-01", "2025-04-03", "2025-04-10"],
+            },
+            request_only=True,
+        ),
     ]
 )
 class RecruitmentCreateUpdateSerializer(serializers.ModelSerializer):
     images = serializers.ListField(child=serializers.ImageField(), required=False)
+    # ✅ 반복 등록: recurrence + until 또는 dates(날짜 목록) 중 하나로 지정
+    recurrence = serializers.ChoiceField(
+        choices=list(RECURRENCE_INTERVALS), required=False, write_only=True
+    )
+    until = serializers.DateField(required=False, write_only=True)
+    dates = serializers.ListField(
+        child=serializers.DateField(), required=False, write_only=True
+    )
 
     class Meta:
         model = Recruitment
@@ -68,10 +180,16 @@ class RecruitmentCreateUpdateSerializer(serializers.ModelSerializer):
             "end_time",
             "type",  # ✅ 필수 값으로 설정
             "supplies",
+            "capacity",
             "images",
+            "recurrence",
+            "until",
+            "dates",
         ]
         extra_kwargs = {
             "type": {"required": True},  # ✅ 필수 값 설정
+            "date": {"required": False},  # dates 로 지정하는 경우 생략 가능
+            "capacity": {"min_value": 1},  # 제한 없음은 null
         }
 
     def validate(self, data):
@@ -81,28 +199,82 @@ class RecruitmentCreateUpdateSerializer(serializers.ModelSerializer):
         if invalid_types:
             raise serializers.ValidationError(f"Invalid type: {invalid_types}")
 
+        data["dates"] = self.get_occurrence_dates(data)
         return data
 
+    # ✅ 반복 조건 → 봉사 날짜 목록
+    def get_occurrence_dates(self, data):
+        date = data.get("date")
+        recurrence = data.pop("recurrence", None)
+        until = data.pop("until", None)
+        dates = data.get("dates")
+
+        if dates:
+            if recurrence:
+                raise serializers.ValidationError(
+                    "recurrence 와 dates 는 함께 사용할 수 없습니다."
+                )
+            occurrences = sorted(set(dates) | ({date} if date else set()))
+        elif recurrence:
+            if not date or not until:
+                raise serializers.ValidationError(
+                    "반복 등록에는 date 와 until 이 필요합니다."
+                )
+            if until < date:
+                raise serializers.ValidationError("until 은 date 이후여야 합니다.")
+            step = datetime.timedelta(days=RECURRENCE_INTERVALS[recurrence])
+            occurrences = []
+            while date <= until and len(occurrences) <= MAX_RECURRENCE_COUNT:
+                occurrences.append(date)
+                date += step
+        elif date:
+            occurrences = [date]
+        else:
+            raise serializers.ValidationError({"date": "봉사 날짜를 입력해주세요."})
+
+        if len(occurrences) > MAX_RECURRENCE_COUNT:
+            raise serializers.ValidationError(
+                f"한 번에 최대 {MAX_RECURRENCE_COUNT}개 일정까지 등록할 수 있습니다."
+            )
+        return occurrences
+
     def create(self, validated_data):
         # ✅ 보호소 연결 → 현재 로그인된 사용자 보호소와 연결
+        from common.utils import upload_files_to_s3, validate_file_extension
+
+        from .signals import sync_bulk_created_recruitments
+
         images = validated_data.pop("images", [])
+        dates = validated_data.pop("dates")
         user = self.context["request"].user
 
         if not hasattr(user, "shelter"):
             raise serializers.ValidationError("보호소 관리자만 등록할 수 있습니다.")
 
-        recruitment = Recruitment.objects.create(shelter=user.shelter, **validated_data)
-
         for image in images:
-            from common.utils import upload_file_to_s3, validate_file_extension
-
             validate_file_extension(image, "recruitments")
-            image_url = upload_file_to_s3(image, "recruitments")
-            RecruitmentImage.objects.create(
-                recruitment=recruitment, image_url=image_url
+
+        # ✅ 이미지는 트랜잭션 밖에서 한 번만 병렬 업로드 (모든 일정이 같은 URL 공유)
+        image_urls = upload_files_to_s3(images, "recruitments")
+
+        # ✅ 반복 일정은 한 번에 INSERT
+        # DB 저장이 실패하면 업로드한 파일은 참조 없이 남고 고아 파일 정리 명령이 삭제
+        with transaction.atomic():
+            validated_data["shelter"] = user.shelter
+            recruitments = Recruitment.objects.bulk_create(
+                [Recruitment(**{**validated_data, "date": date}) for date in dates]
+            )
+            RecruitmentImage.objects.bulk_create(
+                [
+                    RecruitmentImage(recruitment=recruitment, image_url=image_url)
+                    for recruitment in recruitments
+                    for image_url in image_urls
+                ]
             )
+            sync_bulk_created_recruitments(user.shelter, recruitments)
 
-        return recruitment
+        self.recruitments = recruitments
+        return recruitments[0]
 
     def update(self, instance, validated_data):
         # ✅ 수정 처리
@@ -117,6 +289,7 @@ class RecruitmentDetailSerializer(serializers.ModelSerializer):
     images = RecruitmentImageSerializer(many=True, read_only=True)
     shelter_name = serializers.CharField(source="shelter.name", read_only=True)
     shelter_region = serializers.CharField(source="shelter.region", read_only=True)
+    remaining_slots = serializers.IntegerField(read_only=True, allow_null=True)
 
     class Meta:
         model = Recruitment
@@ -131,6 +304,8 @@ class RecruitmentDetailSerializer(serializers.ModelSerializer):
             "supplies",
             "shelter_region",
             "status",
+            "capacity",
+            "remaining_slots",
             "images",
         ]
 
@@ -138,9 +313,18 @@ class RecruitmentDetailSerializer(serializers.ModelSerializer):
 # 신청한 봉사자 조회 serializer
 class RecruitmentApplicantSerializer(serializers.ModelSerializer):
     profile_image = serializers.ImageField(source="user.profile_image", read_only=True)
+    profile_image_thumbnail = ImageVariantField(
+        "thumbnail", source="user.profile_image"
+    )
     name = serializers.CharField(source="user.name", read_only=True)
     contact_number = serializers.CharField(source="user.contact_number", read_only=True)
 
     class Meta:
         model = Application
-        fields = ["id", "profile_image", "name", "contact_number"]
+        fields = [
+            "id",
+            "profile_image",
+            "profile_image_thumbnail",
+            "name",
+            "contact_number",
+        ]
@@ -0,0 +1,119 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from applications.models import Application
+from common.searchcache import bump_generations
+from shelters.models import Shelter
+
+from .cards import refresh_recruitment_cards
+from .models import (
+    Recruitment,
+    RecruitmentCard,
+    RecruitmentImage,
+    recruitment_search_vector,
+)
+
+
+def get_shelter_region(shelter_id):
+    return (
+        Shelter.objects.filter(pk=shelter_id).values_list("region", flat=True).first()
+    )
+
+
+# 🧀 준비물 변경 → 검색 벡터 갱신
+@receiver(post_save, sender=Recruitment)
+def update_recruitment_search_vector(sender, instance, update_fields=None, **kwargs):
+    if update_fields and "supplies" not in update_fields:
+        return
+    Recruitment.objects.filter(pk=instance.pk).update(
+        search_vector=recruitment_search_vector()
+    )
+
+
+# 🧀 카드 갱신 후 검색 캐시 무효화 (커밋 이후)
+# 세대를 먼저 올리면 커밋 전 / 카드 갱신 전 상태가 새 세대로 캐시될 수 있으므로
+# 카드를 다시 계산한 다음에 세대를 올림 (regions=None 이면 검색 캐시는 그대로 둠)
+def refresh_cards_and_search(recruitment_ids, regions=None):
+    refresh_recruitment_cards(recruitment_ids)
+    if regions is not None:
+        bump_generations(*regions)
+
+
+# 🧀 봉사활동 카드(읽기 모델) 갱신 예약
+# 커밋 이후에 다시 계산 → 같은 트랜잭션의 다른 변경까지 반영되고,
+# 봉사활동 삭제(CASCADE) 중에는 이미 지워진 봉사활동이라 카드를 다시 만들지 않음
+def schedule_card_refresh(recruitment_ids, regions=None):
+    transaction.on_commit(
+        partial(refresh_cards_and_search, set(recruitment_ids), regions)
+    )
+
+
+# 🧀 bulk_create 는 post_save 시그널이 없으므로 시그널 처리(검색 벡터, 캐시, 카드)를 직접 수행
+def sync_bulk_created_recruitments(shelter, recruitments):
+    ids = [recruitment.pk for recruitment in recruitments]
+    Recruitment.objects.filter(pk__in=ids).update(
+        search_vector=recruitment_search_vector()
+    )
+    schedule_card_refresh(ids, [shelter.region])
+
+
+# 🧀 이미지 일괄 삭제(raw DELETE)도 post_delete 시그널이 없으므로 캐시/카드를 직접 갱신
+def sync_bulk_deleted_images(shelter, recruitment_ids):
+    schedule_card_refresh(recruitment_ids, [shelter.region])
+
+
+# 🧀 인원 카운터 / 자동 마감(QuerySet.update)도 post_save 시그널이 없으므로 캐시/카드를 직접 갱신
+def sync_slot_changes(recruitment_ids):
+    ids = set(recruitment_ids)
+    regions = list(
+        Shelter.objects.filter(recruitments__in=ids)
+        .values_list("region", flat=True)
+        .distinct()
+    )
+    schedule_card_refresh(ids, regions)
+
+
+# 🧀 봉사활동 / 이미지 변경 → 카드 갱신 + 해당 지역 검색 캐시 무효화
+@receiver(post_save, sender=Recruitment)
+def refresh_card_on_recruitment_save(sender, instance, **kwargs):
+    schedule_card_refresh([instance.pk], [get_shelter_region(instance.shelter_id)])
+
+
+@receiver(post_delete, sender=Recruitment)
+def invalidate_deleted_recruitment_search(sender, instance, **kwargs):
+    region = get_shelter_region(instance.shelter_id)
+    transaction.on_commit(partial(bump_generations, region))
+
+
+@receiver(post_save, sender=RecruitmentImage)
+@receiver(post_delete, sender=RecruitmentImage)
+def refresh_card_on_image_change(sender, instance, **kwargs):
+    region = (
+        Shelter.objects.filter(recruitments=instance.recruitment_id)
+        .values_list("region", flat=True)
+        .first()
+    )
+    schedule_card_refresh([instance.recruitment_id], [region])
+
+
+# 🧀 신청 변경 → 카드(신청자 수)만 갱신
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def refresh_card_on_application_change(sender, instance, **kwargs):
+    schedule_card_refresh([instance.recruitment_id])
+
+
+# 🧀 보호소 이름/지역 변경 → 해당 보호소의 카드 일괄 수정
+@receiver(post_save, sender=Shelter)
+def update_shelter_cards(sender, instance, created=False, **kwargs):
+    if created:
+        return
+    RecruitmentCard.objects.filter(shelter=instance).update(
+        shelter_name=instance.name,
+        shelter_region=instance.region,
+        updated_at=timezone.now(),
+    )
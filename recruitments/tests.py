@@ -1,3 +1,434 @@
-from django.test import TestCase
+import io
+from datetime import date, time, timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from common.querycount import assert_query_budget
+from common.searchcache import get_generations
+from common.storage import storage
+from common.tests import InMemoryStorageMixin
+from common.utils import get_upload_key
+from shelters.models import Shelter
+from users.models import User
+
+from .cards import (
+    build_recruitment_card,
+    refresh_recruitment_cards,
+    upsert_recruitment_cards,
+)
+from .models import Recruitment, RecruitmentCard, RecruitmentImage
+from .serializers import MAX_RECURRENCE_COUNT, RecruitmentCreateUpdateSerializer
+from .views import (
+    RecruitmentCalendarView,
+    RecruitmentDetailView,
+    RecruitmentImageBulkDeleteView,
+    RecruitmentListView,
+    RecruitmentNearbyView,
+    RecruitmentSearchView,
+)
+
+
+class RecruitmentTestMixin:
+    @classmethod
+    def setUpTestData(cls):
+        shelter_user = User.objects.create_user(
+            email="shelter@example.com", name="보호소", is_shelter=True
+        )
+        cls.shelter = Shelter.objects.create(
+            user=shelter_user,
+            name="댕냥 보호소",
+            address="서울 마포구",
+            region="서울",
+            latitude=37.55,
+            longitude=126.92,
+        )
+        cls.user = User.objects.create_user(email="user@example.com", name="봉사자")
+
+    def setUp(self):
+        cache.clear()
+        # 카드는 커밋 후 갱신되므로 on_commit 콜백을 바로 실행
+        with self.captureOnCommitCallbacks(execute=True):
+            self.recruitments = [
+                Recruitment.objects.create(
+                    shelter=self.shelter,
+                    date=date.today() + timedelta(days=i + 1),
+                    start_time=time(10),
+                    end_time=time(12),
+                    type=["walking"],
+                    supplies="gloves",
+                )
+                for i in range(3)
+            ]
+        self.anonymous = APIClient()
+        self.authenticated = APIClient()
+        token = RefreshToken.for_user(self.user).access_token
+        self.authenticated.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.shelter_client = APIClient()
+        token = RefreshToken.for_user(self.shelter.user).access_token
+        self.shelter_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+
+class RecruitmentQueryBudgetTest(RecruitmentTestMixin, TestCase):
+
+    # 🧀 익명 요청 / JWT 요청 모두 예산 안에서 처리 (JWT 는 사용자 조회 쿼리 1개 추가)
+    def assert_within_budget(self, view_class, url, params=None):
+        for client in (self.anonymous, self.authenticated):
+            cache.clear()
+            with assert_query_budget(view_class, "get"):
+                response = client.get(url, params)
+            self.assertEqual(response.status_code, 200, response.content)
+
+    def test_list(self):
+        self.assert_within_budget(RecruitmentListView, "/api/recruitments/")
+
+    def test_list_next_page(self):
+        response = self.anonymous.get("/api/recruitments/", {"page_size": 1})
+        self.assert_within_budget(
+            RecruitmentListView,
+            "/api/recruitments/",
+            {"page_size": 1, "cursor": response.data["next"]},
+        )
+
+    def test_detail(self):
+        self.assert_within_budget(
+            RecruitmentDetailView, f"/api/recruitments/{self.recruitments[0].id}/"
+        )
+
+    def test_search(self):
+        self.assert_within_budget(
+            RecruitmentSearchView, "/api/recruitments/search/", {"region": "서울"}
+        )
+        self.assert_within_budget(
+            RecruitmentSearchView, "/api/recruitments/search/", {"q": "gloves"}
+        )
+
+    def test_calendar(self):
+        month = self.recruitments[0].date.strftime("%Y-%m")
+        self.assert_within_budget(
+            RecruitmentCalendarView, "/api/recruitments/calendar/", {"month": month}
+        )
+
+    def test_nearby(self):
+        self.assert_within_budget(
+            RecruitmentNearbyView,
+            "/api/recruitments/nearby/",
+            {"lat": 37.55, "lng": 126.92},
+        )
+
+
+class RecruitmentSearchCacheTest(RecruitmentTestMixin, TestCase):
+    def test_generation_is_bumped_after_card_refresh(self):
+        recruitment = self.recruitments[0]
+        generation = get_generations(["서울"])["서울"]
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            recruitment.supplies = "towels"
+            recruitment.save()
+        # 커밋 전에는 세대를 올리지 않음 (이전 카드가 새 세대로 캐시되지 않도록)
+        self.assertEqual(get_generations(["서울"])["서울"], generation)
+
+        for callback in callbacks:
+            callback()
+        card = RecruitmentCard.objects.get(pk=recruitment.id)
+        self.assertEqual(card.supplies, "towels")
+        self.assertNotEqual(get_generations(["서울"])["서울"], generation)
+
+    def test_invalid_dates_are_ignored(self):
+        response = self.anonymous.get(
+            "/api/recruitments/search/",
+            {"region": "서울", "start_date": "2024-02-30", "end_date": "2024-13-01"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["recruitments"]), 3)
+
+
+class RecruitmentCardTest(RecruitmentTestMixin, TestCase):
+    def test_detail_falls_back_to_recruitment_without_card(self):
+        recruitment = self.recruitments[0]
+        url = f"/api/recruitments/{recruitment.id}/"
+        with_card = self.anonymous.get(url).data
+        RecruitmentCard.objects.filter(pk=recruitment.id).delete()
+
+        with assert_query_budget(RecruitmentDetailView, "get"):
+            response = self.authenticated.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, with_card)
+
+    def test_detail_not_found(self):
+        response = self.anonymous.get("/api/recruitments/0/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_older_snapshot_does_not_overwrite_card(self):
+        recruitment = self.recruitments[0]
+        card = RecruitmentCard.objects.get(pk=recruitment.id)
+
+        # 먼저 읽었지만 나중에 도착한 갱신 (이전 상태)
+        stale = Recruitment.objects.select_related("shelter").get(pk=recruitment.id)
+        stale.applicant_count = 0
+        stale.snapshot_at = card.snapshot_at - timedelta(seconds=1)
+        stale.supplies = "stale"
+        upsert_recruitment_cards([build_recruitment_card(stale)])
+        card.refresh_from_db()
+        self.assertEqual(card.supplies, "gloves")
+
+        Recruitment.objects.filter(pk=recruitment.id).update(supplies="towels")
+        refresh_recruitment_cards([recruitment.id])
+        card.refresh_from_db()
+        self.assertEqual(card.supplies, "towels")
+
+
+class RecruitmentConditionalGetTest(RecruitmentTestMixin, TestCase):
+    def test_list_uses_etag_only(self):
+        response = self.anonymous.get("/api/recruitments/")
+        self.assertIn("ETag", response.headers)
+        self.assertNotIn("Last-Modified", response.headers)
+
+        response = self.anonymous.get(
+            "/api/recruitments/", HTTP_IF_NONE_MATCH=response.headers["ETag"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_etag_changes_on_delete(self):
+        etag = self.anonymous.get("/api/recruitments/").headers["ETag"]
+        # 가장 최근에 수정된 봉사활동이 아니어도 삭제는 응답을 바꿈
+        self.recruitments[0].delete()
+
+        response = self.anonymous.get("/api/recruitments/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["recruitments"]), 2)
+
+
+class RecruitmentImageBulkDeleteTest(
+    InMemoryStorageMixin, RecruitmentTestMixin, TestCase
+):
+    def setUp(self):
+        super().setUp()
+        other_user = User.objects.create_user(
+            email="other@example.com", name="다른 보호소", is_shelter=True
+        )
+        other = Recruitment.objects.create(
+            shelter=Shelter.objects.create(user=other_user, name="다른 보호소"),
+            date=date.today() + timedelta(days=1),
+            start_time=time(10),
+            end_time=time(12),
+        )
+        self.own = [self.add_image(self.recruitments[i]) for i in range(2)]
+        self.foreign = self.add_image(other)
+
+    # 업로드마다 고유한 키(직접 업로드)는 참조가 없으면 바로 삭제됨
+    def add_image(self, recruitment, url=None):
+        if url is None:
+            key = get_upload_key("dog.png", "recruitments")
+            storage.upload_fileobj(io.BytesIO(b"png"), key)
+            url = storage.get_url(key)
+        return RecruitmentImage.objects.create(recruitment=recruitment, image_url=url)
+
+    def bulk_delete(self, image_ids):
+        return self.shelter_client.post(
+            "/api/recruitments/images/bulk-delete/",
+            {"image_ids": image_ids},
+            format="json",
+        )
+
+    def stored(self, image):
+        return storage.get_key(image.image_url) in self.backend.objects
+
+    def test_partial_success(self):
+        first, second = self.own
+        with assert_query_budget(RecruitmentImageBulkDeleteView, "post"):
+            response = self.bulk_delete([first.id, self.foreign.id, 0, second.id])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["deleted"], [first.id, second.id])
+        self.assertEqual(
+            response.data["failed"],
+            [
+                {"id": self.foreign.id, "error": "해당 이미지를 찾을 수 없습니다."},
+                {"id": 0, "error": "해당 이미지를 찾을 수 없습니다."},
+            ],
+        )
+        self.assertEqual(response.data["file_errors"], [])
+        self.assertFalse(self.stored(first) or self.stored(second))
+
+        # 다른 보호소의 이미지는 행도 파일도 그대로
+        self.assertTrue(RecruitmentImage.objects.filter(pk=self.foreign.id).exists())
+        self.assertTrue(self.stored(self.foreign))
+
+    def test_files_are_deleted_after_rows(self):
+        urls = [image.image_url for image in self.own]
+
+        def delete_files(deleted_urls):
+            self.assertEqual(sorted(deleted_urls), sorted(urls))
+            self.assertFalse(
+                RecruitmentImage.objects.filter(image_url__in=urls).exists()
+            )
+            return {}
+
+        with mock.patch(
+            "recruitments.views.delete_files_from_s3", side_effect=delete_files
+        ) as delete_files_from_s3:
+            response = self.bulk_delete([image.id for image in self.own])
+        self.assertEqual(response.status_code, 200)
+        delete_files_from_s3.assert_called_once()
+
+    def test_shared_file_is_kept_while_referenced(self):
+        shared = self.add_image(self.recruitments[2], self.own[0].image_url)
+        response = self.bulk_delete([self.own[0].id])
+        self.assertEqual(response.data["deleted"], [self.own[0].id])
+        self.assertTrue(self.stored(shared))
+
+    def test_file_errors_are_reported_per_image(self):
+        first, second = self.own
+        key = storage.get_key(second.image_url)
+        with mock.patch.object(
+            self.backend,
+            "delete_objects",
+            return_value=[{"key": key, "error": "AccessDenied"}],
+        ):
+            response = self.bulk_delete([first.id, second.id])
+
+        self.assertEqual(response.data["deleted"], [first.id, second.id])
+        self.assertEqual(
+            response.data["file_errors"], [{"id": second.id, "error": "AccessDenied"}]
+        )
+        self.assertFalse(
+            RecruitmentImage.objects.filter(pk__in=[first.id, second.id]).exists()
+        )
+
+
+@override_settings(IMAGE_VARIANT_WORKERS=0)
+class RecruitmentRecurrenceTest(InMemoryStorageMixin, RecruitmentTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.start = date.today() + timedelta(days=1)
+
+    def occurrence_dates(self, **data):
+        serializer = RecruitmentCreateUpdateSerializer(
+            data={
+                "date": self.start,
+                "start_time": "10:00",
+                "end_time": "12:00",
+                "type": ["walking"],
+                **data,
+            }
+        )
+        if not serializer.is_valid():
+            return serializer.errors
+        return serializer.validated_data["dates"]
+
+    def days(self, *offsets):
+        return [self.start + timedelta(days=offset) for offset in offsets]
+
+    def test_weekly_and_biweekly_expansion(self):
+        until = self.start + timedelta(days=28)
+        self.assertEqual(
+            self.occurrence_dates(recurrence="weekly", until=until),
+            self.days(0, 7, 14, 21, 28),
+        )
+        self.assertEqual(
+            self.occurrence_dates(recurrence="biweekly", until=until),
+            self.days(0, 14, 28),
+        )
+
+    def test_until_bound(self):
+        # until 이 반복 주기와 맞지 않으면 until 이전의 마지막 일정까지
+        until = self.start + timedelta(days=20)
+        self.assertEqual(
+            self.occurrence_dates(recurrence="weekly", until=until),
+            self.days(0, 7, 14),
+        )
+        self.assertEqual(
+            self.occurrence_dates(recurrence="weekly", until=self.start),
+            self.days(0),
+        )
+        self.assertIn(
+            "non_field_errors",
+            self.occurrence_dates(
+                recurrence="weekly", until=self.start - timedelta(days=1)
+            ),
+        )
+
+    def test_explicit_dates(self):
+        # 연속된 날짜(매일)도 날짜 목록으로 지정, 중복은 제거하고 정렬
+        dates = self.days(2, 1, 2)
+        self.assertEqual(self.occurrence_dates(dates=dates), self.days(0, 1, 2))
+        self.assertIn(
+            "non_field_errors",
+            self.occurrence_dates(
+                dates=dates, recurrence="weekly", until=self.start + timedelta(days=7)
+            ),
+        )
+
+    def test_occurrence_cap(self):
+        until = self.start + timedelta(weeks=MAX_RECURRENCE_COUNT - 1)
+        self.assertEqual(
+            len(self.occurrence_dates(recurrence="weekly", until=until)),
+            MAX_RECURRENCE_COUNT,
+        )
+        errors = self.occurrence_dates(
+            recurrence="weekly", until=until + timedelta(weeks=1)
+        )
+        self.assertEqual(
+            errors["non_field_errors"],
+            [f"한 번에 최대 {MAX_RECURRENCE_COUNT}개 일정까지 등록할 수 있습니다."],
+        )
+        dates = self.days(*range(1, MAX_RECURRENCE_COUNT + 1))
+        self.assertIn("non_field_errors", self.occurrence_dates(dates=dates))
+
+    def test_occurrences_share_one_uploaded_image_set(self):
+        images = [
+            SimpleUploadedFile(f"dog{i}.png", self.png_bytes(color), "image/png")
+            for i, color in enumerate(("white", "black"))
+        ]
+        with mock.patch.object(
+            self.backend, "upload_fileobj", wraps=self.backend.upload_fileobj
+        ) as upload_fileobj, self.captureOnCommitCallbacks(execute=True):
+            response = self.shelter_client.post(
+                "/api/recruitments/create/",
+                {
+                    "date": self.start.isoformat(),
+                    "start_time": "10:00",
+                    "end_time": "12:00",
+                    "type": '["walking"]',
+                    "recurrence": "weekly",
+                    "until": (self.start + timedelta(weeks=3)).isoformat(),
+                    "images": images,
+                },
+            )
+
+        self.assertEqual(response.status_code, 201, response.data)
+        ids = response.data["recruitment_ids"]
+        self.assertEqual(len(ids), 4)
+        self.assertEqual(
+            list(
+                Recruitment.objects.filter(pk__in=ids)
+                .order_by("date")
+                .values_list("date", flat=True)
+            ),
+            self.days(0, 7, 14, 21),
+        )
+
+        # 원본은 2개만 업로드, 모든 일정이 같은 URL 2개를 참조
+        originals = [
+            call.args[1]
+            for call in upload_fileobj.call_args_list
+            if "/variants/" not in call.args[1]
+        ]
+        self.assertEqual(len(originals), 2)
+        urls = {storage.get_url(key) for key in originals}
+        for recruitment_id in ids:
+            self.assertEqual(
+                set(
+                    RecruitmentImage.objects.filter(
+                        recruitment_id=recruitment_id
+                    ).values_list("image_url", flat=True)
+                ),
+                urls,
+            )
+        # bulk_create 로 만든 일정도 카드가 생성됨
+        self.assertEqual(RecruitmentCard.objects.filter(pk__in=ids).count(), len(ids))
@@ -3,11 +3,14 @@ from django.urls import path
 from .views import (
     MyRecruitmentListView,
     RecruitmentApplicantView,
+    RecruitmentCalendarView,
     RecruitmentCreateView,
     RecruitmentDetailView,
+    RecruitmentImageBulkDeleteView,
     RecruitmentImageDeleteView,
     RecruitmentImageView,
     RecruitmentListView,
+    RecruitmentNearbyView,
     RecruitmentSearchView,
     RecruitmentUpdateView,
 )
@@ -15,6 +18,8 @@ from .views import (
 urlpatterns = [
     path("", RecruitmentListView.as_view(), name="recruitment-list"),
     path("search/", RecruitmentSearchView.as_view(), name="recruitment-search"),
+    path("calendar/", RecruitmentCalendarView.as_view(), name="recruitment-calendar"),
+    path("nearby/", RecruitmentNearbyView.as_view(), name="recruitment-nearby"),
     path("<int:pk>/", RecruitmentDetailView.as_view(), name="recruitment-detail"),
     path("create/", RecruitmentCreateView.as_view(), name="recruitment-create"),
     path("mylist/", MyRecruitmentListView.as_view(), name="my-recruitment-list"),
@@ -31,6 +36,11 @@ urlpatterns = [
         RecruitmentImageView.as_view(),
         name="recruitment-image",
     ),
+    path(
+        "images/bulk-delete/",
+        RecruitmentImageBulkDeleteView.as_view(),
+        name="recruitment-image-bulk-delete",
+    ),
     path(
         "images/<int:image_id>/",
         RecruitmentImageDeleteView.as_view(),
@@ -1,29 +1,58 @@
-from django.db.models import Q
-from django.utils.dateparse import parse_time
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, Max
 from drf_spectacular.utils import OpenApiParameter, OpenApiTypes, extend_schema
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from applications.models import Application
-from common.utils import delete_file_from_s3
-
-from .models import Recruitment, RecruitmentImage
+from common.conditional import (
+    get_collection_etag,
+    get_not_modified_response,
+    get_validators,
+    set_validators,
+)
+from common.geo import parse_location_params
+from common.pagination import KEYSET_PAGINATION_PARAMETERS, KeysetPagination
+from common.utils import delete_file_from_s3, delete_files_from_s3
+from shelters.models import Shelter
+
+from .models import Recruitment, RecruitmentCard, RecruitmentImage
+from .search import (
+    CARD_ORDERING,
+    DISTANCE_ORDERING,
+    RECRUITMENT_ORDERING,
+    get_search_keyword,
+    get_search_ordering,
+    nearby_recruitments,
+    parse_month,
+    recruitment_calendar,
+    recruitment_calendar_cache,
+    recruitment_search_cache,
+    search_recruitment_cards,
+    search_recruitments,
+)
 from .serializers import (
     RecruitmentApplicantSerializer,
+    RecruitmentCardSerializer,
     RecruitmentCreateUpdateSerializer,
     RecruitmentDetailSerializer,
+    RecruitmentImageBulkDeleteSerializer,
     RecruitmentImageSerializer,
+    RecruitmentNearbySerializer,
     RecruitmentSerializer,
 )
+from .signals import sync_bulk_deleted_images
 
 
 # 🧀 봉사활동 검색 (GET /api/recruitments/search)
 @extend_schema(
     summary="봉사활동 검색",
-    description="지역, 날짜, 시간 범위로 봉사활동을 검색합니다.",
+    description="지역, 날짜, 시간 범위, 모집 상태, 활동 유형, 키워드로 봉사활동을 검색합니다. "
+    "키워드(q)가 있으면 관련도 순으로 정렬합니다.",
     parameters=[
         OpenApiParameter(
             name="region",
@@ -50,70 +79,171 @@ from .serializers import (
             location=OpenApiParameter.QUERY,
             description="검색 종료 시간 (예: 11:00)",
         ),
+        OpenApiParameter(
+            name="status",
+            location=OpenApiParameter.QUERY,
+            description="모집 상태 (open / closed)",
+        ),
+        OpenApiParameter(
+            name="type",
+            location=OpenApiParameter.QUERY,
+            description="쉼표로 구분된 활동 유형 (예: walking,cleaning)",
+        ),
+        OpenApiParameter(
+            name="type_match",
+            location=OpenApiParameter.QUERY,
+            description="활동 유형 일치 방식 (any: 하나라도 포함(기본) / all: 모두 포함)",
+        ),
+        OpenApiParameter(
+            name="q",
+            location=OpenApiParameter.QUERY,
+            description="키워드 (보호소 이름, 주소, 준비물)",
+        ),
+        *KEYSET_PAGINATION_PARAMETERS,
     ],
     responses={200: RecruitmentSerializer(many=True)},
 )
 class RecruitmentSearchView(APIView):
     permission_classes = [AllowAny]
+    query_budget = {"get": 3}
 
     def get(self, request):
-        queryset = Recruitment.objects.all()
-
-        # ✅ 지역 필터링
-        region_param = request.query_params.get("region")
-        regions = region_param.split(",") if region_param else []
-
-        if regions:
-            q = Q()
-            for region in regions[:3]:  # 최대 3개까지 처리
-                q |= Q(shelter__region=region.strip())
-            queryset = queryset.filter(q)
-
-        # ✅ 날짜 범위 필터링
-        start_date = request.query_params.get("start_date")
-        end_date = request.query_params.get("end_date")
-        if start_date and end_date:
-            queryset = queryset.filter(date__range=[start_date, end_date])
-
-        # ✅ 시간 필터링
-        start_time_param = request.query_params.get("start_time")
-        end_time_param = request.query_params.get("end_time")
-
-        start_time = parse_time(start_time_param) if start_time_param else None
-        end_time = parse_time(end_time_param) if end_time_param else None
-
-        if start_time and end_time:
-            queryset = queryset.filter(
-                start_time__lt=end_time,
-                end_time__gt=start_time,
+        # 같은 검색 조건은 캐시된 응답 반환 (보호소/봉사활동 변경 시 지역별로 무효화)
+        cache_key = recruitment_search_cache.get_key(request.query_params)
+        response = recruitment_search_cache.get(cache_key)
+        if response is None:
+            response = recruitment_search_cache.set(cache_key, self.search(request))
+        return response
+
+    def search(self, request):
+        # 키워드가 없으면 카드 테이블 단일 조회, 키워드가 있으면 관련도 계산을 위해 원본 조회
+        if get_search_keyword(request.query_params):
+            queryset = search_recruitments(request.query_params)
+            serializer_class = RecruitmentSerializer
+        else:
+            queryset = search_recruitment_cards(request.query_params)
+            serializer_class = RecruitmentCardSerializer
+
+        paginator = KeysetPagination(ordering=get_search_ordering(request.query_params))
+        page = paginator.paginate_queryset(queryset, request)
+
+        if not page and not request.query_params.get("cursor"):
+            return Response(
+                {"error": "해당 조건에 맞는 봉사활동을 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
             )
 
-        # time = request.query_params.get("time")
-        # if time:
-        #     queryset = queryset.filter(Q(start_time__lte=time) & Q(end_time__gte=time))
+        serializer = serializer_class(page, many=True)
+        return paginator.get_paginated_response(serializer.data, "recruitments")
+
+
+# 🧀 주변 봉사활동 검색 (GET /api/recruitments/nearby)
+@extend_schema(
+    summary="주변 봉사활동 검색",
+    description="지정한 위치에서 반경 내 보호소의 모집 중인 봉사활동을 가까운 순으로 조회합니다. "
+    "지역, 날짜, 시간, 활동 유형 검색 조건을 함께 사용할 수 있습니다.",
+    parameters=[
+        OpenApiParameter(
+            name="lat", type=float, location=OpenApiParameter.QUERY, required=True
+        ),
+        OpenApiParameter(
+            name="lng", type=float, location=OpenApiParameter.QUERY, required=True
+        ),
+        OpenApiParameter(
+            name="radius",
+            type=float,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="검색 반경 km (기본 5, 최대 50)",
+        ),
+        *KEYSET_PAGINATION_PARAMETERS,
+    ],
+    responses={200: RecruitmentNearbySerializer(many=True)},
+)
+class RecruitmentNearbyView(APIView):
+    permission_classes = [AllowAny]
+    query_budget = {"get": 3}
+
+    def get(self, request):
+        location, error = parse_location_params(request.query_params)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = nearby_recruitments(*location, request.query_params)
+        paginator = KeysetPagination(ordering=DISTANCE_ORDERING)
+        page = paginator.paginate_queryset(queryset, request)
+        serializer = RecruitmentNearbySerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data, "recruitments")
 
-        if not queryset.exists():
+
+# 🧀 봉사활동 달력 (GET /api/recruitments/calendar)
+@extend_schema(
+    summary="봉사활동 달력 조회",
+    description="월별로 날짜별 모집 중인 봉사활동 수를 지역/활동 유형별로 집계합니다.",
+    parameters=[
+        OpenApiParameter(
+            name="month",
+            location=OpenApiParameter.QUERY,
+            required=True,
+            description="조회할 월 (YYYY-MM)",
+        ),
+        OpenApiParameter(
+            name="region",
+            location=OpenApiParameter.QUERY,
+            description="쉼표로 구분된 최대 3개 지역 (예: 서울,경기,인천)",
+        ),
+    ],
+    responses={200: dict},
+)
+class RecruitmentCalendarView(APIView):
+    permission_classes = [AllowAny]
+    query_budget = {"get": 3}  # JWT 가 있으면 사용자 조회 1개 포함
+
+    def get(self, request):
+        month_range = parse_month(request.query_params.get("month"))
+        if month_range is None:
             return Response(
-                {"error": "해당 조건에 맞는 봉사활동을 찾을 수 없습니다."},
-                status=status.HTTP_404_NOT_FOUND,
+                {"error": "month 는 YYYY-MM 형식이어야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-        serializer = RecruitmentSerializer(queryset, many=True)
-        return Response({"recruitments": serializer.data}, status=status.HTTP_200_OK)
+        cache_key = recruitment_calendar_cache.get_key(request.query_params)
+        response = recruitment_calendar_cache.get(cache_key)
+        if response is None:
+            days = recruitment_calendar(*month_range, request.query_params)
+            response = recruitment_calendar_cache.set(
+                cache_key,
+                Response({"month": month_range[0].strftime("%Y-%m"), "days": days}),
+            )
+        return response
 
 
 # 🧀 봉사활동 전체 조회
 @extend_schema(
     summary="봉사활동 전체 목록 조회",
+    parameters=KEYSET_PAGINATION_PARAMETERS,
     responses={200: RecruitmentSerializer(many=True)},
 )
 class RecruitmentListView(APIView):
     permission_classes = [AllowAny]
+    query_budget = {"get": 3}  # JWT 가 있으면 사용자 조회 1개 포함
 
     def get(self, request):
-        queryset = Recruitment.objects.all()
-        serializer = RecruitmentSerializer(queryset, many=True)
-        return Response({"recruitments": serializer.data}, status=status.HTTP_200_OK)
+        queryset = RecruitmentCard.objects.all()
+
+        # 변경이 없으면 직렬화 없이 304 (최종 수정 시각 + 행 수로 ETag 계산)
+        summary = queryset.aggregate(last_modified=Max("updated_at"), count=Count("pk"))
+        etag = get_collection_etag(request, summary["last_modified"], summary["count"])
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
+
+        # 보호소/이미지가 펼쳐진 카드 테이블만 조회
+        paginator = KeysetPagination(ordering=CARD_ORDERING)
+        page = paginator.paginate_queryset(queryset, request)
+        serializer = RecruitmentCardSerializer(page, many=True)
+        response = paginator.get_paginated_response(serializer.data, "recruitments")
+        return set_validators(response, etag)
 
 
 # 🧀 봉사활동 상세 조회
@@ -122,16 +252,37 @@ class RecruitmentListView(APIView):
 )
 class RecruitmentDetailView(APIView):
     permission_classes = [AllowAny]
+    # 카드가 없으면 원본 + 이미지 조회 2개 추가, JWT 가 있으면 사용자 조회 1개 포함
+    query_budget = {"get": 4}
 
     def get(self, request, pk):
-        recruitment = Recruitment.objects.filter(pk=pk).first()
-        if not recruitment:
+        # 카드는 봉사활동/이미지/보호소가 바뀔 때마다 갱신되므로 updated_at 을 검증값으로 사용
+        card = RecruitmentCard.objects.filter(pk=pk).first()
+        if card:
+            instance, serializer_class = card, RecruitmentCardSerializer
+        else:
+            # 카드가 아직 만들어지지 않은 봉사활동 (커밋 직후 등) → 원본에서 조회
+            instance = (
+                Recruitment.objects.select_related("shelter")
+                .prefetch_related("images")
+                .filter(pk=pk)
+                .first()
+            )
+            serializer_class = RecruitmentDetailSerializer
+        if not instance:
             return Response(
                 {"error": "봉사활동을 찾을 수 없습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        serializer = RecruitmentSerializer(recruitment)
-        return Response({"recruitment": serializer.data}, status=status.HTTP_200_OK)
+
+        etag, last_modified = get_validators(request, instance.updated_at)
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified:
+            return not_modified
+
+        serializer = serializer_class(instance)
+        response = Response({"recruitment": serializer.data}, status=status.HTTP_200_OK)
+        return set_validators(response, etag, last_modified)
 
 
 # 🧀 봉사활동 등록
@@ -160,6 +311,8 @@ class RecruitmentCreateView(APIView):
                     "code": 201,
                     "message": "봉사활동이 성공적으로 등록되었습니다.",
                     "recruitment_id": serializer.instance.id,
+                    # 반복 등록 시 생성된 모든 봉사활동 id
+                    "recruitment_ids": [r.id for r in serializer.recruitments],
                 },
                 status=status.HTTP_201_CREATED,
             )
@@ -171,8 +324,11 @@ class RecruitmentCreateView(APIView):
 
 # 등록한 봉사활동 목록 조회
 class MyRecruitmentListView(APIView):
+    query_budget = {"get": 4}
+
     @extend_schema(
         summary="등록한 봉사활동 조회",
+        parameters=KEYSET_PAGINATION_PARAMETERS,
         responses={200: RecruitmentSerializer(many=True)},
     )
     def get(self, request):
@@ -183,21 +339,31 @@ class MyRecruitmentListView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        queryset = Recruitment.objects.filter(shelter=shelter)
-        if not queryset.exists():
+        queryset = (
+            Recruitment.objects.filter(shelter=shelter)
+            .select_related("shelter")
+            .prefetch_related("images")
+        )
+        paginator = KeysetPagination(ordering=RECRUITMENT_ORDERING)
+        page = paginator.paginate_queryset(queryset, request)
+
+        if not page and not request.query_params.get("cursor"):
             return Response(
                 {"message": "등록한 봉사활동이 없습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = RecruitmentSerializer(queryset, many=True)
-        return Response({"recruitments": serializer.data}, status=status.HTTP_200_OK)
+        serializer = RecruitmentSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data, "recruitments")
 
 
 # 특정 봉사활동 신청자 목록 조회
 class RecruitmentApplicantView(APIView):
+    query_budget = {"get": 4}
+
     @extend_schema(
         summary="특정 봉사활동 신청자 목록 조회",
+        parameters=KEYSET_PAGINATION_PARAMETERS,
         responses={200: RecruitmentApplicantSerializer(many=True)},
     )
     def get(self, request, recruitment_id):
@@ -215,14 +381,15 @@ class RecruitmentApplicantView(APIView):
         applications = Application.objects.filter(
             recruitment=recruitment
         ).select_related("user")
-        if not applications.exists():
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(applications, request)
+        if not page and not request.query_params.get("cursor"):
             return Response(
                 {"message": "신청한 봉사자가 없습니다."}, status.HTTP_404_NOT_FOUND
             )
 
-        users = [app.user for app in applications]
-        serializer = RecruitmentApplicantSerializer(applications, many=True)
-        return Response({"applicants": serializer.data}, status=status.HTTP_200_OK)
+        serializer = RecruitmentApplicantSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data, "applicants")
 
 
 # 🧀 봉사활동 수정
@@ -244,7 +411,24 @@ class RecruitmentUpdateView(APIView):
 
         serializer = RecruitmentSerializer(recruitment, data=request.data, partial=True)
         if serializer.is_valid():
-            serializer.save()
+            # 날짜/시간 변경 시 신청자의 다른 신청과 시간이 겹치면 제약 조건 위반
+            try:
+                with transaction.atomic():
+                    serializer.save()
+            except IntegrityError:
+                return Response(
+                    {
+                        "code": 409,
+                        "message": "신청자의 다른 봉사 일정과 시간이 겹쳐 변경할 수 없습니다.",
+                    },
+                    status=status.HTTP_409_CONFLICT,
+                )
+            except ValidationError as e:
+                # 정원 < 승인 인원 (저장 시점의 승인 인원 기준, 변경 내용 전체 롤백)
+                return Response(
+                    {"code": 400, "message": e.detail},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             return Response(
                 {
                     "code": 200,
@@ -294,10 +478,10 @@ class RecruitmentImageDeleteView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        # S3 에서 삭제
+        # 행을 먼저 지운 뒤 S3 에서 삭제 (다른 행이 같은 파일을 참조하면 파일은 유지)
         try:
-            delete_file_from_s3(image.image_url)
             image.delete()
+            delete_file_from_s3(image.image_url)
             return Response(
                 {"message": "이미지 삭제가 완료되었습니다."},
                 status=status.HTTP_204_NO_CONTENT,
@@ -307,3 +491,82 @@ class RecruitmentImageDeleteView(APIView):
                 {"error": "이미지 삭제에 실패하였습니다.", "details": str(e)},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+
+
+# 🧀 봉사활동 이미지 일괄 삭제 (POST /api/recruitments/images/bulk-delete/)
+# 내 보호소 이미지만 DELETE 한 번 → 남은 참조가 없는 파일만 delete_objects 한 번
+class RecruitmentImageBulkDeleteView(APIView):
+    permission_classes = [IsAuthenticated]
+    query_budget = {"post": 9}
+
+    @extend_schema(
+        summary="봉사활동 이미지 일괄 삭제",
+        description="이미지 id 목록을 한 번에 삭제합니다. "
+        "찾을 수 없거나 내 보호소 이미지가 아닌 id 는 failed 로, "
+        "행은 삭제됐지만 파일 삭제에 실패한 id 는 file_errors 로 응답합니다 "
+        "(남은 파일은 정리 작업에서 다시 삭제).",
+        request=RecruitmentImageBulkDeleteSerializer,
+        responses={200: dict},
+    )
+    def post(self, request):
+        shelter = Shelter.objects.filter(user=request.user).first()
+        if not shelter:
+            return Response(
+                {"error": "보호소 관리자만 이미지를 삭제할 수 있습니다."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        serializer = RecruitmentImageBulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        image_ids = list(dict.fromkeys(serializer.validated_data["image_ids"]))
+
+        with transaction.atomic():
+            deleted = self.delete_images(shelter, image_ids)
+            sync_bulk_deleted_images(
+                shelter, [recruitment_id for _, _, recruitment_id in deleted]
+            )
+
+        deleted_ids = {image_id for image_id, _, _ in deleted}
+        failed = [
+            {"id": image_id, "error": "해당 이미지를 찾을 수 없습니다."}
+            for image_id in image_ids
+            if image_id not in deleted_ids
+        ]
+
+        # 행을 먼저 지운 뒤 S3 에서 삭제 (다른 행이 같은 파일을 참조하면 파일은 유지)
+        try:
+            file_errors = delete_files_from_s3([url for _, url, _ in deleted])
+        except RuntimeError as e:
+            file_errors = {url: str(e) for _, url, _ in deleted}
+
+        return Response(
+            {
+                "deleted": [
+                    image_id for image_id in image_ids if image_id in deleted_ids
+                ],
+                "failed": failed,
+                "file_errors": [
+                    {"id": image_id, "error": file_errors[url]}
+                    for image_id, url, _ in deleted
+                    if url in file_errors
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    # ✅ 내 보호소 이미지만 한 번에 삭제 → [(id, image_url, recruitment_id)]
+    # QuerySet.delete() 는 행마다 시그널을 보내므로 DELETE ... RETURNING 으로 직접 삭제
+    def delete_images(self, shelter, image_ids):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                DELETE FROM {RecruitmentImage._meta.db_table} AS image
+                USING {Recruitment._meta.db_table} AS recruitment
+                WHERE image.recruitment_id = recruitment.id
+                  AND recruitment.shelter_id = %s
+                  AND image.id = ANY(%s)
+                RETURNING image.id, image.image_url, image.recruitment_id
+                """,
+                [shelter.id, image_ids],
+            )
+            return cursor.fetchall()
@@ -1,5 +1,4 @@
 #!/bin/bash
-poetry run python manage.py makemigrations
 poetry run python manage.py migrate
 
 poetry run python manage.py collectstatic --noinput
@@ -0,0 +1,102 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Shelter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("name", models.CharField(blank=True, max_length=255, null=True)),
+                ("address", models.CharField(blank=True, max_length=255, null=True)),
+                (
+                    "region",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("서울", "서울"),
+                            ("부산", "부산"),
+                            ("대구", "대구"),
+                            ("인천", "인천"),
+                            ("광주", "광주"),
+                            ("대전", "대전"),
+                            ("울산", "울산"),
+                            ("세종", "세종"),
+                            ("경기", "경기"),
+                            ("강원", "강원"),
+                            ("충북", "충북"),
+                            ("충남", "충남"),
+                            ("전북", "전북"),
+                            ("전남", "전남"),
+                            ("경북", "경북"),
+                            ("경남", "경남"),
+                            ("제주", "제주"),
+                        ],
+                        max_length=20,
+                        null=True,
+                    ),
+                ),
+                (
+                    "shelter_type",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("corporation", "Corporation"),
+                            ("individual", "Individual"),
+                            ("non_profit", "Non-Profit"),
+                        ],
+                        max_length=20,
+                        null=True,
+                    ),
+                ),
+                (
+                    "business_registration_number",
+                    models.CharField(blank=True, max_length=20, null=True),
+                ),
+                (
+                    "business_registration_email",
+                    models.EmailField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "contact_number",
+                    models.CharField(blank=True, max_length=20, null=True),
+                ),
+                (
+                    "business_license_file",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="shelter",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "shelters",
+            },
+        ),
+    ]
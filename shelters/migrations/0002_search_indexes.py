@@ -0,0 +1,25 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shelters", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="shelter",
+            index=models.Index(fields=["region"], name="shelters_region_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="shelter",
+            index=models.Index(
+                fields=["created_at", "id"], name="shelters_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+# 검색 벡터 채우기 (이후 변경은 shelters/signals.py 에서 갱신)
+def fill_search_vectors(apps, schema_editor):
+    Shelter = apps.get_model("shelters", "Shelter")
+    Shelter.objects.update(
+        search_vector=SearchVector("name", weight="A", config="simple")
+        + SearchVector("address", weight="B", config="simple")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shelters", "0002_search_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # 키워드 부분 일치용 trigram 인덱스 (gin_trgm_ops)
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="shelter",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(fill_search_vectors, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="shelter",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="shelters_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="shelter",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"],
+                name="shelters_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="shelter",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["address"],
+                name="shelters_address_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.7 on 2026-10-18 13:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shelters", "0004_location"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="shelter",
+            index=models.Index(
+                fields=["business_license_file"], name="shelters_license_file_idx"
+            ),
+        ),
+    ]
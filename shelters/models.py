@@ -1,3 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
 from common.models import BaseModel
@@ -50,9 +53,51 @@ class Shelter(BaseModel):
     )
     contact_number = models.CharField(max_length=20, null=True, blank=True)
     business_license_file = models.CharField(max_length=255, null=True, blank=True)
+    latitude = models.FloatField(
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-90), MaxValueValidator(90)],
+    )  # 위도
+    longitude = models.FloatField(
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-180), MaxValueValidator(180)],
+    )  # 경도
+    search_vector = SearchVectorField(null=True, editable=False)  # 키워드 검색용
 
     def __str__(self):
         return self.name if self.name else "Unnamed Shelter"
 
     class Meta:
         db_table = "shelters"
+        indexes = [
+            models.Index(fields=["region"], name="shelters_region_idx"),
+            models.Index(fields=["created_at", "id"], name="shelters_created_idx"),
+            # 파일 삭제 전 참조 확인 (common.utils.get_referenced_urls)
+            models.Index(
+                fields=["business_license_file"], name="shelters_license_file_idx"
+            ),
+            # 주변 검색 사각형(위도/경도 범위) 사전 필터
+            models.Index(
+                fields=["latitude", "longitude"], name="shelters_location_idx"
+            ),
+            GinIndex(fields=["search_vector"], name="shelters_search_vector_idx"),
+            GinIndex(
+                fields=["name"],
+                name="shelters_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+            GinIndex(
+                fields=["address"],
+                name="shelters_address_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
+
+
+# 🧀 보호소 검색 벡터 (이름 > 주소 순으로 가중치)
+# 한국어 사전이 없으므로 simple 설정으로 공백 단위 토큰화, 부분 일치는 trigram 인덱스로 보완
+def shelter_search_vector():
+    return SearchVector("name", weight="A", config="simple") + SearchVector(
+        "address", weight="B", config="simple"
+    )
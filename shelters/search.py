@@ -0,0 +1,45 @@
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import Coalesce, Greatest
+
+
+# 🧀 키워드 검색어 → tsquery (한국어 사전이 없으므로 simple 설정)
+def get_search_query(keyword):
+    return SearchQuery(keyword, config="simple", search_type="websearch")
+
+
+# 🧀 보호소 이름/주소 키워드 조건 (tsvector 일치 또는 trigram 부분 일치)
+# prefix 로 봉사활동 → 보호소 조인 경로에서도 같은 조건/점수 사용
+def shelter_keyword_q(keyword, prefix=""):
+    return (
+        Q(**{f"{prefix}search_vector": get_search_query(keyword)})
+        | Q(**{f"{prefix}name__trigram_word_similar": keyword})
+        | Q(**{f"{prefix}address__trigram_word_similar": keyword})
+    )
+
+
+def shelter_keyword_rank(keyword, prefix=""):
+    return Coalesce(
+        SearchRank(F(f"{prefix}search_vector"), get_search_query(keyword)),
+        Value(0.0),
+        output_field=FloatField(),
+    ) + Coalesce(
+        Greatest(
+            TrigramWordSimilarity(keyword, f"{prefix}name"),
+            TrigramWordSimilarity(keyword, f"{prefix}address"),
+        ),
+        Value(0.0),
+        output_field=FloatField(),
+    )
+
+
+def filter_shelters_by_keyword(queryset, keyword):
+    return (
+        queryset.filter(shelter_keyword_q(keyword))
+        .annotate(search_rank=shelter_keyword_rank(keyword))
+        .order_by("-search_rank", "id")
+    )
@@ -21,6 +21,8 @@ class ShelterSerializer(serializers.ModelSerializer):
             "business_registration_email",
             "contact_number",
             "business_license_file",
+            "latitude",
+            "longitude",
             "owner_name",
         ]
 
@@ -38,6 +40,8 @@ class ShelterCreateUpdateSerializer(serializers.ModelSerializer):
             "business_registration_email",
             "contact_number",
             "business_license_file",
+            "latitude",
+            "longitude",
         ]
 
     # ✅ Shelter 생성 → user 연결해서 생성
@@ -70,3 +74,11 @@ class ShelterBusinessLicenseSerializer(serializers.ModelSerializer):
 )
 class ShelterBusinessLicenseUploadSerializer(serializers.Serializer):
     business_license = serializers.FileField()
+
+
+# ✅ 주변 보호소 시리얼라이저 (거리 포함)
+class ShelterNearbySerializer(ShelterSerializer):
+    distance = serializers.FloatField(read_only=True)  # km
+
+    class Meta(ShelterSerializer.Meta):
+        fields = ShelterSerializer.Meta.fields + ["distance"]
@@ -0,0 +1,58 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from common.searchcache import bump_generations
+from users.models import User
+
+from .models import Shelter, shelter_search_vector
+
+SEARCH_VECTOR_FIELDS = {"name", "address"}
+
+
+# 🧀 보호소 변경 → 변경 전/후 지역의 검색 캐시 무효화
+# 커밋 전에 세대를 올리면 아직 커밋되지 않은 이전 상태가 새 세대로 캐시될 수 있으므로 커밋 후에 무효화
+def invalidate_search_on_commit(*regions):
+    transaction.on_commit(partial(bump_generations, *regions))
+
+
+@receiver(pre_save, sender=Shelter)
+def remember_shelter_region(sender, instance, **kwargs):
+    instance._previous_region = (
+        Shelter.objects.filter(pk=instance.pk).values_list("region", flat=True).first()
+        if instance.pk
+        else None
+    )
+
+
+# 🧀 보호소 이름/주소 변경 → 검색 벡터 갱신
+@receiver(post_save, sender=Shelter)
+def update_shelter_search_vector(sender, instance, update_fields=None, **kwargs):
+    if update_fields and not SEARCH_VECTOR_FIELDS & set(update_fields):
+        return
+    Shelter.objects.filter(pk=instance.pk).update(search_vector=shelter_search_vector())
+
+
+@receiver(post_save, sender=Shelter)
+def invalidate_shelter_search(sender, instance, **kwargs):
+    invalidate_search_on_commit(
+        instance.region, getattr(instance, "_previous_region", None)
+    )
+
+
+@receiver(post_delete, sender=Shelter)
+def invalidate_deleted_shelter_search(sender, instance, **kwargs):
+    invalidate_search_on_commit(instance.region)
+
+
+# 🧀 보호소 관리자 정보(이름, 연락처)도 보호소 검색 결과에 포함됨
+@receiver(post_save, sender=User)
+def invalidate_shelter_owner_search(sender, instance, update_fields=None, **kwargs):
+    if not instance.is_shelter or update_fields == frozenset({"last_login"}):
+        return
+    region = (
+        Shelter.objects.filter(user=instance).values_list("region", flat=True).first()
+    )
+    invalidate_search_on_commit(region)
@@ -5,6 +5,7 @@ from .views import (
     ShelterBusinessLicenseView,
     ShelterDetailView,
     ShelterListView,
+    ShelterNearbyView,
     ShelterSearchView,
 )
 
@@ -13,6 +14,8 @@ urlpatterns = [
     path("", ShelterListView.as_view(), name="shelter-list"),
     # 🧀 보호소 검색 (GET)
     path("search/", ShelterSearchView.as_view(), name="shelter-search"),
+    # 🧀 주변 보호소 검색 (GET)
+    path("nearby/", ShelterNearbyView.as_view(), name="shelter-nearby"),
     # 🧀 보호소 상세 조회 (GET)
     path("<int:pk>/", ShelterDetailView.as_view(), name="shelter-detail"),
     # 🧀 보호소 정보 조회 및 수정(GET,PATCH)
@@ -1,4 +1,4 @@
-from django.db.models import Q
+from django.db.models import Count, Max, Q
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
@@ -7,16 +7,33 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from common.utils import delete_file_from_s3, upload_file_to_s3, validate_file_extension
+from common.conditional import (
+    get_collection_etag,
+    get_not_modified_response,
+    get_validators,
+    set_validators,
+)
+from common.geo import filter_within_radius, parse_location_params
+from common.pagination import KEYSET_PAGINATION_PARAMETERS, KeysetPagination
+from common.searchcache import SearchCache
+from common.uploads import store_uploaded_file, use_streaming_upload
+from common.utils import delete_file_from_s3, validate_file_extension
 
 from .models import Shelter
+from .search import filter_shelters_by_keyword
 from .serializers import (
     ShelterBusinessLicenseSerializer,
     ShelterBusinessLicenseUploadSerializer,
     ShelterCreateUpdateSerializer,
+    ShelterNearbySerializer,
     ShelterSerializer,
 )
 
+# 🧀 보호소 검색 결과 캐시
+shelter_search_cache = SearchCache(
+    "shelters", date_params=("date",), time_params=("time",), other_params=("q",)
+)
+
 
 @extend_schema(
     summary="보호소 검색",
@@ -30,16 +47,34 @@ from .serializers import (
         OpenApiParameter(
             name="time", type=str, location=OpenApiParameter.QUERY, required=False
         ),
+        OpenApiParameter(
+            name="q",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="키워드 (보호소 이름, 주소), 관련도 순 정렬",
+        ),
     ],
     responses={200: ShelterSerializer(many=True)},
 )
 class ShelterSearchView(APIView):
+    query_budget = {"get": 2}
+
     def get(self, request):
+        # 같은 검색 조건은 캐시된 응답 반환 (보호소/봉사활동 변경 시 지역별로 무효화)
+        cache_key = shelter_search_cache.get_key(request.query_params)
+        response = shelter_search_cache.get(cache_key)
+        if response is None:
+            response = shelter_search_cache.set(cache_key, self.search(request))
+        return response
+
+    def search(self, request):
         region = request.query_params.get("region")
         date = request.query_params.get("date")
         time = request.query_params.get("time")
+        keyword = (request.query_params.get("q") or "").strip()
 
-        queryset = Shelter.objects.all()
+        queryset = Shelter.objects.select_related("user")
 
         if region:
             queryset = queryset.filter(region=region)
@@ -53,34 +88,113 @@ class ShelterSearchView(APIView):
                 & Q(recruitments__end_time__gte=time)
             ).distinct()
 
-        if not queryset.exists():
+        if keyword:
+            queryset = filter_shelters_by_keyword(queryset, keyword)
+
+        shelters = list(queryset)
+        if not shelters:
             return Response(
                 {"error": "해당 조건에 맞는 보호소를 찾을 수 없습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = ShelterSerializer(queryset, many=True)
+        serializer = ShelterSerializer(shelters, many=True)
         return Response({"shelters": serializer.data}, status=status.HTTP_200_OK)
 
 
 @extend_schema(
-    summary="보호소 전체 목록 조회", responses={200: ShelterSerializer(many=True)}
+    summary="주변 보호소 검색",
+    description="지정한 위치에서 반경 내 보호소를 가까운 순으로 조회합니다.",
+    parameters=[
+        OpenApiParameter(
+            name="lat", type=float, location=OpenApiParameter.QUERY, required=True
+        ),
+        OpenApiParameter(
+            name="lng", type=float, location=OpenApiParameter.QUERY, required=True
+        ),
+        OpenApiParameter(
+            name="radius",
+            type=float,
+            location=OpenApiParameter.QUERY,
+            required=False,
+            description="검색 반경 km (기본 5, 최대 50)",
+        ),
+        *KEYSET_PAGINATION_PARAMETERS,
+    ],
+    responses={200: ShelterNearbySerializer(many=True)},
+)
+class ShelterNearbyView(APIView):
+    permission_classes = [AllowAny]
+    query_budget = {"get": 2}
+
+    def get(self, request):
+        location, error = parse_location_params(request.query_params)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = filter_within_radius(
+            Shelter.objects.select_related("user"), *location
+        )
+        paginator = KeysetPagination(ordering=("distance", "id"))
+        page = paginator.paginate_queryset(queryset, request)
+        serializer = ShelterNearbySerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data, "shelters")
+
+
+@extend_schema(
+    summary="보호소 전체 목록 조회",
+    parameters=KEYSET_PAGINATION_PARAMETERS,
+    responses={200: ShelterSerializer(many=True)},
 )
 class ShelterListView(APIView):
     permission_classes = [AllowAny]
+    query_budget = {"get": 3}  # JWT 가 있으면 사용자 조회 1개 포함
 
     def get(self, request):
-        queryset = Shelter.objects.all()
-        serializer = ShelterSerializer(queryset, many=True)
-        return Response({"shelters": serializer.data}, status=status.HTTP_200_OK)
+        queryset = Shelter.objects.select_related("user")
+
+        # 보호소 관리자 이름/연락처도 응답에 포함되므로 users.updated_at 까지 검증값에 반영
+        summary = queryset.aggregate(
+            last_modified=Max("updated_at"),
+            owner_modified=Max("user__updated_at"),
+            count=Count("id"),
+        )
+        etag = get_collection_etag(
+            request,
+            max(
+                filter(None, [summary["last_modified"], summary["owner_modified"]]),
+                default=None,
+            ),
+            summary["count"],
+        )
+        not_modified = get_not_modified_response(request, etag)
+        if not_modified:
+            return not_modified
+
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(queryset, request)
+        serializer = ShelterSerializer(page, many=True)
+        response = paginator.get_paginated_response(serializer.data, "shelters")
+        return set_validators(response, etag)
 
 
 @extend_schema(summary="보호소 상세 조회", responses={200: ShelterSerializer})
 class ShelterDetailView(APIView):
+    query_budget = {"get": 2}
+
     def get(self, request, pk):
-        instance = get_object_or_404(Shelter, pk=pk)
+        instance = get_object_or_404(Shelter.objects.select_related("user"), pk=pk)
+
+        etag, last_modified = get_validators(
+            request, max(instance.updated_at, instance.user.updated_at)
+        )
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified:
+            return not_modified
+
         serializer = ShelterSerializer(instance)
-        return Response({"shelter": serializer.data}, status=status.HTTP_200_OK)
+        response = Response({"shelter": serializer.data}, status=status.HTTP_200_OK)
+        return set_validators(response, etag, last_modified)
 
 
 @extend_schema(summary="보호소 정보 조회", responses={200: ShelterSerializer})
@@ -129,12 +243,8 @@ class ShelterBusinessLicenseView(APIView):
         responses={201: ShelterBusinessLicenseSerializer(many=True)},
     )
     def post(self, request):
-        serializer = ShelterBusinessLicenseUploadSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        file = serializer.validated_data["business_license"]
-        user = request.user
-        shelter = Shelter.objects.filter(user=user).first()
+        # 본문을 읽기 전에 보호소 확인 (권한이 없으면 파일을 받지 않음)
+        shelter = Shelter.objects.filter(user=request.user).first()
 
         if not shelter:
             return Response(
@@ -142,6 +252,17 @@ class ShelterBusinessLicenseView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
+        # 파일은 받는 즉시 저장소로 스트리밍 (검증 실패 시 handler.error)
+        handler = use_streaming_upload(request, "business_license", "shelters")
+        serializer = ShelterBusinessLicenseUploadSerializer(data=request.data)
+        if handler.error:
+            return Response(
+                {"error": handler.error}, status=status.HTTP_400_BAD_REQUEST
+            )
+        serializer.is_valid(raise_exception=True)
+
+        file = serializer.validated_data["business_license"]
+
         if not file:
             return Response(
                 {"error": "파일을 업로드해야 합니다."},
@@ -150,14 +271,14 @@ class ShelterBusinessLicenseView(APIView):
 
         try:
             validate_file_extension(file, "shelters")  # 파일 검증
-            file_url = upload_file_to_s3(file, "shelters", shelter.id)  # S3 업로드
-
-            # 기존 파일 삭제 후 새로운 파일 저장
-            if shelter.business_license_file:
-                delete_file_from_s3(shelter.business_license_file)
+            file_url = store_uploaded_file(file, "shelters")  # S3 업로드
 
+            # 새로운 파일 저장 후 기존 파일 삭제
+            previous = shelter.business_license_file
             shelter.business_license_file = file_url
             shelter.save()
+            if previous:
+                delete_file_from_s3(previous)
 
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -205,9 +326,10 @@ class ShelterBusinessLicenseView(APIView):
             )
 
         try:
-            delete_file_from_s3(shelter.business_license_file)
+            previous = shelter.business_license_file
             shelter.business_license_file = None
             shelter.save()
+            delete_file_from_s3(previous)
             return Response(
                 {"message": "사업자등록증이 삭제되었습니다."},
                 status=status.HTTP_204_NO_CONTENT,
@@ -61,3 +61,7 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
 
     class Meta:
         db_table = "users"
+        indexes = [
+            # 파일 삭제 전 참조 확인 (common.utils.get_referenced_urls)
+            models.Index(fields=["profile_image"], name="users_profile_image_idx"),
+        ]
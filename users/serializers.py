@@ -5,6 +5,7 @@ from django.contrib.auth.password_validation import validate_password
 from drf_spectacular.utils import OpenApiExample, extend_schema_serializer
 from rest_framework import serializers
 
+from common.serializers import ImageVariantField
 from common.utils import upload_file_to_s3
 from shelters.models import Shelter
 
@@ -211,9 +212,18 @@ class ChangePasswordSerializer(serializers.Serializer):
 
 # 🍒사용자 정보 조회
 class UserSerializer(serializers.ModelSerializer):
+    profile_image_thumbnail = ImageVariantField("thumbnail", source="profile_image")
+
     class Meta:
         model = User
-        fields = ["id", "email", "name", "contact_number", "profile_image"]
+        fields = [
+            "id",
+            "email",
+            "name",
+            "contact_number",
+            "profile_image",
+            "profile_image_thumbnail",
+        ]
 
 
 # # 🍒사용자 정보 수정 (현재 사용x)
@@ -247,9 +257,17 @@ class UserDeleteSerializer(serializers.Serializer):
 
 
 class UserProfileImageSerializer(serializers.ModelSerializer):
+    profile_image_thumbnail = ImageVariantField("thumbnail", source="profile_image")
+    profile_image_medium = ImageVariantField("medium", source="profile_image")
+
     class Meta:
         model = User
-        fields = ["id", "profile_image"]
+        fields = [
+            "id",
+            "profile_image",
+            "profile_image_thumbnail",
+            "profile_image_medium",
+        ]
 
 
 @extend_schema_serializer(
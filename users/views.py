@@ -18,6 +18,7 @@ from rest_framework_simplejwt.tokens import (
     RefreshToken,
 )
 
+from common.uploads import store_uploaded_file, use_streaming_upload
 from common.utils import delete_file_from_s3, upload_file_to_s3, validate_file_extension
 from shelters.models import Shelter
 
@@ -263,8 +264,16 @@ class ShelterSignupView(APIView):
         },
     )
     def post(self, request):
+        # 사업자등록증은 받는 즉시 저장소로 스트리밍 (검증 실패 시 handler.error)
+        handler = use_streaming_upload(request, "business_license_file", "shelters")
+
         # ShelterSignupSerializer에 요청 데이터 넘기기
         serializer = ShelterSignupSerializer(data=request.data)
+        if handler.error:
+            return Response(
+                {"business_license_file": [handler.error]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         if serializer.is_valid():
             # 비밀번호 해싱과 검증이 완료된 validated_data로 User와 Shelter 인스턴스를 생성
@@ -281,8 +290,8 @@ class ShelterSignupView(APIView):
             # 사업자등록증 파일 처리
             business_license_file = request.FILES.get("business_license_file", None)
             if business_license_file:
-                # 파일을 S3에 업로드하고 URL 반환
-                file_url = upload_file_to_s3(business_license_file, "shelters")
+                # 파일을 S3에 업로드하고 URL 반환 (스트리밍으로 이미 올라갔으면 URL 만)
+                file_url = store_uploaded_file(business_license_file, "shelters")
             else:
                 file_url = None
 
@@ -307,6 +316,8 @@ class ShelterSignupView(APIView):
                 status=status.HTTP_201_CREATED,
             )
 
+        # 가입 실패 시 미리 올라간 사업자등록증은 내용 기반 키라 바로 삭제하지 않음
+        # (참조 없이 유예 시간이 지나면 고아 파일 정리 명령이 삭제)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -830,11 +841,7 @@ class ProfileImageUploadDeleteView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # 기존 이미지 삭제
-            if user.profile_image:
-                delete_file_from_s3(user.profile_image)
-                user.profile_image = None
-                user.save()
+            previous = user.profile_image
 
             # 파일 검증 및 업로드
             try:
@@ -846,9 +853,11 @@ class ProfileImageUploadDeleteView(APIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # 새 이미지 저장
+            # 새 이미지 저장 후 기존 이미지 삭제 (같은 파일이면 키가 같으므로 유지)
             user.profile_image = s3_url
             user.save()
+            if previous:
+                delete_file_from_s3(previous)
 
             return Response(
                 UserProfileImageSerializer(user).data, status=status.HTTP_201_CREATED
@@ -880,9 +889,10 @@ class ProfileImageUploadDeleteView(APIView):
             )
 
         try:
-            delete_file_from_s3(user.profile_image)
+            previous = user.profile_image
             user.profile_image = None
             user.save()
+            delete_file_from_s3(previous)
             return Response(
                 {"message": "이미지 삭제가 완료되었습니다."},
                 status=status.HTTP_204_NO_CONTENT,